@@ -0,0 +1,133 @@
+import hashlib
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from matrix_gui.core.class_lib.feed.feed_formatter import normalize_level
+
+
+class AlertAggregator:
+    """
+    Folds repeated swarm_feed.alert payloads into counted summaries.
+
+    Alerts are keyed by (origin, level, id or md5(msg)). The first alert for
+    a key passes straight through; repeats arriving within `ttl` seconds of
+    the previous one only bump its counter. flush() then emits one summary
+    per key that gained repeats ("×N since hh:mm" on the feed). A key
+    expires `ttl` seconds after its last repeat, and at most `max_keys`
+    keys are held (least recently seen evicted first, its pending repeats
+    still reported).
+
+    Every payload that leaves carries content["aggregate"]:
+        {"key": str, "count": total so far, "since": first seen (epoch),
+         "repeats": repeats folded into this payload (0 for the first one)}
+
+    Runs in the session process so a flood costs one pipe message per key
+    per flush, and again in the cockpit for alerts that were not aggregated
+    at the source. offer() is called from the verify-stage worker threads
+    while flush() runs on the GUI timer, so all state is behind one lock.
+    """
+    default_ttl = float(os.getenv("MATRIX_ALERT_TTL", "10"))
+    default_max_keys = int(os.getenv("MATRIX_ALERT_KEYS", "512"))
+
+    def __init__(self, ttl: float = None, max_keys: int = None):
+        self.ttl = self.default_ttl if ttl is None else float(ttl)
+        self.max_keys = max(1, self.default_max_keys if max_keys is None else int(max_keys))
+        self._entries = OrderedDict()   # key → {"payload", "count", "reported", "first", "last"}, oldest first
+        self._outbox = []               # summaries of keys that expired/were evicted with repeats pending
+        self.groups = Counter()         # (origin, level) → alerts seen, repeats included
+        self.stats = {"passed": 0, "folded": 0, "summaries": 0, "evicted": 0}
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    @staticmethod
+    def key_of(payload: dict):
+        """
+        Returns:
+            tuple | None: (origin, level, fingerprint), or None if the alert has no message.
+        """
+        content = payload.get("content", {}) or {}
+        msg = content.get("formatted_msg") or content.get("msg") or ""
+        if not msg:
+            return None
+        level = normalize_level(content.get("level", "INFO"))
+        origin = content.get("origin", "unknown")
+        return origin, level, content.get("id") or hashlib.md5(msg.encode()).hexdigest()
+
+    def offer(self, payload: dict, now: float = None):
+        """
+        Take one alert.
+
+        Returns:
+            dict | None: The payload to forward (tagged with its aggregate), or
+                         None if it was folded into an earlier one.
+        """
+        key = self.key_of(payload)
+        if key is None:
+            return payload
+        now = now or time.time()
+        with self._lock:
+            return self._offer(key, payload, now)
+
+    def _offer(self, key, payload, now):
+        self.groups[key[:2]] += 1
+
+        entry = self._entries.get(key)
+        if entry and now - entry["last"] < self.ttl:
+            entry["count"] += 1
+            entry["last"] = now
+            entry["payload"] = payload
+            self._entries.move_to_end(key)
+            self.stats["folded"] += 1
+            return None
+
+        if entry:
+            self._report(key, entry)  # expired with repeats pending: report them before restarting
+        self._entries[key] = {"payload": payload, "count": 1, "reported": 1, "first": now, "last": now}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_keys:
+            old_key, old = self._entries.popitem(last=False)
+            self._report(old_key, old)
+            self.stats["evicted"] += 1
+
+        self.stats["passed"] += 1
+        return self._tag(key, payload, count=1, since=now, repeats=0)
+
+    def flush(self, now: float = None) -> list:
+        """
+        Summaries for every key that gained repeats since the last flush;
+        also expires idle keys. Call periodically (about once a second).
+
+        Returns:
+            list: Tagged payloads, one per key.
+        """
+        now = now or time.time()
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                self._report(key, entry)
+                if now - entry["last"] >= self.ttl:
+                    del self._entries[key]
+
+            out, self._outbox = self._outbox, []
+            self.stats["summaries"] += len(out)
+        return out
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    # -----------------------------
+    def _report(self, key, entry):
+        repeats = entry["count"] - entry["reported"]
+        if repeats <= 0:
+            return
+        entry["reported"] = entry["count"]
+        self._outbox.append(
+            self._tag(key, entry["payload"], count=entry["count"], since=entry["first"], repeats=repeats)
+        )
+
+    @staticmethod
+    def _tag(key, payload, **aggregate):
+        content = dict(payload.get("content", {}) or {})
+        content["aggregate"] = {"key": "|".join(map(str, key)), **aggregate}
+        return {**payload, "content": content}
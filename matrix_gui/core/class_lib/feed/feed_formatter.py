@@ -1,4 +1,16 @@
 import time
+
+LEVEL_ALIASES = {
+    "WARNING": "WARN", "CRIT": "CRITICAL", "SEVERE": "CRITICAL",
+    "FATAL": "EMERGENCY", "EMERG": "EMERGENCY",
+}
+
+
+def normalize_level(level) -> str:
+    level = str(level or "INFO").upper()
+    return LEVEL_ALIASES.get(level, level)
+
+
 class FeedFormatter:
     ICONS = {
         "info": "📰",
@@ -24,11 +36,19 @@ class FeedFormatter:
             event = {}
         event.update(kwargs)
 
+        level = event.get("level", "INFO").upper()
+        color = FeedFormatter.COLORS.get(level.upper(), "#aaa")
+
+        # Wrap with HTML span for color
+        return f"<span style='color:{color};'>{FeedFormatter.text(event)}</span>"
+
+    @staticmethod
+    def text(event: dict) -> str:
+        """The same feed line as format(), as plain text."""
         ts = event.get("timestamp", time.strftime("%Y-%m-%d %H:%M:%S"))
         level = event.get("level", "INFO").upper()
         etype = event.get("event_type", "info").lower()
         icon = FeedFormatter.ICONS.get(etype.lower(), "❓")
-        color = FeedFormatter.COLORS.get(level.upper(), "#aaa")
 
         agent = event.get("agent", "?")
         status = event.get("status", "n/a")
@@ -54,6 +74,4 @@ class FeedFormatter:
             parts.append(f":: {details}")
         if trace:
             parts.append(f"(trace={trace})")
-
-        # Wrap with HTML span for color
-        return f"<span style='color:{color};'>{' '.join(parts)}</span>"
+        return " ".join(parts)
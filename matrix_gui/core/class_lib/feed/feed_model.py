@@ -0,0 +1,240 @@
+import json
+import os
+import time
+from collections import Counter
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, QRect, Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from matrix_gui.core.class_lib.feed.feed_formatter import FeedFormatter, normalize_level
+
+FEED_SCROLLBACK = int(os.getenv("MATRIX_FEED_SCROLLBACK", "5000"))
+
+LEVEL_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def feed_entry(kind: str, level="INFO", deployment="unknown", session_id="unknown", agent="?", **fields) -> dict:
+    """
+    Build a structured feed entry.
+
+    Args:
+        kind (str): "event" (rendered with FeedFormatter from fields["event"])
+                    or "inbound" (channel/source/payload, shown as a snippet).
+        level, deployment, session_id, agent: What the feed filters on.
+        **fields: The rest of what the row needs to render itself later.
+    """
+    return {
+        "kind": kind,
+        "level": normalize_level(level),
+        "deployment": deployment or "unknown",
+        "session_id": session_id or "unknown",
+        "agent": agent or "?",
+        "ts": time.time(),
+        **fields,
+    }
+
+
+def entry_text(entry: dict) -> str:
+    """Render an entry's line; done on first paint and cached on the entry."""
+    text = entry.get("text")
+    if text is None:
+        if entry["kind"] == "inbound":
+            t = time.strftime("%H:%M:%S", time.localtime(entry.get("ts_msg", entry["ts"])))
+            payload = entry.get("payload") or {}
+            body = payload.get("content", payload) if isinstance(payload, dict) else payload
+            snippet = json.dumps(body, separators=(",", ":"), default=str)[:160]
+            text = f"[{t}] ({entry.get('channel')}) {entry.get('source')} » sess={entry['session_id']} :: {snippet}"
+            entry.pop("payload", None)  # the snippet is all the feed ever shows
+        else:
+            event = entry.get("event", {})
+            if "timestamp" not in event:  # stamp with arrival time, not first paint
+                event = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["ts"])), **event}
+            text = FeedFormatter.text(event)
+        entry["text"] = text
+    return text
+
+
+class FeedModel(QAbstractListModel):
+    """
+    Fixed-size ring of structured swarm feed entries.
+
+    Entries are plain dicts (see feed_entry), not HTML; the line shown for a
+    row is only built when a view first paints it. Once `capacity` entries
+    are held the oldest fall off. `counts` keeps a running total per level
+    for everything ever appended.
+
+    An entry with a "merge_key" (an aggregated alert) replaces the row that
+    already holds that key, if it is still in the ring, instead of adding one.
+    """
+    deployment_seen = pyqtSignal(str)
+    counts_changed = pyqtSignal(dict)
+
+    def __init__(self, capacity: int = None, parent=None):
+        super().__init__(parent)
+        self.capacity = max(1, capacity or FEED_SCROLLBACK)
+        self._slots = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.dropped = 0
+        self.counts = Counter()
+        self.deployments = set()
+        self._next_seq = 0   # seq of the next appended entry; row = seq - seq of row 0
+        self._keyed = {}     # merge_key → entry still in the ring
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def entry(self, row: int) -> dict:
+        return self._slots[(self._start + row) % self.capacity]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._count:
+            return None
+        entry = self.entry(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry_text(entry)
+        if role == LEVEL_ROLE:
+            return entry["level"]
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    # -----------------------------
+    def append_entries(self, entries: list):
+        """Append a batch with one insert (plus one eviction) notification."""
+        fresh, fresh_keys, changed = [], {}, []
+        for e in entries:
+            if not e:
+                continue
+            self.counts[e["level"]] += e.get("repeats") or 1
+            if e["deployment"] not in self.deployments:
+                self.deployments.add(e["deployment"])
+                self.deployment_seen.emit(e["deployment"])
+
+            key = e.get("merge_key")
+            if key in fresh_keys:
+                fresh_keys[key].update(e)
+                fresh_keys[key].pop("text", None)
+            elif key in self._keyed:
+                held = self._keyed[key]
+                held.update(e)
+                held.pop("text", None)
+                changed.append(held["seq"] - (self._next_seq - self._count))
+            else:
+                fresh.append(e)
+                if key is not None:
+                    fresh_keys[key] = e
+
+        for row in changed:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        if fresh:
+            self._insert(fresh)
+        self.counts_changed.emit(dict(self.counts))
+
+    def _insert(self, entries):
+        for e in entries:
+            e["seq"] = self._next_seq
+            self._next_seq += 1
+            if e.get("merge_key") is not None:
+                self._keyed[e["merge_key"]] = e
+
+        if len(entries) >= self.capacity:
+            self.dropped += self._count + len(entries) - self.capacity
+            self.beginResetModel()
+            for row in range(self._count):
+                self._forget(self.entry(row))
+            for e in entries[:-self.capacity]:
+                self._forget(e)
+            self._slots = list(entries[-self.capacity:])
+            self._start, self._count = 0, self.capacity
+            self.endResetModel()
+        else:
+            overflow = self._count + len(entries) - self.capacity
+            if overflow > 0:
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                for _ in range(overflow):
+                    self._forget(self._slots[self._start])
+                    self._slots[self._start] = None
+                    self._start = (self._start + 1) % self.capacity
+                self._count -= overflow
+                self.dropped += overflow
+                self.endRemoveRows()
+
+            first = self._count
+            self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+            for e in entries:
+                self._slots[(self._start + self._count) % self.capacity] = e
+                self._count += 1
+            self.endInsertRows()
+
+    def _forget(self, entry):
+        key = entry.get("merge_key")
+        if key is not None and self._keyed.get(key) is entry:
+            del self._keyed[key]
+
+    def clear(self):
+        self.beginResetModel()
+        self._slots = [None] * self.capacity
+        self._start = self._count = 0
+        self._keyed.clear()
+        self.endResetModel()
+
+
+class FeedFilterProxy(QSortFilterProxyModel):
+    """Level / deployment / agent filter over a FeedModel; None means "any"."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.level = None
+        self.deployment = None
+        self.agent = ""
+
+    def set_filters(self, level=None, deployment=None, agent=""):
+        self.level = level or None
+        self.deployment = deployment or None
+        self.agent = (agent or "").strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.level is None and self.deployment is None and not self.agent:
+            return True
+        entry = self.sourceModel().entry(source_row)
+        if self.level is not None and entry["level"] != self.level:
+            return False
+        if self.deployment is not None and entry["deployment"] != self.deployment:
+            return False
+        if self.agent and self.agent not in str(entry["agent"]).lower():
+            return False
+        return True
+
+
+class FeedDelegate(QStyledItemDelegate):
+    """Paints a feed row as a level colour bar plus one elided line of coloured text."""
+    BAR_WIDTH = 4
+    _colors = None
+
+    @classmethod
+    def color(cls, level: str) -> QColor:
+        if cls._colors is None:
+            cls._colors = {lvl: QColor(name) for lvl, name in FeedFormatter.COLORS.items()}
+            cls._colors[None] = QColor("#aaa")
+        return cls._colors.get(level, cls._colors[None])
+
+    def paint(self, painter, option, index):
+        painter.save()
+        try:
+            if option.state & QStyle.StateFlag.State_Selected:
+                painter.fillRect(option.rect, option.palette.highlight())
+
+            color = self.color(index.data(LEVEL_ROLE))
+            rect = option.rect
+            painter.fillRect(QRect(rect.left(), rect.top(), self.BAR_WIDTH, rect.height()), color)
+
+            text_rect = rect.adjusted(self.BAR_WIDTH + 4, 0, -2, 0)
+            text = option.fontMetrics.elidedText(
+                index.data(Qt.ItemDataRole.DisplayRole) or "", Qt.TextElideMode.ElideRight, text_rect.width()
+            )
+            painter.setPen(color)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        finally:
+            painter.restore()
@@ -8,14 +8,12 @@ from matrix_gui.core.class_lib.packet_delivery.utility.encryption.utility.interf
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 from Crypto.Cipher import AES
-from Crypto.PublicKey import RSA as CryptoRSA
 from Crypto.Cipher import PKCS1_OAEP
-from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
 from core.python_core.mixin.log_method import LogMixin
 from matrix_gui.core.class_lib.packet_delivery.utility.crypto_processors.identity import IdentityObject
 from matrix_gui.core.class_lib.packet_delivery.utility.crypto_processors.identity_manager import IdentityManager
 from core.python_core.utils.crypto_utils import generate_aes_key
+from matrix_gui.core.utils.signing_suites import import_signing_key, verify_bytes
 
 class Football(LogMixin):
     """Manages the cryptographic context for sending and receiving packets.
@@ -146,7 +144,7 @@ class Football(LogMixin):
     def set_payload_signing_key(self, priv:str):
         self.set_sign_payload(True)
         try:
-            CryptoRSA.import_key(priv)
+            import_signing_key(priv)  # RSA or Ed25519
             self._payload_signing_key = priv
         except Exception as e:
             self.log("Failed to set payload_siging_key", error=e, block="PERSONAL_IDENTITY", level="ERROR")
@@ -219,10 +217,13 @@ class Football(LogMixin):
                 private_key_pem = vault.get("priv").strip()
 
                 #pub_pem = identity["pub"].encode("utf-8")
-                priv_key = CryptoRSA.import_key(private_key_pem)
+                priv_key = import_signing_key(private_key_pem)
 
                 # Step 1: Verify that priv_key corresponds to pub_key in identity
-                derived_pub = priv_key.publickey().export_key().decode().strip()
+                derived_pub = priv_key.public_key().export_key(format="PEM")
+                if isinstance(derived_pub, bytes):
+                    derived_pub = derived_pub.decode()
+                derived_pub = derived_pub.strip()
                 if derived_pub != identity["pub"].strip():
                     raise ValueError("Private key does not match identity pubkey.")
 
@@ -408,18 +409,17 @@ class Football(LogMixin):
             if not sig_pubkey:
                 raise ValueError("Verifier key not set")
 
-            # Convert cryptography public key to PEM format, then to pycryptodome RSA key
+            # Convert cryptography public key to PEM format, then to a pycryptodome RSA/Ed25519 key
             pem_bytes = sig_pubkey.public_bytes(
                 encoding=serialization.Encoding.PEM,
                 format=serialization.PublicFormat.SubjectPublicKeyInfo
             )
-            rsa_key = CryptoRSA.import_key(pem_bytes)
+            verifier_key = import_signing_key(pem_bytes)
 
             signature = base64.b64decode(signature_b64)
             payload_bytes = payload.get_payload()
-            digest = SHA256.new(payload_bytes)
 
-            pkcs1_15.new(rsa_key).verify(digest, signature)
+            verify_bytes(verifier_key, payload_bytes, signature)
 
             self.log("Signature verified successfully", block="BL_VERIFY", level="INFO")
 
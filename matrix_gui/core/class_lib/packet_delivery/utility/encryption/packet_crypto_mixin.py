@@ -6,10 +6,9 @@ from core.python_core.mixin.log_method import LogMixin
 from Crypto.Cipher import AES
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_OAEP
-from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
 from Crypto.Random import get_random_bytes
 from core.python_core.utils.debug.config import DebugConfig
+from matrix_gui.core.utils.signing_suites import import_signing_key, sign_bytes, verify_bytes
 from matrix_gui.core.class_lib.packet_delivery.utility.encryption.utility.sig_payload_json import SigPayloadJson
 from matrix_gui.core.class_lib.packet_delivery.utility.encryption.utility.interfaces.sig_payload import SigPayload
 
@@ -72,7 +71,7 @@ class PacketCryptoMixin(LogMixin):
                 sp = SigPayloadJson()
                 sp.set_payload(subpacket)
 
-                signer_key = RSA.import_key(self.football.get_payload_signing_key())
+                signer_key = import_signing_key(self.football.get_payload_signing_key())
                 packet["sig"] = self.sign_payload(sp, signer_key)
 
             # Step 4: Encrypt final packet with AES key
@@ -383,12 +382,12 @@ class PacketCryptoMixin(LogMixin):
 
     def sign_payload(self, payload: SigPayload, private_key) -> str:
         """
-        Sign a JSON payload with a private key using PKCS1 v1.5 and SHA256.
+        Sign a JSON payload with a private key. The key picks the suite:
+        RSA signs with PKCS1 v1.5 and SHA256, Ed25519 with pure EdDSA.
         Returns a base64-encoded signature.
         """
         payload_bytes = payload.get_payload()
-        digest = SHA256.new(payload_bytes)
-        signature = pkcs1_15.new(private_key).sign(digest)
+        signature = sign_bytes(private_key, payload_bytes)
         return base64.b64encode(signature).decode()
 
     def verify_payload(self, payload: SigPayload, public_key, signature_b64: str) -> bool:
@@ -398,15 +397,14 @@ class PacketCryptoMixin(LogMixin):
         """
         try:
 
-            rsa_key = RSA.import_key(public_key.encode())
+            verifier_key = import_signing_key(public_key)
 
-            if not rsa_key:
+            if not verifier_key:
                 raise ValueError("Verifier key not set")
 
             signature = base64.b64decode(signature_b64)
             payload_bytes = payload.get_payload()
-            digest = SHA256.new(payload_bytes)
-            pkcs1_15.new(rsa_key).verify(digest, signature)
+            verify_bytes(verifier_key, payload_bytes, signature)
             if self.debug.is_enabled():
                 self.log("Signature verified successfully", block="BL_VERIFY", level="INFO")
 
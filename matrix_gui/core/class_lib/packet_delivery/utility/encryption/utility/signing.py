@@ -1,14 +1,21 @@
 import json
 import base64
 import rsa
+from functools import lru_cache
+
+@lru_cache(maxsize=64)
+def _load_privkey(pem_str: str) -> rsa.PrivateKey:
+    # the same few keys sign every packet; parse each PEM once
+    return rsa.PrivateKey.load_pkcs1(pem_str.encode())
 
 def sign_packet(privkey_pem: str, handler: str, timestamp: float, content: dict) -> str:
     data = json.dumps({"handler": handler, "timestamp": timestamp, "content": content}, sort_keys=True).encode()
-    priv = rsa.PrivateKey.load_pkcs1(privkey_pem.encode())
+    priv = _load_privkey(privkey_pem)
     signature = rsa.sign(data, priv, 'SHA-256')
     return base64.b64encode(signature).decode()
 
 
+@lru_cache(maxsize=256)
 def _load_pubkey_any(pem_str: str) -> rsa.PublicKey:
     s = pem_str.strip()
     if "BEGIN PUBLIC KEY" in s:  # PKCS#8 / SPKI
@@ -3,6 +3,15 @@ import json
 import base64
 import time
 import rsa  # pip install rsa
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _load_pubkey(pem: bytes) -> rsa.PublicKey:
+    # one parse per distinct key, not one per packet
+    if b"BEGIN PUBLIC KEY" in pem:
+        return rsa.PublicKey.load_pkcs1_openssl_pem(pem)  # PKCS#8/SPKI
+    return rsa.PublicKey.load_pkcs1(pem)                  # PKCS#1
 
 def verify_packet_signature(pk: dict, pubkey_pem: str,
                             *, max_clock_skew_sec: int = 300,
@@ -72,10 +81,7 @@ def verify_packet_signature(pk: dict, pubkey_pem: str,
         raise ValueError("bad_pubkey")
     pem = pubkey_pem.strip().encode()
     try:
-        if b"BEGIN PUBLIC KEY" in pem:
-            pub = rsa.PublicKey.load_pkcs1_openssl_pem(pem)  # PKCS#8/SPKI
-        else:
-            pub = rsa.PublicKey.load_pkcs1(pem)              # PKCS#1
+        pub = _load_pubkey(pem)
     except Exception:
         raise ValueError("bad_pubkey_format")
 
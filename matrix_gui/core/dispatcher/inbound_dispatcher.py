@@ -1,18 +1,54 @@
-from Crypto.PublicKey import RSA
 from matrix_gui.core.utils.crypto_utils import (
     verify_signed_payload,
-    pem_fix,
     decrypt_with_ephemeral_aes,
+    open_with_session_key,
 )
+from matrix_gui.core.utils.session_keys import SessionKeyRing
+from matrix_gui.core.event_bus import EventBus
+from matrix_gui.core.dispatcher.serial_index import SerialIndex
+from matrix_gui.core.dispatcher.inbound_verify_stage import PooledVerifyStage
 from matrix_gui.config.boot.globals import get_sessions
 
 
 class InboundDispatcher:
-    def __init__(self, bus):
+    def __init__(self, bus, stage=None):
+        """
+        @param bus: Session bus carrying inbound.message.
+        @param stage: Verification stage (PooledVerifyStage by default,
+                      InlineVerifyStage to verify on the connector thread).
+        """
         self.bus = bus
+        self.serial_index = SerialIndex()
+        self.stage = stage or PooledVerifyStage()
         bus.on("inbound.message", self._handle_inbound)
+        EventBus.on("vault.deployment.changed", self._on_deployment_changed)
+
+    def close(self):
+        """Detach from the buses and stop the verification workers."""
+        self.bus.off("inbound.message", self._handle_inbound)
+        EventBus.off("vault.deployment.changed", self._on_deployment_changed)
+        self.stage.shutdown()
+
+    def _on_deployment_changed(self, dep_id=None, keys=None, **_):
+        # agents/certs edits move serials or keys; everything else is irrelevant here
+        if keys is None or {"agents", "certs"} & set(keys):
+            self.serial_index.invalidate()
 
     def _handle_inbound(self, session_id, channel, source, payload, ts=None, **_):
+        # hand the envelope to the verify stage; the connector goes straight back to its socket
+        self.stage.submit(
+            channel,
+            self._verify,
+            (session_id, source, payload, ts),
+            lambda verified_payload: self._emit_verified(session_id, channel, source, verified_payload, ts),
+        )
+
+    def _verify(self, session_id, source, payload, ts=None):
+        """
+        Verify and decrypt one inbound envelope (runs on a verify worker).
+
+        @return: Verified payload dict, or None if the packet is dropped.
+        """
         try:
             ctx = get_sessions().get(session_id)
             deployment = ctx.group.get("deployment", {}) if ctx else {}
@@ -23,77 +59,79 @@ class InboundDispatcher:
             serial = payload.get("serial")
             if not serial:
                 print("[INBOUND] ❌ Missing serial in inbound packet")
-                return
-
-            signer_pubkey_pem = None
-            signing = None
+                return None
 
-            # === First check: agent root serials ===
-            agents = deployment.get("agents", [])
-            uid_match = None
-            for agent in agents:
-                if agent.get("serial") == serial:
-                    uid_match = agent.get("universal_id")
-                    break
+            # === First check: agent root serials (prebuilt index) ===
+            entry = self.serial_index.lookup(deployment, serial)
+            signer_pubkey = entry.verify_key if entry else None
 
-            if uid_match:
-                cert_block = deployment.get("certs", {}).get(uid_match, {})
-                signing = cert_block.get("signing", {})
-                signer_pubkey_pem = pem_fix(signing.get("pubkey"))
-
-            if not signer_pubkey_pem:
+            if not signer_pubkey:
                 print(f"[INBOUND] ❌ No cert found for serial {serial}")
-                return
+                return None
 
-            signer_pubkey = RSA.import_key(
-                signer_pubkey_pem.encode()
-                if isinstance(signer_pubkey_pem, str)
-                else signer_pubkey_pem
-            )
+            agent_priv = entry.decrypt_key
 
-            # Verify sig on the envelope
-            verify_signed_payload(payload, payload["sig"], signer_pubkey)
+            inner_content = payload.get("content", {})
 
-            agent_priv_pem = signing.get("remote_privkey")
+            # === 2a. Session-key packets: the GCM tag is the authentication ===
+            if isinstance(inner_content, dict) and inner_content.get("type") == "session_aead":
+                try:
+                    skey = SessionKeyRing.inbound(deployment, entry.uid, signer_pubkey, agent_priv, inner_content)
+                    if not skey.accept_seq(inner_content.get("seq", 0)):
+                        print(f"[INBOUND] ❌ Replayed session packet seq={inner_content.get('seq')} from {entry.uid}")
+                        return None
+                    directive = open_with_session_key(inner_content, skey.key)
+                except Exception as e:
+                    print(f"[INBOUND] ❌ Session decrypt failed: {e}")
+                    return None
 
-            inner_content = payload.get("content", {})
+                return {
+                    "handler": directive.get("handler",""),
+                    "content": directive.get("content",{}),
+                    "ts": ts,
+                }
+
+            # === 2b. Legacy format: envelope signature (RSA or Ed25519, per the agent's suite) ===
+            verify_signed_payload(payload, payload["sig"], signer_pubkey)
 
             if (
                 isinstance(inner_content, dict)
                 and "encrypted_key" in inner_content
-                and agent_priv_pem
+                and agent_priv
             ):
                 try:
-                    directive = decrypt_with_ephemeral_aes(inner_content, agent_priv_pem)
+                    directive = decrypt_with_ephemeral_aes(inner_content, agent_priv)
 
-                    verified_payload = {
+                    return {
                         "handler": directive.get("handler",""),
                         "content": directive.get("content",{}),
                         "ts": ts,
                     }
                 except Exception as e:
                     print(f"[INBOUND] ❌ Decrypt failed: {e}")
-                    return
-            else:
-                verified_payload = {
-                    "handler": payload.get("handler"),
-                    "content": inner_content,
-                    "ts": ts,
-                }
-
-            # === 3. Emit Verified Events ===
-            handler = verified_payload.get("handler")
-
-            self.bus.emit(
-                f"inbound.verified.{handler}",
-                session_id=session_id,
-                channel=channel,
-                source=source,
-                payload=verified_payload,
-                ts=ts,
-            )
+                    return None
 
-            print(f"emmited: inbound.verified.{handler}")
+            return {
+                "handler": payload.get("handler"),
+                "content": inner_content,
+                "ts": ts,
+            }
 
         except Exception as e:
-            print(f"[INBOUND] ❌ Verification/decrypt failed: {e}")
\ No newline at end of file
+            print(f"[INBOUND] ❌ Verification/decrypt failed: {e}")
+            return None
+
+    # === 3. Emit Verified Events (per-channel arrival order) ===
+    def _emit_verified(self, session_id, channel, source, verified_payload, ts):
+        handler = verified_payload.get("handler")
+
+        self.bus.emit(
+            f"inbound.verified.{handler}",
+            session_id=session_id,
+            channel=channel,
+            source=source,
+            payload=verified_payload,
+            ts=ts,
+        )
+
+        print(f"emmited: inbound.verified.{handler}")
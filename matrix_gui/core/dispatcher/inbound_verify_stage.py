@@ -0,0 +1,105 @@
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class InlineVerifyStage:
+    """
+    Runs verification on the calling (connector) thread — the original
+    behaviour, kept for debugging and single-agent sessions.
+    """
+
+    def __init__(self):
+        self.stats = {"submitted": 0, "emitted": 0, "failed": 0}
+
+    def submit(self, channel, work, args, on_result):
+        """
+        Args:
+            channel (str): Ordering key (the ingress channel).
+            work (callable): work(*args) → result or None to drop.
+            args (tuple): Arguments for work.
+            on_result (callable): Called with each non-None result.
+        """
+        self.stats["submitted"] += 1
+        result = work(*args)
+        if result is not None:
+            on_result(result)
+            self.stats["emitted"] += 1
+
+    def shutdown(self):
+        pass
+
+
+class PooledVerifyStage:
+    """
+    Verifies/decrypts inbound envelopes on a worker pool while preserving
+    arrival order per channel.
+
+    The connector thread only submits; workers do the RSA/AES work (the
+    pycryptodome primitives release the GIL), and results leave in the same
+    order their envelopes arrived on that channel. A slow packet on one
+    channel holds back only that channel.
+
+    Any concurrent.futures executor can be plugged in; the default is a
+    thread pool because the work closes over cached key objects.
+    """
+
+    def __init__(self, workers=4, executor=None):
+        """
+        Args:
+            workers (int): Pool size when no executor is supplied.
+            executor (concurrent.futures.Executor, optional): Custom pool.
+        """
+        self._executor = executor or ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inbound_verify")
+        self._lanes = {}  # channel → _Lane
+        self._lock = threading.Lock()
+
+        self.stats = {"submitted": 0, "emitted": 0, "failed": 0}
+
+    def submit(self, channel, work, args, on_result):
+        """
+        Queue work for a channel; on_result fires in submission order.
+
+        Args:
+            channel (str): Ordering key (the ingress channel).
+            work (callable): work(*args) → result or None to drop.
+            args (tuple): Arguments for work.
+            on_result (callable): Called with each non-None result.
+        """
+        with self._lock:
+            lane = self._lanes.get(channel)
+            if lane is None:
+                lane = self._lanes[channel] = _Lane()
+            fut = self._executor.submit(work, *args)
+            lane.slots.append((fut, on_result))
+            self.stats["submitted"] += 1
+        fut.add_done_callback(lambda _f: self._flush(lane))
+
+    def _flush(self, lane):
+        # one emitter per lane; a second finisher waits, then picks up what is ready
+        with lane.emit_lock:
+            while True:
+                with self._lock:
+                    if not lane.slots or not lane.slots[0][0].done():
+                        return
+                    fut, on_result = lane.slots.popleft()
+
+                try:
+                    result = fut.result()
+                    if result is not None:
+                        on_result(result)
+                        self.stats["emitted"] += 1
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    print(f"[INBOUND][VERIFY] ❌ worker failed: {e}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _Lane:
+    __slots__ = ("slots", "emit_lock")
+
+    def __init__(self):
+        self.slots = collections.deque()  # (Future, on_result) in arrival order
+        self.emit_lock = threading.Lock()
@@ -1,5 +1,6 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from matrix_gui.core.utils.gui_call import post_to_gui
 from matrix_gui.config.boot.globals import get_sessions
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.core.class_lib.packet_delivery.utility.security.packet_security import wrap_packet_securely
@@ -105,13 +106,18 @@ class OutboundDispatcher:
                          packet: Packet,
                          security_sig=True,
                          security_encryption=True,
-                         security_target_universal_id="matrix"):
+                         security_target_universal_id="matrix",
+                         origin=None):
         """
         Event handler for outbound.message
 
         Wraps the outgoing packet with signing/encryption, resolves
-        the appropriate connector, and launches it via the session's
-        ConnectionLauncher.
+        the appropriate connector, and hands it to the channel's send
+        queue on the session's ConnectionLauncher.
+
+        If that queue is full the packet is not sent, and if the send
+        worker gives up on it after retrying it is dropped; either way
+        the emitter hears about it through _report_backpressure().
 
         @param session_id: ID of the session dispatching the packet.
         @param channel: Channel name (usually outgoing.command).
@@ -119,6 +125,7 @@ class OutboundDispatcher:
         @param security_sig: Whether to digitally sign the payload.
         @param security_encryption: Whether to encrypt the payload.
         @param security_target_universal_id: UID of the intended recipient.
+        @param origin: Optional emitting panel; told directly about backpressure.
         """
         try:
             ctx = self._get_ctx()
@@ -151,7 +158,56 @@ class OutboundDispatcher:
             )
 
             uid = self._resolved_channel.get("universal_id")
-            launcher.launch(uid, packet=packet, fire_catapult=True)
+
+            def undelivered(_packet, error):
+                # called on the send worker / lane loop; panels and the bus want the GUI thread
+                post_to_gui(lambda: self._report_backpressure(
+                    ctx, uid, channel, original_data, origin, reason="send_failed", error=error
+                ))
+
+            if not launcher.enqueue(uid, packet, on_undelivered=undelivered):
+                self._report_backpressure(ctx, uid, channel, original_data, origin)
 
         except Exception as e:
             emit_gui_exception_log("OutboundDispatcher._handle_outbound", e)
+
+    def _report_backpressure(self, ctx, uid, channel, original_data, origin=None, reason="queue_full", error=None):
+        """
+        Tell the emitter that the outbound lane is saturated, or that its
+        packet was dropped after the send worker ran out of retries.
+
+        Emits outbound.backpressure on the session bus and, when the
+        emitting panel was passed as origin and implements
+        on_outbound_backpressure(), calls it directly. GUI thread only.
+
+        @param ctx: SessionContext owning the bus and launcher.
+        @param uid: Universal id of the saturated egress channel.
+        @param channel: Channel name the packet was emitted on.
+        @param original_data: The unsent (pre-wrap) packet data.
+        @param origin: Optional emitting panel.
+        @param reason: "queue_full" (refused at enqueue) or "send_failed" (dropped by the worker).
+        @param error: What the last failed send reported, for "send_failed".
+        """
+        launcher = self._get_launcher()
+        depth, capacity = launcher.queue_depth(uid) if launcher else (0, 0)
+        handler = original_data.get("handler") if isinstance(original_data, dict) else None
+
+        if reason == "send_failed":
+            print(f"[DISPATCHER] ❌ Outbound send to {uid} failed ({error}) — '{handler}' dropped")
+        else:
+            print(f"[DISPATCHER] ⚠️ Outbound queue full for {uid} ({depth}/{capacity}) — '{handler}' not sent")
+
+        info = {
+            "session_id": self._session_id,
+            "channel": channel,
+            "universal_id": uid,
+            "handler": handler,
+            "depth": depth,
+            "capacity": capacity,
+            "reason": reason,
+        }
+        ctx.bus.emit("outbound.backpressure", origin=origin, **info)
+
+        cb = getattr(origin, "on_outbound_backpressure", None)
+        if callable(cb):
+            cb(**info)
@@ -0,0 +1,110 @@
+import threading
+import time
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
+from matrix_gui.core.utils.signing_suites import encryption_block
+
+
+class SerialEntry:
+    """
+    Everything InboundDispatcher needs for one agent serial.
+
+    Keys are resolved through RSAKeyCache on first use and then held here,
+    so steady-state lookups do no dict walking and no PEM work.
+    """
+
+    def __init__(self, dep_id, uid, pubkey_pem, privkey_pem, privkey_role="remote_privkey"):
+        self.dep_id = dep_id
+        self.uid = uid
+        self._pubkey_pem = pubkey_pem
+        self._privkey_pem = privkey_pem
+        self._privkey_role = privkey_role
+        self._verify_key = None
+        self._decrypt_key = None
+
+    @property
+    def verify_key(self):
+        """Cached RSA or Ed25519 key for certs[uid]['signing']['pubkey'], or None."""
+        if self._verify_key is None and self._pubkey_pem:
+            self._verify_key = RSAKeyCache.get(self._pubkey_pem, dep_id=self.dep_id, uid=self.uid, role="pubkey")
+        return self._verify_key
+
+    @property
+    def decrypt_key(self):
+        """CachedRSAKey for the agent's RSA-OAEP remote_privkey, or None."""
+        if self._decrypt_key is None and self._privkey_pem:
+            self._decrypt_key = RSAKeyCache.get(self._privkey_pem, dep_id=self.dep_id, uid=self.uid, role=self._privkey_role)
+        return self._decrypt_key
+
+
+class SerialIndex:
+    """
+    serial → SerialEntry map for one session's deployment.
+
+    Rebuilt when a different deployment object is presented, when
+    invalidate() is called (vault patch of agents/certs), or on a miss if
+    the last rebuild is older than miss_rebuild_after seconds. That last
+    rule picks up agents added without a change event while keeping a
+    flood of unknown serials from forcing a rebuild per packet.
+    """
+
+    miss_rebuild_after = 5.0
+
+    def __init__(self):
+        self._deployment = None
+        self._by_serial = {}
+        self._stale = True
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+        self.stats = {"hits": 0, "misses": 0, "rebuilds": 0}
+
+    def lookup(self, deployment: dict, serial: str):
+        """
+        Find the agent registered under an inbound packet's serial.
+
+        Args:
+            deployment (dict): The session's live deployment.
+            serial (str): Serial carried by the inbound packet.
+
+        Returns:
+            SerialEntry | None: Entry for the agent, or None if unknown.
+        """
+        with self._lock:
+            if self._stale or deployment is not self._deployment:
+                self._rebuild(deployment)
+
+            entry = self._by_serial.get(serial)
+            if entry is None and time.time() - self._built_at > self.miss_rebuild_after:
+                self._rebuild(deployment)
+                entry = self._by_serial.get(serial)
+
+            self.stats["hits" if entry else "misses"] += 1
+            return entry
+
+    def invalidate(self):
+        """Force a rebuild on the next lookup."""
+        self._stale = True
+
+    def _rebuild(self, deployment):
+        deployment = deployment or {}
+        dep_id = deployment.get("id")
+        certs = deployment.get("certs", {})
+
+        index = {}
+        for agent in deployment.get("agents", []):
+            serial = agent.get("serial")
+            if not serial or serial in index:
+                continue  # first agent wins, as with the old linear scan
+            uid = agent.get("universal_id")
+            signing = certs.get(uid, {}).get("signing", {})
+            enc = encryption_block(signing)
+            index[serial] = SerialEntry(
+                dep_id, uid, signing.get("pubkey"), enc.get("remote_privkey"),
+                privkey_role="remote_privkey" if enc is signing else "encryption.remote_privkey",
+            )
+
+        self._by_serial = index
+        self._deployment = deployment
+        self._stale = False
+        self._built_at = time.time()
+        self.stats["rebuilds"] += 1
@@ -9,6 +9,9 @@ from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QHeaderView, QTreeWidget, QTreeWidgetItem, QLabel
 
 class PhoenixAgentTree(QWidget):
+    KEY_ROLE = Qt.ItemDataRole.UserRole + 1  # reconciliation key stored on each item
+    _fonts = None
+
     def __init__(self, session_id, vault_data=None, bus=None, conn=None, deployment=None, parent=None):
         super().__init__(parent)
         try:
@@ -58,6 +61,11 @@ class PhoenixAgentTree(QWidget):
 
             self._rendered_tree_root={} #holds udated agent tree
 
+            # key (universal_id) → item, and key → (own, subtree) digest of what it shows
+            self._items = {}
+            self._digests = {}
+            self.render_stats = {"created": 0, "updated": 0, "moved": 0, "removed": 0, "skipped": 0, "ms": 0}
+
             # === Agent detail panel
 
             layout.setStretch(0, 0)  # status label
@@ -116,13 +124,23 @@ class PhoenixAgentTree(QWidget):
 
             self.bus.emit("gui.agent.selected", session_id=self.session_id, node=node, panels=panels)
             self.bus.emit("gui.log.token.updated", session_id=self.session_id, token=token, agent_title=node.get("name", uid))
-            self.bus.emit("outbound.message", session_id=self.session_id, channel="outgoing.command", packet=pk)
+            self.bus.emit("outbound.message", session_id=self.session_id, channel="outgoing.command", packet=pk, origin=self)
 
             print(f"[AGENT_TREE] 🔍 Sent fetch_logs for agent {uid} with token={token}")
 
         except Exception as e:
             emit_gui_exception_log("PhoenixAgentTree._on_tree_item_clicked", e)
 
+    def on_outbound_backpressure(self, universal_id=None, depth=0, capacity=0, reason="queue_full", **_):
+        """A command this tree emitted was refused (queue full) or dropped (send failed); surface it in the status line."""
+        try:
+            if reason == "send_failed":
+                self.status_label.setText(f"❌ Send to {universal_id} failed — command dropped")
+            else:
+                self.status_label.setText(f"⚠️ Outbound queue full ({depth}/{capacity}) — retry shortly")
+        except Exception as e:
+            emit_gui_exception_log("PhoenixAgentTree.on_outbound_backpressure", e)
+
     def _handle_tree_update(self, payload, **_):
         try:
             if self._render_pending:
@@ -160,7 +178,7 @@ class PhoenixAgentTree(QWidget):
                 node = current_item.data(0, Qt.ItemDataRole.UserRole)
                 selected_uid = node.get("universal_id") if isinstance(node, dict) else None
 
-            # --- normal rebuild ---
+            # --- incremental update ---
             content = payload.get("content", {})
             if isinstance(content, dict):
                 self._rendered_tree_root = content
@@ -168,124 +186,244 @@ class PhoenixAgentTree(QWidget):
             self._render_tree(content)
             self._update_status_label()
 
-            # --- restore selection after event loop flush ---
-            if selected_uid:
-                QTimer.singleShot(0, lambda uid=selected_uid: self._restore_selection(uid))
-
-            QTimer.singleShot(0, self.tree.expandAll)
+            # --- only needed if the selected agent's item had to be recreated ---
+            if selected_uid and self.tree.currentItem() is None:
+                self._restore_selection(selected_uid)
 
         except Exception as e:
             emit_gui_exception_log("PhoenixAgentTree._render_tree_safe", e)
 
     def _restore_selection(self, uid):
-        """Locate the item with matching UID and reselect it."""
-
-        def recurse(item):
-            node = item.data(0, Qt.ItemDataRole.UserRole)
-            if isinstance(node, dict) and node.get("universal_id") == uid:
-                self.tree.setCurrentItem(item)
-                return True
-            for i in range(item.childCount()):
-                if recurse(item.child(i)):
-                    return True
-            return False
-
-        for i in range(self.tree.topLevelItemCount()):
-            if recurse(self.tree.topLevelItem(i)):
-                break
+        """Reselect the item with matching UID."""
+        item = self._items.get(uid)
+        if item is not None:
+            self.tree.setCurrentItem(item)
 
     def _update_status_label(self):
         try:
             ts = self._last_tree_update_ts or time.time()
             time_str = datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S")
             self.status_label.setText(f"Updated at {time_str}")
+            s = self.render_stats
+            self.status_label.setToolTip(
+                f"Last refresh {s['ms']} ms: {s['created']} new, {s['updated']} changed, "
+                f"{s['moved']} moved, {s['removed']} removed, {s['skipped']} branches unchanged"
+            )
         except Exception as e:
             emit_gui_exception_log("PhoenixAgentTree._update_status_label", e)
 
     def _render_tree(self, tree_data):
+        """
+        Reconcile the widget against a fresh tree broadcast.
+
+        Items are kept in a key → item index (key = universal_id) and every
+        node is hashed together with its subtree, so an unchanged branch is
+        skipped outright. Changed nodes are edited in place, new ones
+        inserted and vanished ones removed; surviving items keep their
+        expansion, selection and the view's scroll position.
+        """
         try:
-            self.tree.clear()
-
-            def build(parent, node):
-                if not isinstance(node, dict):
-                    return
-
-                # Extract base name and children
-                base = node.get("universal_id") or "Unnamed"
-                children = node.get("children", [])
-                child_count = len(children)
-
-                # Flip-trip check
-                flip_count = (
-                    node.get("agent_status", {})
-                    .get("spawn", {})
-                    .get("count", 0)
-                )
-
-                flip_marker = ""
-                if flip_count > self.flip_tripping_threshold:  # threshold, tweak as you like
-                    flip_marker = f"    ⚠"
-
-                # Icon + Title
-                ui_cfg = node.get("config", {}).get("ui", {})
-                tree_ui = ui_cfg.get("agent_tree", {})
-
-                emoji = tree_ui.get("emoji")
-                icon_path = tree_ui.get("icon")
-
-                # Decide prefix
-                if emoji:
-                    prefix = emoji
-                elif icon_path:
-                    # for now just show the icon path text, or use QIcon if you wire it in
-                    prefix = "🖼"
-                else:
-                    prefix = "🧬" if children else "🔹"
+            started = time.perf_counter()
+            self.render_stats = dict.fromkeys(self.render_stats, 0)
 
-                # Build title
-                if children:
-                    title = f"{prefix} {base} ({child_count}){flip_marker}"
-                else:
-                    title = f"{prefix} {base}{flip_marker}"
-
-                # Create the tree item
-                item = QTreeWidgetItem([title])
-                item.setData(0, Qt.ItemDataRole.UserRole, node)
+            nodes = [tree_data] if isinstance(tree_data, dict) else []
+            digests = {}
+            self._digest_children(nodes, digests, "", set())
 
-                # --- Emoji font fallback (forces full emoji support) ---
-                font = QFont()
-                if platform.system() == "Windows":
-                    font.setFamily("Segoe UI Emoji")
-                else:
-                    font.setFamily("Noto Color Emoji")
-                item.setFont(0, font)
-                # --- End emoji font fallback ---
+            self.tree.setUpdatesEnabled(False)
+            try:
+                self._sync_children(None, nodes, digests)
+            finally:
+                self.tree.setUpdatesEnabled(True)
 
-                # Tooltip if marked
-                if flip_count > self.flip_tripping_threshold:
-                    item.setToolTip(0, f"This agent flip-tripped {flip_count} times.")
+            self.render_stats["ms"] = round((time.perf_counter() - started) * 1000, 1)
 
-                # Bold font if it has children
-                font = item.font(0)
-                if children:
-                    font.setBold(True)
-                item.setFont(0, font)
+        except Exception as e:
+            emit_gui_exception_log("PhoenixAgentTree._render_tree", e)
 
-                # Attach to parent or root
+    def _digest_children(self, nodes, digests, parent_key, seen):
+        """
+        Key and hash sibling nodes and their subtrees, in display order.
+
+        A node's key is its universal_id, or its position under the parent
+        when it has none or the uid was already taken earlier in the tree.
+        Keys are assigned here, over the whole tree, so branches the sync
+        later skips still reserve theirs; the key is part of the hash, so a
+        branch whose keys shifted is not skipped.
+
+        Returns:
+            list: Subtree digests of the nodes, in order.
+        """
+        out = []
+        pos = 0
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            key = node.get("universal_id") or f"{parent_key}/{pos}"
+            if key in seen:
+                key = f"{parent_key}/{pos}"  # duplicate uid; fall back to its position
+            seen.add(key)
+            pos += 1
+
+            children = node.get("children", [])
+            own_fields = {k: v for k, v in node.items() if k != "children"}
+            own = hashlib.md5(
+                (key + "|" + json.dumps(own_fields, sort_keys=True, default=str) + f"|{len(children)}").encode()
+            ).hexdigest()
+
+            subtree = hashlib.md5(own.encode())
+            for child_digest in self._digest_children(children, digests, key, seen):
+                subtree.update(child_digest.encode())
+
+            digests[id(node)] = (key, own, subtree.hexdigest())
+            out.append(digests[id(node)][2])
+        return out
+
+    def _sync_children(self, parent, nodes, digests):
+        """Make the children of `parent` (None = top level) match `nodes`, in order."""
+        def count():
+            return parent.childCount() if parent else self.tree.topLevelItemCount()
+
+        def child_at(i):
+            return parent.child(i) if parent else self.tree.topLevelItem(i)
+
+        pos = 0
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+
+            key, own, subtree = digests[id(node)]
+
+            item = self._items.get(key)
+            is_new = item is None
+            if is_new:
+                item = QTreeWidgetItem()
+                item.setData(0, self.KEY_ROLE, key)
+                self.render_stats["created"] += 1
+
+            if child_at(pos) is not item:
+                expanded = []
+                if not is_new:
+                    expanded = [it for it in self._subtree(item) if it.isExpanded()]  # take/insert collapses
+                    self._detach(item)
+                    self.render_stats["moved"] += 1
                 if parent:
-                    parent.addChild(item)
+                    parent.insertChild(pos, item)
                 else:
-                    self.tree.addTopLevelItem(item)
-
-                # Recurse
-                for child in children:
-                    build(item, child)
-
-
-            build(None, tree_data)
-
-        except Exception as e:
-            emit_gui_exception_log("PhoenixAgentTree._render_tree", e)
+                    self.tree.insertTopLevelItem(pos, item)
+                for it in expanded:
+                    it.setExpanded(True)
+            pos += 1
+
+            previous = self._digests.get(key)
+            if previous == (own, subtree):
+                self.render_stats["skipped"] += 1
+                continue
+
+            if is_new or previous[0] != own:
+                self._apply_node(item, node)
+                if not is_new:
+                    self.render_stats["updated"] += 1
+            item.setData(0, Qt.ItemDataRole.UserRole, node)
+            self._items[key] = item
+            self._digests[key] = (own, subtree)
+
+            self._sync_children(item, node.get("children", []), digests)
+            if is_new:
+                item.setExpanded(True)
+
+        while count() > pos:
+            stale = parent.takeChild(pos) if parent else self.tree.takeTopLevelItem(pos)
+            self._forget(stale)
+
+    def _detach(self, item):
+        parent = item.parent()
+        if parent:
+            parent.takeChild(parent.indexOfChild(item))
+        else:
+            index = self.tree.indexOfTopLevelItem(item)
+            if index >= 0:
+                self.tree.takeTopLevelItem(index)
+
+    @staticmethod
+    def _subtree(item):
+        """An item and all its descendants."""
+        stack = [item]
+        while stack:
+            it = stack.pop()
+            yield it
+            stack.extend(it.child(i) for i in range(it.childCount()))
+
+    def _forget(self, item):
+        """Drop a removed item and its descendants from the index."""
+        for it in self._subtree(item):
+            key = it.data(0, self.KEY_ROLE)
+            if self._items.get(key) is it:
+                del self._items[key]
+                self._digests.pop(key, None)
+                self.render_stats["removed"] += 1
+
+    @classmethod
+    def _node_font(cls, bold: bool):
+        # emoji font fallback (forces full emoji support), shared by every item
+        if cls._fonts is None:
+            family = "Segoe UI Emoji" if platform.system() == "Windows" else "Noto Color Emoji"
+            regular, heavy = QFont(), QFont()
+            regular.setFamily(family)
+            heavy.setFamily(family)
+            heavy.setBold(True)
+            cls._fonts = (regular, heavy)
+        return cls._fonts[bool(bold)]
+
+    def _apply_node(self, item, node):
+        """Set an item's title, tooltip and font from its node."""
+        # Extract base name and children
+        base = node.get("universal_id") or "Unnamed"
+        children = node.get("children", [])
+        child_count = len(children)
+
+        # Flip-trip check
+        flip_count = (
+            node.get("agent_status", {})
+            .get("spawn", {})
+            .get("count", 0)
+        )
+
+        flip_marker = ""
+        if flip_count > self.flip_tripping_threshold:  # threshold, tweak as you like
+            flip_marker = f"    ⚠"
+
+        # Icon + Title
+        ui_cfg = node.get("config", {}).get("ui", {})
+        tree_ui = ui_cfg.get("agent_tree", {})
+
+        emoji = tree_ui.get("emoji")
+        icon_path = tree_ui.get("icon")
+
+        # Decide prefix
+        if emoji:
+            prefix = emoji
+        elif icon_path:
+            # for now just show the icon path text, or use QIcon if you wire it in
+            prefix = "🖼"
+        else:
+            prefix = "🧬" if children else "🔹"
+
+        # Build title
+        if children:
+            title = f"{prefix} {base} ({child_count}){flip_marker}"
+        else:
+            title = f"{prefix} {base}{flip_marker}"
+        item.setText(0, title)
+
+        # Tooltip if marked
+        if flip_count > self.flip_tripping_threshold:
+            item.setToolTip(0, f"This agent flip-tripped {flip_count} times.")
+        else:
+            item.setToolTip(0, "")
+
+        # Bold font if it has children
+        item.setFont(0, self._node_font(bool(children)))
 
     def closeEvent(self, event):
         try:
@@ -160,6 +160,7 @@ class CryptoAlert(PhoenixPanelInterface):
                 session_id=self.session_id,
                 channel="outgoing.command",
                 packet=pk,
+                origin=self,
             )
 
             # 4. Remove the card visually
@@ -232,7 +233,8 @@ class CryptoAlert(PhoenixPanelInterface):
                 "outbound.message",
                 session_id=self.session_id,
                 channel="outgoing.command",
-                packet=pk
+                packet=pk,
+                origin=self,
             )
 
             QMessageBox.information(self, "Updated", "Config pushed to backend.")
@@ -258,7 +260,8 @@ class CryptoAlert(PhoenixPanelInterface):
                 "outbound.message",
                 session_id=self.session_id,
                 channel="outgoing.command",
-                packet=pk
+                packet=pk,
+                origin=self,
             )
         except Exception as e:
             emit_gui_exception_log("CryptoAlertPanel._request_current_config", e)
@@ -325,7 +328,8 @@ class CryptoAlert(PhoenixPanelInterface):
                 "outbound.message",
                 session_id=self.session_id,
                 channel="outgoing.command",
-                packet=pk
+                packet=pk,
+                origin=self,
             )
 
         except Exception as e:
@@ -347,7 +351,8 @@ class CryptoAlert(PhoenixPanelInterface):
                 "outbound.message",
                 session_id=self.session_id,
                 channel="outgoing.command",
-                packet=pk
+                packet=pk,
+                origin=self,
             )
 
         except Exception as e:
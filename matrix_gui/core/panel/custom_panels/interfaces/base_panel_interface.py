@@ -100,6 +100,30 @@ class PhoenixPanelInterface(QWidget, metaclass=PanelABCMeta):
         except Exception as e:
             print(f"[{self.__class__.__name__}] cleanup failed: {e}")
 
+    # --- Outbound Feedback ---
+    def on_outbound_backpressure(self, universal_id=None, handler=None, depth=0, capacity=0, reason="queue_full", **_):
+        """
+        Called by OutboundDispatcher (on the GUI thread) when a packet this
+        panel emitted (with origin=self) was refused because the egress
+        queue is full (reason "queue_full") or dropped after its sends
+        kept failing (reason "send_failed").
+        Default: toast the operator through the cockpit pipe.
+        """
+        try:
+            print(f"[{self.__class__.__name__}] outbound {reason} on {universal_id}: {depth}/{capacity}")
+            if reason == "send_failed":
+                message = f"Send to {universal_id} failed — '{handler}' dropped."
+            else:
+                message = f"Outbound queue full ({depth}/{capacity}) — '{handler}' not sent, retry shortly."
+            if self.conn:
+                self.conn.send({
+                    "type": "ui_toast",
+                    "session_id": self.session_id,
+                    "message": message,
+                })
+        except Exception as e:
+            print(f"[{self.__class__.__name__}] backpressure notice failed: {e}")
+
     # --- Abstract Required Interface ---
     @abstractmethod
     def _connect_signals(self): ...
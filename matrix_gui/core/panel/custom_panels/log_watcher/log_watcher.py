@@ -145,7 +145,8 @@ class LogWatcher(PhoenixPanelInterface):
                 "outbound.message",
                 session_id=self.session_id,
                 channel="outgoing.command",
-                packet=pk
+                packet=pk,
+                origin=self,
             )
 
             oracle_text = " 🧠 (Oracle enabled)" if use_oracle else ""
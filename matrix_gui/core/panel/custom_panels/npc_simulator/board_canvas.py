@@ -0,0 +1,182 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont
+from PyQt6.QtCore import Qt, QRect, QSize
+
+# cell kinds (one byte per cell)
+EMPTY, PLAYER, LAST_SEEN, SCOUT, HUNTER, FOLLOWER, NPC = range(7)
+
+NPC_KINDS = {"scout": SCOUT, "hunter": HUNTER, "follower": FOLLOWER}
+
+# kind → (background, border, glyph colour, glyph); mirrors the old per-cell stylesheets
+STYLES = {
+    EMPTY: ("#111", "#333", "#fff", ""),
+    PLAYER: ("#444", "#555", "#0f0", "@"),
+    LAST_SEEN: ("#300", "#f00", "#f44", "X"),
+    SCOUT: ("#222", "#444", "#ff0", "o"),
+    HUNTER: ("#222", "#444", "#f00", "o"),
+    FOLLOWER: ("#222", "#444", "#0cf", "o"),
+    NPC: ("#222", "#444", "#fff", "o"),
+}
+
+
+class BoardCanvas(QWidget):
+    """
+    Custom-painted NPC grid.
+
+    Cell state lives in two bytearrays (kind and stacked-NPC count, one byte
+    each per cell). set_frame() builds the next frame's arrays, compares them
+    with the current ones only at cells occupied in either frame, and asks
+    Qt to repaint just those cells' rectangles; paintEvent() draws only what
+    falls inside the dirty region. An idle 100×100 board costs nothing and a
+    frame with a few hundred moving NPCs touches a few hundred cells.
+    """
+    MIN_CELL = 3
+    FULL_REPAINT_RATIO = 0.25  # past this share of dirty cells, one full update is cheaper
+
+    def __init__(self, grid_size=20, cell_px=20, parent=None):
+        super().__init__(parent)
+        self.cell_px = cell_px
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)  # we paint every pixel ourselves
+        self._brushes = {k: (QColor(bg), QColor(border), QColor(fg), glyph) for k, (bg, border, fg, glyph) in STYLES.items()}
+        self.stats = {"frames": 0, "dirty": 0}
+        self.set_grid_size(grid_size)
+
+    # -----------------------------
+    def set_grid_size(self, grid_size: int):
+        self.grid_size = max(1, int(grid_size))
+        n = self.grid_size * self.grid_size
+        self._kinds = bytearray(n)
+        self._counts = bytearray(n)
+        self._occupied = []  # cell indices that are not EMPTY
+        self._layout()
+        self.updateGeometry()
+        self.update()
+
+    def set_frame(self, player_pos, npc_list, last_seen=None):
+        """
+        Apply one frame and schedule repaints for the cells that changed.
+
+        Returns:
+            int: Number of dirty cells.
+        """
+        size = self.grid_size
+        n = size * size
+        kinds = bytearray(n)
+        counts = bytearray(n)
+        occupied = []
+
+        def in_grid(pos):
+            return (
+                isinstance(pos, (list, tuple)) and len(pos) == 2
+                and isinstance(pos[0], int) and isinstance(pos[1], int)
+                and 0 <= pos[0] < size and 0 <= pos[1] < size
+            )
+
+        if in_grid(player_pos):
+            i = player_pos[1] * size + player_pos[0]
+            kinds[i] = PLAYER
+            occupied.append(i)
+
+        if in_grid(last_seen):
+            i = last_seen[1] * size + last_seen[0]
+            kinds[i] = LAST_SEEN
+            occupied.append(i)
+
+        for npc in npc_list or ():
+            x, y = npc.get("x"), npc.get("y")
+            if not in_grid((x, y)):
+                continue
+            i = y * size + x
+            if counts[i]:
+                counts[i] = min(counts[i] + 1, 255)  # stacked NPCs show a count
+                continue
+            counts[i] = 1
+            kinds[i] = NPC_KINDS.get(npc.get("role"), NPC)
+            occupied.append(i)
+
+        old_kinds, old_counts = self._kinds, self._counts
+        dirty = {
+            i for i in set(occupied).union(self._occupied)
+            if kinds[i] != old_kinds[i] or counts[i] != old_counts[i]
+        }
+
+        self._kinds, self._counts, self._occupied = kinds, counts, occupied
+        self.stats["frames"] += 1
+        self.stats["dirty"] = len(dirty)
+
+        if len(dirty) > n * self.FULL_REPAINT_RATIO:
+            self.update()
+        else:
+            for i in dirty:
+                self.update(self._cell_rect(i % size, i // size))
+        return len(dirty)
+
+    # -----------------------------
+    def sizeHint(self):
+        side = self.grid_size * self.cell_px
+        return QSize(side, side)
+
+    def minimumSizeHint(self):
+        side = self.grid_size * self.MIN_CELL
+        return QSize(side, side)
+
+    def resizeEvent(self, event):
+        self._layout()
+        super().resizeEvent(event)
+
+    def _layout(self):
+        fit = min(self.width(), self.height()) // self.grid_size
+        self._cell = max(self.MIN_CELL, min(fit, self.cell_px) if fit else self.cell_px)
+        side = self._cell * self.grid_size
+        self._origin = (max(0, (self.width() - side) // 2), max(0, (self.height() - side) // 2))
+        self._font = QFont(self.font())
+        self._font.setPixelSize(max(6, int(self._cell * 0.7)))
+
+    def _cell_rect(self, x, y) -> QRect:
+        ox, oy = self._origin
+        return QRect(ox + x * self._cell, oy + y * self._cell, self._cell, self._cell)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        try:
+            clip = event.rect()
+            painter.fillRect(clip, self.palette().window())
+
+            c, size = self._cell, self.grid_size
+            ox, oy = self._origin
+            x0 = max(0, (clip.left() - ox) // c)
+            y0 = max(0, (clip.top() - oy) // c)
+            x1 = min(size - 1, (clip.right() - ox) // c)
+            y1 = min(size - 1, (clip.bottom() - oy) // c)
+            if x1 < x0 or y1 < y0:
+                return
+
+            # empty cells in the dirty area: one fill plus the grid lines
+            bg, border, _, _ = self._brushes[EMPTY]
+            area = QRect(ox + x0 * c, oy + y0 * c, (x1 - x0 + 1) * c, (y1 - y0 + 1) * c)
+            painter.fillRect(area, bg)
+            if c >= 6:
+                painter.setPen(QPen(border))
+                for x in range(x0, x1 + 2):
+                    painter.drawLine(ox + x * c, area.top(), ox + x * c, area.bottom())
+                for y in range(y0, y1 + 2):
+                    painter.drawLine(area.left(), oy + y * c, area.right(), oy + y * c)
+
+            # occupied cells in the dirty area
+            painter.setFont(self._font)
+            glyphs = c >= 10
+            for i in self._occupied:
+                x, y = i % size, i // size
+                if not (x0 <= x <= x1 and y0 <= y <= y1):
+                    continue
+                bg, border, fg, glyph = self._brushes[self._kinds[i]]
+                rect = self._cell_rect(x, y)
+                painter.fillRect(rect.adjusted(1, 1, -1, -1) if c >= 6 else rect, bg if glyphs else fg)
+                if glyphs:
+                    count = self._counts[i]
+                    painter.setPen(fg)
+                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(count) if count > 1 else glyph)
+        finally:
+            painter.end()
@@ -1,6 +1,6 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
 import uuid, time
-from PyQt6.QtWidgets import QVBoxLayout, QLabel, QGridLayout, QPushButton, QHBoxLayout
+from PyQt6.QtWidgets import QVBoxLayout, QLabel, QPushButton, QHBoxLayout
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.core.panel.control_bar import PanelButton
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 from collections import deque
 from matrix_gui.core.panel.custom_panels.interfaces.base_panel_interface import PhoenixPanelInterface
+from matrix_gui.core.panel.custom_panels.npc_simulator.board_canvas import BoardCanvas
 
 class Gameboard(PhoenixPanelInterface):
     cache_panel = True
@@ -107,25 +108,11 @@ class Gameboard(PhoenixPanelInterface):
                 btn_row.addWidget(btn)
             layout.addLayout(btn_row)
 
-            # Grid display
-            self.grid_size = 20  # same as npc agent default
-            self.grid = QGridLayout()
-            self.grid.setSpacing(2)
-            self.cells = []
+            # Grid display: painted, only changed cells are redrawn
+            self.grid_size = (self.node or {}).get("config", {}).get("grid_size", 20)  # npc agent's grid
             self.has_drawn = False
-            for y in range(self.grid_size):
-                row = []
-                for x in range(self.grid_size):
-                    cell = QLabel(" ")
-                    cell.setFixedSize(20, 20)
-                    cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    cell.setStyleSheet("border: 1px solid #333; background: #111; color: #fff;")
-                    self.grid.addWidget(cell, y, x)
-                    row.append(cell)
-                self.cells.append(row)
-
-
-            layout.addLayout(self.grid)
+            self.board = BoardCanvas(self.grid_size)
+            layout.addWidget(self.board, stretch=1)
             return layout
         except Exception as e:
             emit_gui_exception_log("Gameboard._build_layout", e)
@@ -151,87 +138,15 @@ class Gameboard(PhoenixPanelInterface):
 
     @pyqtSlot(object, object)
     def _update_grid_safe(self, player_pos, npc_list):
-        self.setUpdatesEnabled(False)
         try:
-            grid_size = self.grid_size
-            seen = set()
-
-            # Clear grid
-            for y in range(grid_size):
-                for x in range(grid_size):
-                    try:
-                        if not self._is_valid_cell(x, y):
-                            print(f"[GRID] 🚫 Skipping invalid NPC")
-                            continue
-                        self.cells[y][x].setText(" ")
-                        self.cells[y][x].setStyleSheet("border: 1px solid #333; background: #111;")
-                    except Exception as e:
-                        print(f"[GRID] ❌ Failed to clear {x},{y} – {e}")
-
-            # Draw player
-            px, py = player_pos
-            if 0 <= px < grid_size and 0 <= py < grid_size:
-                self.cells[py][px].setText("@")
-                self.cells[py][px].setStyleSheet("border: 1px solid #555; background: #444; color: #0f0;")
-
-            # Draw last seen player position (if enabled)
-            if (
-                    getattr(self, "last_seen_player", None) is not None
-                    and isinstance(self.last_seen_player, (list, tuple))
-                    and self._is_valid_cell(*self.last_seen_player)
-            ):
-                lx, ly = self.last_seen_player
-                self.cells[ly][lx].setText("X")
-                self.cells[ly][lx].setStyleSheet("border: 1px solid #f00; background: #300; color: #f44;")
-
-            # Draw NPCs
-            for npc in npc_list:
-                x = npc.get("x")
-                y = npc.get("y")
-                role = npc.get("role", "unknown")
-                key = (x, y)
-
-                if x is None or y is None:
-                    print(f"[GRID] ⚠️ Skipping NPC with invalid coords: {npc}")
-                    continue
-
-                if 0 <= x < grid_size and 0 <= y < grid_size:
-                    try:
-                        if key in seen:
-                            existing = self.cells[y][x].text()
-                            if existing.isdigit():
-                                self.cells[y][x].setText(str(int(existing) + 1))
-                            else:
-                                self.cells[y][x].setText("2")
-                            continue
-
-                        color = {
-                            "scout": "#ff0",
-                            "hunter": "#f00",
-                            "follower": "#0cf"
-                        }.get(role, "#fff")
-
-                        if not self._is_valid_cell(x, y):
-                            print(f"[GRID] 🚫 Skipping invalid NPC")
-                            continue
-
-                        self.cells[y][x].setText("o")
-                        self.cells[y][x].setStyleSheet(f"border: 1px solid #444; background: #222; color: {color};")
-
-                    except Exception as e:
-                        print(f"[GRID] ❌ Failed to draw NPC at {x},{y} – {e}")
-                else:
-                    print(f"[GRID] 🚫 Out-of-bounds NPC: {npc}")
-
+            if self.board.grid_size != self.grid_size:
+                self.board.set_grid_size(self.grid_size)
+            self.board.set_frame(player_pos, npc_list, getattr(self, "last_seen_player", None))
             self._overlap_warned = False
 
         except Exception as e:
             emit_gui_exception_log("Gameboard._update_grid", e)
 
-        finally:
-            self.setUpdatesEnabled(True)
-            self.update()
-
     def resizeEvent(self, event):
         self._resizing = True
         super().resizeEvent(event)
@@ -310,18 +225,6 @@ class Gameboard(PhoenixPanelInterface):
         self._send_command("cmd_stop_npc_stream", service="npc.swarm.stream.stop")
 
 
-    @pyqtSlot()
-    def _drain_frame_queue(self):
-        if not self._frame_queue:
-            return
-
-        # get the latest frame (drop older ones if multiple stacked)
-        player_pos, npc_list = self._frame_queue.pop()
-        self._frame_queue.clear()  # discard leftovers
-
-        # safe draw
-        self._update_grid_safe(player_pos, npc_list)
-
     @pyqtSlot()
     def _drain_frame_queue(self):
         try:
@@ -332,10 +235,8 @@ class Gameboard(PhoenixPanelInterface):
             player_pos, npc_list = self._frame_queue.pop()
             self._frame_queue.clear()
 
-            # safe draw
+            # safe draw; the board schedules its own repaint of the changed cells
             self._update_grid_safe(player_pos, npc_list)
-            self.update()
-            self.repaint()
 
         except Exception as e:
             emit_gui_exception_log("Gameboard._drain_frame_queue", e)
@@ -347,6 +248,9 @@ class Gameboard(PhoenixPanelInterface):
 
             player_pos = data.get("player_pos", (0, 0))
             npc_list = data.get("npc_list", [])
+            grid_size = data.get("grid_size")
+            if isinstance(grid_size, int):
+                self.grid_size = grid_size  # applied by the next draw, on the GUI thread
             self.last_player_pos = player_pos
             self.last_npc_list = npc_list
             self.has_drawn = True
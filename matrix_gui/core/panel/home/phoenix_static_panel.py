@@ -1,15 +1,20 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
-import json, time, hashlib, platform, winsound, subprocess, threading, os
+import time, platform, winsound, subprocess, threading, os
 from pathlib import Path
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QGroupBox, QComboBox, QCheckBox, QHBoxLayout
-from matrix_gui.core.class_lib.feed.feed_formatter import FeedFormatter
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListView, QLineEdit, QGroupBox, QComboBox, QCheckBox, QHBoxLayout
+from matrix_gui.core.class_lib.feed.feed_formatter import FeedFormatter, normalize_level
+from matrix_gui.core.class_lib.feed.feed_model import FeedModel, FeedFilterProxy, FeedDelegate, feed_entry
+from matrix_gui.core.class_lib.feed.alert_aggregator import AlertAggregator
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QLabel, QGraphicsDropShadowEffect
 from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
 from matrix_gui.core.event_bus import EventBus
+
+ALERT_SOUND_GAP = float(os.getenv("MATRIX_ALERT_SOUND_GAP", "5"))  # seconds of quiet that end a burst
+
 class PhoenixStaticPanel(QWidget):
     """
     Home HUD after vault unlock:
@@ -34,7 +39,13 @@ class PhoenixStaticPanel(QWidget):
         self.deployment_tree.customContextMenuRequested.connect(self._on_deployment_context_menu)
         layout.addWidget(self.deployment_tree)
 
-        self._recent_alerts = {}  # message-hash → timestamp
+        # folds alerts that reach the cockpit un-aggregated (sessions aggregate their own)
+        self.alert_aggregator = AlertAggregator()
+        self._alert_flush_timer = QTimer(self)
+        self._alert_flush_timer.timeout.connect(self._flush_alerts)
+        self._alert_flush_timer.start(1000)
+        self._last_sound_ts = 0
+        self._sound_proc = None
 
         # === Sound Controls ===
         sound_box = QGroupBox("🔈 Alert Sound Settings")
@@ -53,9 +64,31 @@ class PhoenixStaticPanel(QWidget):
         layout.addWidget(sound_box)
 
         # === Swarm Feed ===
-        self.feed = QTextEdit()
-        self.feed.setReadOnly(True)
-        layout.addWidget(self.feed)
+        self.feed_model = FeedModel(parent=self)
+        self.feed_proxy = FeedFilterProxy(self)
+        self.feed_proxy.setSourceModel(self.feed_model)
+
+        self.feed = QListView()
+        self.feed.setModel(self.feed_proxy)
+        self.feed.setItemDelegate(FeedDelegate(self.feed))
+        self.feed.setUniformItemSizes(True)
+        self.feed.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+
+        self.level_filter = QComboBox()
+        self.level_filter.addItem("All levels", None)
+        for level in FeedFormatter.COLORS:
+            self.level_filter.addItem(level, level)
+        self.deployment_filter = QComboBox()
+        self.deployment_filter.addItem("All deployments", None)
+        self.agent_filter = QLineEdit()
+        self.agent_filter.setPlaceholderText("Filter agent…")
+        self.feed_counts = QLabel("")
+
+        self.level_filter.currentIndexChanged.connect(self._apply_feed_filters)
+        self.deployment_filter.currentIndexChanged.connect(self._apply_feed_filters)
+        self.agent_filter.textChanged.connect(self._apply_feed_filters)
+        self.feed_model.deployment_seen.connect(lambda dep: self.deployment_filter.addItem(dep, dep))
+        self.feed_model.counts_changed.connect(self._update_feed_counts)
 
         self.parent=parent
         self._has_unread_alert = False
@@ -71,6 +104,12 @@ class PhoenixStaticPanel(QWidget):
         # === Swarm Feed ===
         feed_box = QGroupBox("🛰️ Swarm Feed")
         feed_layout = QVBoxLayout()
+        filter_row = QHBoxLayout()
+        filter_row.addWidget(self.level_filter)
+        filter_row.addWidget(self.deployment_filter)
+        filter_row.addWidget(self.agent_filter, stretch=1)
+        filter_row.addWidget(self.feed_counts)
+        feed_layout.addLayout(filter_row)
         feed_layout.addWidget(self.feed)
         feed_box.setLayout(feed_layout)
         layout.addWidget(feed_box)
@@ -107,10 +146,32 @@ class PhoenixStaticPanel(QWidget):
 
     def handle_feed_event(self, event: dict):
         """Routes incoming events from session processes to the feed."""
+        self.handle_feed_batch([event])
+
+    def handle_feed_batch(self, events: list):
+        """Route a batch of feed events into the feed model with one insert."""
+        try:
+            entries = []
+            alerted = False
+            for event in events:
+                entry = self._feed_entry_for(event)
+                if entry:
+                    entries.append(entry)
+                    alerted = alerted or bool(entry.get("new_alert"))
+            self._append_entries(entries)
+
+            if alerted:
+                self._has_unread_alert = True
+                self._update_static_tab_indicator()
+                self._play_alert_sound()  # once per batch, not once per alert
+        except Exception as e:
+            emit_gui_exception_log("PhoenixStaticPanel.handle_feed_batch", e)
+
+    def _feed_entry_for(self, event):
         try:
             if not isinstance(event, dict):
                 print("[FEED][WARN] Non-dict event:", event)
-                return
+                return None
 
             payload = event.get("payload", {})
             handler = payload.get("handler")
@@ -122,40 +183,67 @@ class PhoenixStaticPanel(QWidget):
             # If it’s an alert, go through _handle_swarm_alert()
             if handler == "swarm_feed.alert":
                 # Merge context so alerts know their origin
-                self._has_unread_alert = True
-                self._update_static_tab_indicator()
                 payload["deployment"] = deployment
                 payload["session_id"] = session_id
-                self._handle_swarm_alert(payload)
-            else:
-                # Normal event → format directly
-                msg = FeedFormatter.format({
-                    "deployment": deployment,
-                    "session_id": session_id,
-                    **event
-                })
-                self.feed.append(msg)
+                return self._handle_swarm_alert(payload)
 
+            # Normal event → formatted when first shown
+            merged = {"deployment": deployment, "session_id": session_id, **event}
+            return feed_entry(
+                "event", merged.get("level", "INFO"), merged.get("deployment"),
+                merged.get("session_id"), merged.get("agent", "?"), event=merged,
+            )
         except Exception as e:
-            emit_gui_exception_log("PhoenixStaticPanel.handle_feed_event", e)
+            emit_gui_exception_log("PhoenixStaticPanel._feed_entry_for", e)
+            return None
+
+    def _append_entries(self, entries):
+        if not entries:
+            return
+        bar = self.feed.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()  # only tail if the user hasn't scrolled up
+        self.feed_model.append_entries(entries)
+        if follow:
+            self.feed.scrollToBottom()
 
     def _append_feed_event(self, event: dict):
-        """Append a formatted event to the Swarm Feed console."""
+        """Append an event to the Swarm Feed console."""
         try:
-            msg = FeedFormatter.format(event)
-            self.feed.append(msg)
+            self._append_entries([feed_entry(
+                "event", event.get("level", "INFO"), event.get("deployment"),
+                event.get("session_id"), event.get("agent", "?"), event=event,
+            )])
         except Exception as e:
             emit_gui_exception_log("PhoenixStaticPanel._append_feed_event", e)
 
     def _on_inbound_message(self, session_id: str, channel: str, source: str, payload: dict, ts: float, **_):
         try:
-            t = time.strftime("%H:%M:%S", time.localtime(ts))
-            snippet = json.dumps(payload.get("content", payload), separators=(",", ":"), sort_keys=True)[:160]
-            line = f"[{t}] ({channel}) {source} » sess={session_id} :: {snippet}"
-            self.feed.append(line)
+            # the snippet is rendered from the payload only if the row is ever painted
+            self._append_entries([feed_entry(
+                "inbound", "INFO", "unknown", session_id, source,
+                channel=channel, source=source, payload=payload, ts_msg=ts,
+            )])
         except Exception as e:
             emit_gui_exception_log("PhoenixStaticPanel._on_inbound_message", e)
 
+    def _apply_feed_filters(self, *_):
+        try:
+            self.feed_proxy.set_filters(
+                level=self.level_filter.currentData(),
+                deployment=self.deployment_filter.currentData(),
+                agent=self.agent_filter.text(),
+            )
+        except Exception as e:
+            emit_gui_exception_log("PhoenixStaticPanel._apply_feed_filters", e)
+
+    def _update_feed_counts(self, counts: dict):
+        try:
+            self.feed_counts.setText("  ".join(f"{lvl} {n}" for lvl, n in sorted(counts.items())))
+            if self.feed_model.dropped:
+                self.feed_counts.setToolTip(f"{self.feed_model.dropped} older events scrolled out of the feed")
+        except Exception as e:
+            emit_gui_exception_log("PhoenixStaticPanel._update_feed_counts", e)
+
     def _update_static_tab_indicator(self):
         try:
             if not self.tab_widget or self.tab_index is None:
@@ -170,58 +258,84 @@ class PhoenixStaticPanel(QWidget):
 
 
     def _handle_swarm_alert(self, payload: dict):
-        """Handle alert packets with color, deduplication, and audio."""
+        """
+        Turn an alert packet into a feed entry.
+
+        Alerts from sessions arrive already aggregated (content["aggregate"]);
+        anything else goes through the cockpit's own AlertAggregator first.
+
+        Returns:
+            dict | None: The entry, or None for an empty or folded alert.
+        """
         try:
 
             #print(f"{payload}")
 
             content = payload.get("content", {}) or {}
-            msg = content.get("formatted_msg") or content.get("msg") or ""
-            if not msg:
-                return
-
-            level = content.get("level", "INFO").upper()
-            aliases = {
-                "CRIT": "CRITICAL", "CRITICAL": "CRITICAL",
-                "FATAL": "EMERGENCY", "SEVERE": "CRITICAL", "EMERG": "EMERGENCY",
-            }
-            level = aliases.get(level, level)
-
-            origin = content.get("origin", "unknown")
-            deployment = payload.get("deployment", "unknown")
-            session_id = payload.get("session_id", "unknown")
-
-            alert_id = content.get("id") or hashlib.md5(msg.encode()).hexdigest()
-            now = time.time()
-            if alert_id in self._recent_alerts and now - self._recent_alerts[alert_id] < 10:
-                return
-            self._recent_alerts[alert_id] = now
-
-            event = {
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "event_type": "alert",
-                "agent": origin,
-                "details": msg,
-                "level": level,
-                "status": "active",
-                "deployment": deployment,
-                "session_id": session_id,
-            }
-
-            formatted = FeedFormatter.format(event)
-            self.feed.append(formatted + "<br>")
-
-            # --- play sound ---
-            self._play_alert_sound()
+            if "aggregate" not in content:
+                payload = self.alert_aggregator.offer(payload)
+                if payload is None:
+                    return None
+            return self._alert_entry(payload)
 
         except Exception as e:
             emit_gui_exception_log("PhoenixStaticPanel._handle_swarm_alert", e)
+            return None
+
+    def _alert_entry(self, payload: dict):
+        content = payload.get("content", {}) or {}
+        msg = content.get("formatted_msg") or content.get("msg") or ""
+        if not msg:
+            return None
+
+        level = normalize_level(content.get("level", "INFO"))
+
+        origin = content.get("origin", "unknown")
+        deployment = payload.get("deployment", "unknown")
+        session_id = payload.get("session_id", "unknown")
+
+        agg = content.get("aggregate") or {}
+        count = agg.get("count", 1)
+        if count > 1:
+            since = time.strftime("%H:%M:%S", time.localtime(agg.get("since", time.time())))
+            msg = f"{msg}  ×{count} since {since}"
+
+        event = {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "event_type": "alert",
+            "agent": origin,
+            "details": msg,
+            "level": level,
+            "status": "active",
+            "deployment": deployment,
+            "session_id": session_id,
+        }
+        return feed_entry(
+            "event", level, deployment, session_id, origin, event=event,
+            merge_key=f"{session_id}|{agg['key']}" if agg.get("key") else None,
+            repeats=agg.get("repeats") or 1,
+            new_alert=count == 1,
+        )
+
+    def _flush_alerts(self):
+        """Post the cockpit aggregator's '×N' summaries."""
+        try:
+            entries = [self._alert_entry(p) for p in self.alert_aggregator.flush()]
+            self._append_entries([e for e in entries if e])
+        except Exception as e:
+            emit_gui_exception_log("PhoenixStaticPanel._flush_alerts", e)
 
     def _play_alert_sound(self):
-        """Play the selected WAV through the OS if checkbox is on."""
+        """Play the selected WAV through the OS if checkbox is on; one player per burst."""
         if not self.play_sound_checkbox.isChecked():
             return
 
+        now = time.time()
+        quiet = now - self._last_sound_ts >= ALERT_SOUND_GAP
+        self._last_sound_ts = now
+        if not quiet or (self._sound_proc and self._sound_proc.poll() is None):
+            return
+
         def _worker():
             try:
 
@@ -230,9 +344,9 @@ class PhoenixStaticPanel(QWidget):
                 if platform.system() == "Windows":
                     winsound.PlaySound(sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC)
                 elif platform.system() == "Darwin":
-                    subprocess.Popen(["afplay", sound_path])
+                    self._sound_proc = subprocess.Popen(["afplay", sound_path])
                 else:
-                    subprocess.Popen(["aplay", sound_path])
+                    self._sound_proc = subprocess.Popen(["aplay", sound_path])
             except Exception as e:
                 print(f"[ALERT-SOUND][ERROR] {e}")
 
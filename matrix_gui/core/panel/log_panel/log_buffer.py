@@ -0,0 +1,93 @@
+from array import array
+
+# level codes, resolved lazily per slot (UNSET until a view asks for it)
+UNSET, OTHER, INFO, WARN, ERROR = -1, 0, 1, 2, 3
+
+
+def classify(line: str) -> int:
+    if "[ERROR]" in line:
+        return ERROR
+    if "[WARN" in line:
+        return WARN
+    if "[INFO]" in line:
+        return INFO
+    return OTHER
+
+
+class LogRingBuffer:
+    """
+    Fixed-capacity scrollback of log lines.
+
+    Lines are stored UTF-8 encoded in a preallocated slot list (a bytes
+    object is far smaller than the str it came from, and no Qt text block
+    or char format is kept per line). Appending is O(1); once full, every
+    new line overwrites the oldest and bumps `dropped`. Row i is always the
+    i-th oldest line still held.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._slots = [None] * self.capacity
+        self._levels = array("b", [UNSET]) * self.capacity
+        self._start = 0
+        self._count = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self._count
+
+    def _slot(self, row: int) -> int:
+        return (self._start + row) % self.capacity
+
+    def append(self, line):
+        data = str(line).encode("utf-8", "replace")
+        if self._count < self.capacity:
+            i = self._slot(self._count)
+            self._count += 1
+        else:
+            i = self._start
+            self._start = (self._start + 1) % self.capacity
+            self.dropped += 1
+        self._slots[i] = data
+        self._levels[i] = UNSET
+
+    def extend(self, lines):
+        for line in lines:
+            self.append(line)
+
+    def drop_front(self, n: int):
+        """Discard the n oldest lines (counted as dropped)."""
+        n = min(n, self._count)
+        for _ in range(n):
+            self._slots[self._start] = None
+            self._start = (self._start + 1) % self.capacity
+        self._count -= n
+        self.dropped += n
+
+    def line(self, row: int) -> str:
+        return self._slots[self._slot(row)].decode("utf-8", "replace")
+
+    def level(self, row: int) -> int:
+        i = self._slot(row)
+        level = self._levels[i]
+        if level == UNSET:
+            level = self._levels[i] = classify(self.line(row))
+        return level
+
+    def lines(self):
+        return [self.line(row) for row in range(self._count)]
+
+    def resize(self, capacity: int):
+        """Change the scrollback, keeping the newest lines that still fit."""
+        kept = self.lines()
+        dropped = self.dropped
+        self.__init__(capacity)
+        self.dropped = dropped + max(0, len(kept) - self.capacity)
+        self.extend(kept[-self.capacity:])
+
+    def clear(self, reset_dropped: bool = True):
+        self._slots = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        if reset_dropped:
+            self.dropped = 0
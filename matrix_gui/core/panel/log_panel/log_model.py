@@ -0,0 +1,82 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor
+from matrix_gui.core.panel.log_panel.log_buffer import LogRingBuffer, OTHER, INFO, WARN, ERROR
+
+
+class LogLineModel(QAbstractListModel):
+    """
+    List model over a LogRingBuffer.
+
+    The view only asks data() for rows it is painting, so decoding and
+    level colouring happen for visible lines only; the four brushes are
+    shared by every row.
+    """
+    _brushes = None
+
+    def __init__(self, capacity: int, parent=None):
+        super().__init__(parent)
+        self.buffer = LogRingBuffer(capacity)
+        if LogLineModel._brushes is None:
+            LogLineModel._brushes = {
+                OTHER: QBrush(QColor("gray")),
+                INFO: QBrush(QColor("green")),
+                WARN: QBrush(QColor("orange")),
+                ERROR: QBrush(QColor("red")),
+            }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.buffer)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self.buffer):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.buffer.line(row)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes[self.buffer.level(row)]
+        return None
+
+    # -----------------------------
+    def append_lines(self, lines):
+        """
+        Append a batch, evicting the oldest rows once the scrollback is full.
+
+        Returns:
+            int: Lines evicted by this batch.
+        """
+        n = len(lines)
+        if not n:
+            return 0
+        cap = self.buffer.capacity
+        before = self.buffer.dropped
+
+        if n >= cap:
+            self.beginResetModel()
+            self.buffer.drop_front(len(self.buffer))
+            self.buffer.dropped += n - cap
+            self.buffer.extend(lines[-cap:])
+            self.endResetModel()
+            return self.buffer.dropped - before
+
+        overflow = len(self.buffer) + n - cap
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self.buffer.drop_front(overflow)
+            self.endRemoveRows()
+
+        first = len(self.buffer)
+        self.beginInsertRows(QModelIndex(), first, first + n - 1)
+        self.buffer.extend(lines)
+        self.endInsertRows()
+        return self.buffer.dropped - before
+
+    def set_capacity(self, capacity: int):
+        self.beginResetModel()
+        self.buffer.resize(capacity)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.buffer.clear()
+        self.endResetModel()
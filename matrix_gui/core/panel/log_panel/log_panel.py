@@ -1,84 +1,92 @@
-from PyQt6.QtWidgets import QPlainTextEdit
-from PyQt6.QtGui import QFont, QTextCursor
+import os
+from PyQt6.QtWidgets import QListView, QAbstractItemView, QApplication
+from PyQt6.QtGui import QFont, QKeySequence
 from PyQt6.QtCore import QTimer, pyqtSignal
-from PyQt6.QtGui import QTextCharFormat, QColor
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
-from matrix_gui.core.utils.threaded_timer import ThreadedTimer
+from matrix_gui.core.panel.log_panel.log_model import LogLineModel
 from collections import deque
-CHUNK_SIZE = 200
 
-class LogPanel(QPlainTextEdit):
+SCROLLBACK = int(os.getenv("MATRIX_LOG_SCROLLBACK", "20000"))
+
+class LogPanel(QListView):
+    """
+    Agent log tail: a list view over a fixed-size ring of lines.
+
+    Memory stays flat however long an agent is tailed; once the scrollback
+    is full the oldest lines fall off and are counted in `dropped`. Rows
+    have uniform height and are only formatted while visible, so appending
+    costs the same at line 10 as at line 10 million.
+    """
     line_count_changed = pyqtSignal(int)
 
-    def __init__(self, bus, parent=None):
+    def __init__(self, bus=None, parent=None, scrollback: int = None):
         super().__init__(parent)
-        self.refresh_timer = ThreadedTimer(100)
-        self.refresh_timer.tick.connect(self._refresh_logs)
         try:
             self.bus = bus
-            self.setReadOnly(True)
+            self.log_model = LogLineModel(scrollback or SCROLLBACK, self)
+            self.setModel(self.log_model)
+
             self.setFont(QFont("Courier New", 9))           # monospace
-            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)     # no wrapping
+            self.setUniformItemSizes(True)                  # row height never measured per line
+            self.setWordWrap(False)                         # no wrapping
+            self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
-            self._line_count = 0
             self._pending_lines = deque()
+            self._follow = True  # tail new lines (unless the user scrolled up)
 
             # timer for safe batch flush
             self._flush_timer = QTimer(self)
             self._flush_timer.timeout.connect(self._flush_lines)
-            self._flush_timer.start(50)  # 30ms is smooth for logs, but you can tune
+            self._flush_timer.start(50)
         except Exception as e:
             emit_gui_exception_log("log_panel.__init__", e)
 
-    def _refresh_logs(self):
-        """Background tick: triggers GUI flush."""
-        try:
-            self._flush_lines()
-        except Exception as e:
-            emit_gui_exception_log("LogPanel._refresh_logs", e)
-
     def append_log_lines(self, lines):
         if not lines:
             return
         self._pending_lines.extend(lines)
 
-    def _append_colored_line(self, line: str):
+    def _flush_lines(self):
 
         try:
+            if not self._pending_lines:
+                return
 
-            fmt = QTextCharFormat()
-            if "[ERROR]" in line:
-                fmt.setForeground(QColor("red"))
-            elif "[WARN" in line or "[WARNING]" in line:
-                fmt.setForeground(QColor("orange"))
-            elif "[INFO]" in line:
-                fmt.setForeground(QColor("green"))
-            else:
-                fmt.setForeground(QColor("gray"))
-
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            cursor.insertText(line + "\n", fmt)
-        except Exception as e:
-            emit_gui_exception_log("LogPanel._flush_lines", e)
+            lines = list(self._pending_lines)
+            self._pending_lines.clear()
 
-    def _flush_lines(self):
+            bar = self.verticalScrollBar()
+            follow = self._follow and bar.value() >= bar.maximum()  # only tail if the user hasn't scrolled up
 
-        try:
-            count = 0
-            while self._pending_lines and count < CHUNK_SIZE:
-                line = self._pending_lines.popleft()
-                self._append_colored_line(str(line))
-                count += 1
-
-            if count > 0:
-                self._line_count += count
-                self.line_count_changed.emit(self._line_count)
-                self.moveCursor(QTextCursor.MoveOperation.End)
-                self.ensureCursorVisible()
+            self.log_model.append_lines(lines)
+            self.line_count_changed.emit(len(self.log_model.buffer))
+            if follow:
+                self.scrollToBottom()
         except Exception as e:
             emit_gui_exception_log("LogPanel._flush_lines", e)
 
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            QApplication.clipboard().setText(self.selected_text())
+            return
+        super().keyPressEvent(event)
+
+    def all_text(self) -> str:
+        """Every line in the scrollback."""
+        return "\n".join(self.log_model.buffer.lines())
+
+    def selected_text(self) -> str:
+        """The selected lines, in order."""
+        rows = sorted(i.row() for i in self.selectedIndexes())
+        return "\n".join(self.log_model.buffer.line(r) for r in rows)
+
+    def set_follow(self, follow: bool):
+        """Turn tailing on (jumping to the newest line) or off."""
+        self._follow = bool(follow)
+        if self._follow:
+            self.scrollToBottom()
+
     def handle_log_update(self, token, lines, paused: bool):
         try:
             if token != self.get_active_token():
@@ -88,21 +96,33 @@ class LogPanel(QPlainTextEdit):
         except Exception as e:
             emit_gui_exception_log("log_panel.handle_log_update", e)
 
-
     @property
     def line_count(self):
-        return self._line_count
+        return len(self.log_model.buffer)
+
+    @property
+    def dropped(self):
+        """Lines that have scrolled out of the scrollback since the last reset."""
+        return self.log_model.buffer.dropped
+
+    def set_scrollback(self, lines: int):
+        try:
+            self.log_model.set_capacity(lines)
+            self.line_count_changed.emit(len(self.log_model.buffer))
+        except Exception as e:
+            emit_gui_exception_log("log_panel.set_scrollback", e)
+
+    def clear(self):
+        self._pending_lines.clear()
+        self.log_model.clear()
 
     def set_active_token(self, token: str):
         try:
             self._active_token = token
             self.clear()
-            self._line_count = 0
             self.line_count_changed.emit(0)
         except Exception as e:
             emit_gui_exception_log("log_panel.set_active_token", e)
 
-
-
     def get_active_token(self) -> str:
-        return getattr(self, "_active_token", None)
\ No newline at end of file
+        return getattr(self, "_active_token", None)
@@ -34,7 +34,6 @@ class PhoenixTabStack(QWidget):
 
         # a shared console fallback if individual tab consoles aren't available
         self.feed_console = LogPanel()
-        self.feed_console.setReadOnly(True)
         self.feed_console.hide()
 
         self.feed_console.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -194,7 +193,6 @@ class PhoenixTabStack(QWidget):
         log_layout = QVBoxLayout(log_box)
         log_console = LogPanel()
 
-        log_console.setReadOnly(True)
         log_console.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         log_layout.addWidget(log_console)
         splitter.addWidget(log_box)
@@ -203,19 +201,19 @@ class PhoenixTabStack(QWidget):
         controls_layout = QHBoxLayout()
 
         copy_all_btn = QPushButton("📋 Copy All")
-        copy_all_btn.clicked.connect(lambda: QApplication.clipboard().setText(log_console.toPlainText()))
+        copy_all_btn.clicked.connect(lambda: QApplication.clipboard().setText(log_console.all_text()))
         controls_layout.addWidget(copy_all_btn)
 
         copy_sel_btn = QPushButton("📑 Copy Selection")
-        copy_sel_btn.clicked.connect(lambda: QApplication.clipboard().setText(log_console.textCursor().selectedText()))
+        copy_sel_btn.clicked.connect(lambda: QApplication.clipboard().setText(log_console.selected_text()))
         controls_layout.addWidget(copy_sel_btn)
 
         stop_follow_btn = QPushButton("⏹️ Stop Following")
-        stop_follow_btn.clicked.connect(lambda: setattr(log_console, "_autoscroll", False))
+        stop_follow_btn.clicked.connect(lambda: log_console.set_follow(False))
         controls_layout.addWidget(stop_follow_btn)
 
         follow_btn = QPushButton("▶️ Follow")
-        follow_btn.clicked.connect(lambda: setattr(log_console, "_autoscroll", True))
+        follow_btn.clicked.connect(lambda: log_console.set_follow(True))
         controls_layout.addWidget(follow_btn)
 
         log_layout.addLayout(controls_layout)
@@ -286,8 +284,7 @@ class PhoenixTabStack(QWidget):
     def _make_tab_widget(self, title: str) -> QWidget:
         w = QWidget(self)
         l = QVBoxLayout(w)
-        console = LogPanel(w)
-        console.setReadOnly(True)
+        console = LogPanel(parent=w)
         l.addWidget(console)
         # keep a handle for appenders
         w.console = console  # type: ignore[attr-defined]
@@ -0,0 +1,140 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import os
+import time
+from multiprocessing import Process, Pipe
+from matrix_gui.core.session_window import run_warm_session
+
+
+class SessionPool:
+    """
+    Pre-started session processes waiting for a deployment.
+
+    Each worker has already imported the matrix_gui tree, created its
+    QApplication and applied the Hive theme, then parks on its pipe until
+    launch_session() sends it the usual 'init' message. Opening a
+    deployment tab then costs only the connect and the window build.
+
+    The pool is off unless sized (MATRIX_SESSION_POOL or configure()).
+    Workers idle longer than `idle_ttl` seconds are retired and replaced
+    on the next recycle(), so long-lived cockpits never hand out stale
+    processes.
+
+        MATRIX_SESSION_POOL=2 MATRIX_SESSION_POOL_IDLE=900 python phoenix.py
+    """
+    size = int(os.getenv("MATRIX_SESSION_POOL", "0"))
+    idle_ttl = float(os.getenv("MATRIX_SESSION_POOL_IDLE", "600"))
+
+    _idle = []       # [{"proc", "conn", "born", "ready"}], oldest first
+    _retiring = []   # [(process, retired_at)] told to exit, reaped by recycle()
+    stats = {"spawned": 0, "hits": 0, "misses": 0, "recycled": 0}
+
+    # -----------------------------
+    @classmethod
+    def configure(cls, size: int = None, idle_ttl: float = None):
+        """
+        Resize the pool and/or change how long a worker may sit idle.
+
+        Args:
+            size (int, optional): Warm workers to keep (0 disables the pool).
+            idle_ttl (float, optional): Seconds before an idle worker is replaced.
+        """
+        if size is not None:
+            cls.size = max(0, int(size))
+        if idle_ttl is not None:
+            cls.idle_ttl = float(idle_ttl)
+        while len(cls._idle) > cls.size:
+            cls._retire(cls._idle.pop(0))
+        cls.fill()
+
+    @classmethod
+    def fill(cls):
+        """Start workers until the pool is at size."""
+        while len(cls._idle) < cls.size:
+            parent_conn, child_conn = Pipe()
+            proc = Process(target=run_warm_session, args=(child_conn,))
+            proc.start()
+            child_conn.close()
+            cls._idle.append({"proc": proc, "conn": parent_conn, "born": time.time(), "ready": False})
+            cls.stats["spawned"] += 1
+
+    @classmethod
+    def take(cls):
+        """
+        Hand out a warm worker, preferring one that has finished warming up.
+
+        Returns:
+            tuple | None: (process, parent_conn), or None if the pool is empty
+                          (the caller starts a cold process as before).
+        """
+        cls._prune()
+        if not cls._idle:
+            if cls.size:
+                cls.stats["misses"] += 1
+            return None
+
+        worker = next((w for w in cls._idle if cls._is_ready(w)), cls._idle[0])
+        cls._idle.remove(worker)
+        cls.stats["hits"] += 1
+        cls.fill()
+        return worker["proc"], worker["conn"]
+
+    @classmethod
+    def recycle(cls):
+        """Replace workers idle past idle_ttl and reap retired ones. Call periodically."""
+        now = time.time()
+        for worker in [w for w in cls._idle if now - w["born"] > cls.idle_ttl]:
+            cls._idle.remove(worker)
+            cls._retire(worker)
+            cls.stats["recycled"] += 1
+
+        for entry in list(cls._retiring):
+            proc, retired_at = entry
+            if proc.is_alive() and now - retired_at > 5:
+                proc.terminate()
+            if not proc.is_alive():
+                proc.join(timeout=0)
+                cls._retiring.remove(entry)
+
+        cls._prune()
+        cls.fill()
+
+    @classmethod
+    def shutdown(cls):
+        """Stop every idle worker (cockpit exit)."""
+        for worker in cls._idle:
+            cls._retire(worker)
+        cls._idle.clear()
+        for proc, _ in cls._retiring:
+            if proc.is_alive():
+                proc.terminate()
+        cls._retiring.clear()
+
+    @classmethod
+    def idle_count(cls) -> int:
+        return len(cls._idle)
+
+    # -----------------------------
+    @classmethod
+    def _is_ready(cls, worker) -> bool:
+        try:
+            while not worker["ready"] and worker["conn"].poll():
+                if worker["conn"].recv().get("type") == "warm_ready":
+                    worker["ready"] = True
+        except (EOFError, OSError):
+            return False
+        return worker["ready"]
+
+    @classmethod
+    def _prune(cls):
+        for worker in [w for w in cls._idle if not w["proc"].is_alive() or w["conn"].closed]:
+            print(f"[SESSION-POOL][WARN] Warm worker pid={worker['proc'].pid} died while idle.")
+            cls._idle.remove(worker)
+
+    @classmethod
+    def _retire(cls, worker):
+        try:
+            worker["conn"].send({"type": "retire"})
+            worker["conn"].close()
+        except (BrokenPipeError, OSError):
+            pass
+        cls._retiring.append((worker["proc"], time.time()))
@@ -1,4 +1,5 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import os
 import sys
 import time
 import datetime
@@ -7,7 +8,7 @@ import inspect
 import copy
 from PyQt6 import QtWidgets
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QSize, QTimer, QMetaObject, Qt, Q_ARG, pyqtSlot
+from PyQt6.QtCore import QSize, QTimer, QMetaObject, Qt, Q_ARG, pyqtSlot, QSocketNotifier
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QToolBar,
     QGroupBox, QApplication, QMainWindow, QStackedWidget, QLabel, QMessageBox
@@ -21,6 +22,7 @@ from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
 from matrix_gui.core.panel.log_panel.log_panel import LogPanel
 from matrix_gui.core.panel.agent_tree.agent_tree import PhoenixAgentTree
 from matrix_gui.modules.net.deployment_connector import _connect_single
+from matrix_gui.modules.net.connector.egress.https.https_pool import HTTPSConnectionPool
 from matrix_gui.core.dispatcher.inbound_dispatcher import InboundDispatcher
 from matrix_gui.core.dispatcher.outbound_dispatcher import OutboundDispatcher
 from matrix_gui.config.boot.globals import get_sessions
@@ -31,6 +33,8 @@ from matrix_gui.core.panel.inject_agent_panel import InjectAgentPanel
 from matrix_gui.core.panel.multiplexer_panel import MultiplexerPanel
 from matrix_gui.core.panel.control_bar import ControlBar
 from matrix_gui.modules.vault.services.vault_connection_singleton import VaultConnectionSingleton
+from matrix_gui.core.utils.feed_ring import FeedRing
+from matrix_gui.core.class_lib.feed.alert_aggregator import AlertAggregator
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.modules.directive.deploy_dialog import DeployDialog
 
@@ -45,6 +49,36 @@ def run_session(session_id, conn):
         - Session instance: The configured session object.
     """
 
+    app = _prepare_session_app()
+    try:
+        msg = conn.recv()
+    except (EOFError, OSError) as e:
+        emit_gui_exception_log("session_window.run_session", e)
+        return
+    _serve_session(app, session_id, conn, msg)
+
+
+def run_warm_session(conn):
+    """
+    Session pool worker: warm up now, become a session when the cockpit sends 'init'.
+
+    Imports, the QApplication and the theme are ready before any deployment
+    is chosen; the worker then blocks on its pipe. 'retire' (or a closed
+    pipe) ends it without ever opening a window.
+    """
+    app = _prepare_session_app()
+    try:
+        conn.send({"type": "warm_ready", "pid": os.getpid()})
+        msg = conn.recv()
+    except (EOFError, OSError):
+        return
+    if msg.get("type") != "init":
+        return
+    _serve_session(app, msg.get("session_id"), conn, msg)
+
+
+def _prepare_session_app():
+    """Create the session's QApplication and apply the Hive theme."""
     app = QApplication.instance() or QApplication(sys.argv)
 
     # --- Dynamically locate and load the global Hive theme ---
@@ -71,9 +105,13 @@ def run_session(session_id, conn):
     except Exception as e:
         emit_gui_exception_log("[SESSION][ERROR] Failed to load theme dynamically:", e)
 
+    return app
+
+
+def _serve_session(app, session_id, conn, msg):
+    """Build the session window from the cockpit's 'init' message and run it."""
     try:
 
-        msg = conn.recv()
         deployment = copy.deepcopy(msg.get("deployment"))
 
         # --- Preflight validation: require ingress + egress ---
@@ -127,6 +165,14 @@ def run_session(session_id, conn):
 
         print(f"[DEBUG] Bus ID for session {session_id}: {id(ctx.bus)}")
 
+        # bulk feed events go through the cockpit's shared-memory ring when it offered one
+        feed_ring = None
+        if msg.get("feed_ring"):
+            try:
+                feed_ring = FeedRing.attach(msg["feed_ring"]["name"], msg["feed_ring"].get("policy"))
+            except Exception as e:
+                print(f"[SESSION][WARN] Feed ring attach failed, feed stays on the pipe: {e}")
+
         win = SessionWindow(
             deployment_id=deployment.get("id"),
             session_id=ctx.id,
@@ -136,7 +182,8 @@ def run_session(session_id, conn):
             bus=ctx.bus,
             inbound=inbound,
             outbound=outbound,
-            ctx=ctx
+            ctx=ctx,
+            feed_ring=feed_ring
         )
 
         win.start_pipe_timer()
@@ -168,9 +215,16 @@ def run_session(session_id, conn):
 
 
 class SessionWindow(QMainWindow):
-    def __init__(self, deployment_id, session_id, cockpit_id, deployment, conn, bus, inbound, outbound, ctx):
+    def __init__(self, deployment_id, session_id, cockpit_id, deployment, conn, bus, inbound, outbound, ctx, feed_ring=None):
         super().__init__()
         try:
+            self.feed_ring = feed_ring
+
+            # repeats are folded here, before they cross to the cockpit
+            self.alert_aggregator = AlertAggregator()
+            self._alert_timer = QTimer(self)
+            self._alert_timer.timeout.connect(self._flush_alerts)
+            self._alert_timer.start(1000)
 
             self.deployment_id=deployment_id
             self.deployment = deployment
@@ -294,16 +348,36 @@ class SessionWindow(QMainWindow):
             emit_gui_exception_log("session_window.__init__", e)
 
     def start_pipe_timer(self):
+        # On POSIX the pipe is a selectable fd: wake the moment the cockpit writes and drain
+        # everything pending. The timer stays as a slow sweep for messages a vault fetch set
+        # aside (and is the only driver where no fd is available).
+        self._pipe_notifier = None
+        interval = 200
+        if os.name == "posix" and self.conn:
+            try:
+                self._pipe_notifier = QSocketNotifier(self.conn.fileno(), QSocketNotifier.Type.Read, self)
+                self._pipe_notifier.activated.connect(lambda *_: self._poll_conn())
+                interval = 1000
+            except Exception as e:
+                print(f"[SESSION][PIPE] Socket notifier unavailable, polling instead: {e}")
+                self._pipe_notifier = None
+
         self._pipe_timer = QTimer(self)
         self._pipe_timer.timeout.connect(self._poll_conn)
-        self._pipe_timer.start(200)
+        self._pipe_timer.start(interval)
 
     def _poll_conn(self):
         if not self.conn:
             return
         try:
+            # messages a vault fetch read off the pipe while it waited come first
+            pending = self.vault_singleton.take_deferred()
             while self.conn.poll():
-                msg = self.conn.recv()
+                pending.append(self.conn.recv())
+
+            for msg in pending:
+                if self.vault_singleton.handle_message(msg):
+                    continue
                 mtype = msg.get("type")
                 if mtype == "force_close":
                     print(f"[SESSION] 🧨 Received external close for {self.session_id}")
@@ -312,6 +386,8 @@ class SessionWindow(QMainWindow):
         except (EOFError, OSError):
             print(f"[SESSION][PIPE] Lost pipe for {self.session_id}")
             self._pipe_timer.stop()
+            if self._pipe_notifier:
+                self._pipe_notifier.setEnabled(False)
 
     def _send_heartbeat(self):
         try:
@@ -789,8 +865,10 @@ class SessionWindow(QMainWindow):
 
             # Show log status on the inside label (not the border)
             count = getattr(self, "_last_log_count", 0)
+            dropped = self.log_view.dropped
+            dropped_str = f", {dropped} dropped" if dropped else ""
             self.log_status_label.setText(
-                f"Agent Logs: {label} ({mode} at {time_str} – {count} lines)"
+                f"Agent Logs: {label} ({mode} at {time_str} – {count} lines{dropped_str})"
             )
 
         except Exception as e:
@@ -828,13 +906,28 @@ class SessionWindow(QMainWindow):
 
     def _handle_swarm_alert(self, session_id, channel, source, payload, **_):
         try:
-            if self.conn:
-
-                self.conn.send({"type": "swarm_feed" , "event": {"payload": payload, "session_id": self.session_id}})
+            payload = self.alert_aggregator.offer(payload)
+            if payload is not None:
+                self._forward_alert(payload)
 
         except Exception as e:
             emit_gui_exception_log("SessionWindow._handle_swarm_alert", e)
 
+    def _flush_alerts(self):
+        """Send the '×N since' summaries for alerts folded since the last tick."""
+        try:
+            for payload in self.alert_aggregator.flush():
+                self._forward_alert(payload)
+        except Exception as e:
+            emit_gui_exception_log("SessionWindow._flush_alerts", e)
+
+    def _forward_alert(self, payload):
+        event = {"payload": payload, "session_id": self.session_id}
+        if self.feed_ring and self.feed_ring.push(event):
+            return
+        if self.conn:
+            self.conn.send({"type": "swarm_feed", "event": event})
+
 
     def _handle_external_close(self):
         """Called when cockpit sends {'type': 'force_close'} over the pipe."""
@@ -870,6 +963,11 @@ class SessionWindow(QMainWindow):
             self.bus.off("gui.agent.selected", self._handle_agent_selected)
             self.bus.off("gui.log.token.updated", self._set_active_log_token)
 
+            self._alert_timer.stop()
+            if self.feed_ring:
+                self.feed_ring.close()
+                self.feed_ring = None
+
             for panel in self._panel_cache.values():
                 try:
                     #panel._disconnect_signals()
@@ -882,6 +980,8 @@ class SessionWindow(QMainWindow):
                 launcher = self.ctx.group.get("connection_launcher", None)
                 if launcher:
                     launcher.destroy_all()
+                    HTTPSConnectionPool.close_session(self.ctx.id)
+                    self.inbound_dispatcher.close()
                     self.unhook_bus_handlers()
                     print("[SESSION_WINDOW] ✅ All connections destroyed.")
                 else:
@@ -1,44 +1,71 @@
 import os
 import ssl
+import sys
 import tempfile
-import uuid
 import hashlib
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization
 from matrix_gui.core.utils.spki_utils import extract_spki_pin_from_der
 
-def load_cert_chain_from_memory(ctx: ssl.SSLContext, cert_pem: str, key_pem: str):
+
+def _pem_handle(pem: str, suffix: str):
     """
-    Load cert and key from memory into SSLContext securely.
-    Returns: pin (SHA256 of SPKI)
+    Expose a PEM string as a filesystem path for ssl.load_cert_chain().
+
+    On Linux an anonymous memfd is used, so nothing touches the disk.
+    Elsewhere a private temp file is written and must be released by the caller.
+
+    Returns:
+        (str, callable): Path to hand to OpenSSL, and a release function.
     """
-    unique_id = uuid.uuid4().hex[:6]
+    if hasattr(os, "memfd_create") and sys.platform.startswith("linux"):
+        fd = os.memfd_create(f"phoenix{suffix}", 0)
+        os.write(fd, pem.encode())
+        return f"/proc/self/fd/{fd}", lambda: os.close(fd)
+
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "w") as f:
+        f.write(pem)
+
+    def _release():
+        if os.path.exists(path):
+            os.remove(path)
+
+    return path, _release
 
-    temp_dir = tempfile.gettempdir()
-    cert_path = os.path.join(temp_dir, f"cert_{unique_id}.pem")
-    key_path  = os.path.join(temp_dir, f"key_{unique_id}.pem")
 
+def load_cert_chain_pem(ctx: ssl.SSLContext, cert_pem: str, key_pem: str):
+    """
+    Load a client cert/key pair from memory into an SSLContext.
+    Any file handle used to reach OpenSSL is released before returning.
+    """
+    cert_path, release_cert = _pem_handle(cert_pem, ".crt")
     try:
-        with open(cert_path, "w") as cert_file:
-            cert_file.write(cert_pem)
-        with open(key_path, "w") as key_file:
-            key_file.write(key_pem)
+        key_path, release_key = _pem_handle(key_pem, ".key")
+        try:
+            ctx.load_cert_chain(certfile=cert_path, keyfile=key_path)
+        finally:
+            release_key()
+    finally:
+        release_cert()
 
-        ctx.load_cert_chain(certfile=cert_path, keyfile=key_path)
 
-        fingerprint = hashlib.sha256(cert_pem.encode()).hexdigest()[:16]
-        print(f"[CERT_LOADER] Loaded cert_fp={fingerprint} → {os.path.normpath(cert_path)}")
+def load_cert_chain_from_memory(ctx: ssl.SSLContext, cert_pem: str, key_pem: str):
+    """
+    Load cert and key from memory into SSLContext securely.
+    Returns: (pin, None, None) — pin is the SHA256 of the client SPKI; no
+    temp files outlive this call, the trailing Nones keep the old tuple shape.
+    """
+    load_cert_chain_pem(ctx, cert_pem, key_pem)
 
-        cert = x509.load_pem_x509_certificate(cert_pem.encode())
-        cert_der = cert.public_bytes(serialization.Encoding.DER)
-        pin = extract_spki_pin_from_der(cert_der)
+    fingerprint = hashlib.sha256(cert_pem.encode()).hexdigest()[:16]
+    print(f"[CERT_LOADER] Loaded cert_fp={fingerprint} (in-memory)")
 
-        return pin, cert_path, key_path
+    cert = x509.load_pem_x509_certificate(cert_pem.encode())
+    cert_der = cert.public_bytes(serialization.Encoding.DER)
+    pin = extract_spki_pin_from_der(cert_der)
 
-    finally:
-        # DO NOT delete immediately; let TLS handshake fully complete
-        print(f"[CERT_LOADER] 🔐 Temp files retained for TLS use: "
-              f"{os.path.normpath(cert_path)}, {os.path.normpath(key_path)}")
+    return pin, None, None
 
 
 
@@ -3,11 +3,10 @@ import base64
 import time
 
 from Crypto.Random import get_random_bytes
-from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
 
-from Crypto.Cipher import AES, PKCS1_OAEP
-from Crypto.PublicKey import RSA
+from Crypto.Cipher import AES
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache, CachedRSAKey
+from matrix_gui.core.utils.signing_suites import sign_bytes, verify_bytes
 
 def generate_aes_key():
     b = get_random_bytes(32)
@@ -15,17 +14,18 @@ def generate_aes_key():
 
 def sign_data(payload: dict, priv_key) -> str:
     """
-    Signs a payload dictionary using the provided private key object.
-    Automatically excludes the 'sig' field from signing.
+    Signs a payload dictionary using the provided private key object
+    (RsaKey, Ed25519 EccKey or a cached key). The key's suite picks
+    RSA PKCS#1 v1.5 over SHA-256 or Ed25519. Automatically excludes the
+    'sig' field from signing.
 
     Returns:
         Base64-encoded signature string
     """
     payload_to_sign = {k: v for k, v in payload.items() if k != "sig"}
     serialized = json.dumps(payload_to_sign, sort_keys=True, separators=(",", ":")).encode()
-    digest = SHA256.new(serialized)
 
-    signature = pkcs1_15.new(priv_key).sign(digest)
+    signature = sign_bytes(priv_key, serialized)
     return base64.b64encode(signature).decode()
 
 
@@ -48,8 +48,7 @@ def build_identity_chain(agent_uid, child_pub_key, parent_priv_key_obj, parent_c
         "timestamp": entry["timestamp"]
     }, sort_keys=True).encode()
 
-    digest = SHA256.new(payload_to_sign)
-    signature = pkcs1_15.new(parent_priv_key_obj).sign(digest)
+    signature = sign_bytes(parent_priv_key_obj, payload_to_sign)
     entry["signature"] = base64.b64encode(signature).decode()
 
     chain.append(entry)
@@ -67,8 +66,7 @@ class SignedAgentTreeBuilder:
             "timestamp": signed_time
         }
 
-        digest = SHA256.new(json.dumps(payload, sort_keys=True).encode())
-        signature = pkcs1_15.new(self.private_key).sign(digest)
+        signature = sign_bytes(self.private_key, json.dumps(payload, sort_keys=True).encode())
         payload["sig"] = base64.b64encode(signature).decode()
 
         return payload
@@ -85,8 +83,7 @@ def generate_identity_token(agent_uid: str, pub_key_pem: str, matrix_priv_key_ob
         "timestamp": int(time.time())
     }
 
-    digest = SHA256.new(json.dumps(payload, sort_keys=True).encode())
-    signature = pkcs1_15.new(matrix_priv_key_obj).sign(digest)
+    signature = sign_bytes(matrix_priv_key_obj, json.dumps(payload, sort_keys=True).encode())
     payload["sig"] = base64.b64encode(signature).decode()
 
     return payload
@@ -104,10 +101,9 @@ def verify_identity_token(token: dict, matrix_pub_key_obj):
             "timestamp": token["timestamp"]
         }
 
-        digest = SHA256.new(json.dumps(payload, sort_keys=True).encode())
         signature = base64.b64decode(token["sig"])
 
-        pkcs1_15.new(matrix_pub_key_obj).verify(digest, signature)
+        verify_bytes(matrix_pub_key_obj, json.dumps(payload, sort_keys=True).encode(), signature)
         return True, "Valid"
     except Exception as e:
         return False, f"Invalid: {e}"
@@ -115,7 +111,8 @@ def verify_identity_token(token: dict, matrix_pub_key_obj):
 
 def encrypt_with_ephemeral_aes(data: dict, remote_pub_pem: str):
     """
-    Encrypts a dict with an ephemeral AES key, sealed with remote_pubkey.
+    Encrypts a dict with an ephemeral AES key, sealed with remote_pubkey
+    (PEM or CachedRSAKey).
     Returns { encrypted_key, payload, nonce, tag } base64-encoded.
     """
     raw = json.dumps(data, sort_keys=True).encode()
@@ -126,9 +123,7 @@ def encrypt_with_ephemeral_aes(data: dict, remote_pub_pem: str):
     ciphertext, tag = cipher_aes.encrypt_and_digest(raw)
 
     # Seal AES key with remote RSA pubkey
-    pub_key = RSA.import_key(pem_fix(remote_pub_pem).encode())
-    cipher_rsa = PKCS1_OAEP.new(pub_key)
-    enc_key = cipher_rsa.encrypt(aes_key)
+    enc_key = _rsa(remote_pub_pem).oaep.encrypt(aes_key)
 
     return {
         "encrypted_key": base64.b64encode(enc_key).decode(),
@@ -140,15 +135,11 @@ def encrypt_with_ephemeral_aes(data: dict, remote_pub_pem: str):
 def decrypt_with_ephemeral_aes(sealed: dict, local_priv_pem: str) -> dict:
     """
     Decrypts a sealed AES payload produced by encrypt_with_ephemeral_aes.
-    Requires the local RSA private key (PEM).
+    Requires the local RSA private key (PEM or CachedRSAKey).
     Returns the original dict.
     """
-    # Load RSA privkey
-    priv_key = RSA.import_key(pem_fix(local_priv_pem).encode())
-    cipher_rsa = PKCS1_OAEP.new(priv_key)
-
     # Unwrap AES key
-    aes_key = cipher_rsa.decrypt(base64.b64decode(sealed["encrypted_key"]))
+    aes_key = _rsa(local_priv_pem).oaep.decrypt(base64.b64decode(sealed["encrypted_key"]))
 
     # Decrypt AES payload
     cipher_aes = AES.new(aes_key, AES.MODE_GCM, nonce=base64.b64decode(sealed["nonce"]))
@@ -159,6 +150,46 @@ def decrypt_with_ephemeral_aes(sealed: dict, local_priv_pem: str) -> dict:
 
     return json.loads(plaintext.decode())
 
+def seal_with_session_key(data: dict, key: bytes, kid: str, seq: int) -> dict:
+    """
+    Encrypts a dict under a negotiated AES-256-GCM session key.
+    The key id and sequence number are bound in as associated data, so the
+    GCM tag authenticates them along with the payload; no RSA is involved.
+    Returns { type, kid, seq, nonce, payload, tag } base64-encoded.
+    """
+    raw = json.dumps(data, sort_keys=True).encode()
+
+    cipher_aes = AES.new(key, AES.MODE_GCM)
+    cipher_aes.update(_session_aad(kid, seq))
+    ciphertext, tag = cipher_aes.encrypt_and_digest(raw)
+
+    return {
+        "type": "session_aead",
+        "kid": kid,
+        "seq": seq,
+        "nonce": base64.b64encode(cipher_aes.nonce).decode(),
+        "payload": base64.b64encode(ciphertext).decode(),
+        "tag": base64.b64encode(tag).decode()
+    }
+
+def open_with_session_key(sealed: dict, key: bytes) -> dict:
+    """
+    Decrypts a payload produced by seal_with_session_key.
+    Raises ValueError if the tag does not verify.
+    Returns the original dict.
+    """
+    cipher_aes = AES.new(key, AES.MODE_GCM, nonce=base64.b64decode(sealed["nonce"]))
+    cipher_aes.update(_session_aad(sealed["kid"], sealed["seq"]))
+    plaintext = cipher_aes.decrypt_and_verify(
+        base64.b64decode(sealed["payload"]),
+        base64.b64decode(sealed["tag"])
+    )
+
+    return json.loads(plaintext.decode())
+
+def _session_aad(kid, seq) -> bytes:
+    return f"{kid}:{seq}".encode()
+
 def verify_signed_payload(payload: dict, signature_b64: str, pub_key_obj) -> bool:
     """
     Verifies a payload dict signed with sign_data().
@@ -168,10 +199,9 @@ def verify_signed_payload(payload: dict, signature_b64: str, pub_key_obj) -> boo
     # strip out "sig" just like sign_data
     payload_to_verify = {k: v for k, v in payload.items() if k != "sig"}
     serialized = json.dumps(payload_to_verify, sort_keys=True, separators=(",", ":")).encode()
-    digest = SHA256.new(serialized)
 
     signature = base64.b64decode(signature_b64)
-    pkcs1_15.new(pub_key_obj).verify(digest, signature)
+    verify_bytes(pub_key_obj, serialized, signature)
 
     return True
 
@@ -185,8 +215,7 @@ def generate_signed_payload(payload: dict, priv_key_obj) -> dict:
     }
     """
     serialized = json.dumps(payload, sort_keys=True).encode()
-    digest = SHA256.new(serialized)
-    signature = pkcs1_15.new(priv_key_obj).sign(digest)
+    signature = sign_bytes(priv_key_obj, serialized)
     return {
         "payload": payload,
         "signature": base64.b64encode(signature).decode()
@@ -195,3 +224,7 @@ def generate_signed_payload(payload: dict, priv_key_obj) -> dict:
 #remove \n from certs
 def pem_fix(pem_str: str) -> str:
     return pem_str.replace("\\n", "\n") if pem_str else pem_str
+
+def _rsa(key) -> CachedRSAKey:
+    """Resolve a PEM string to its cached key; CachedRSAKey passes through."""
+    return key if isinstance(key, CachedRSAKey) else RSAKeyCache.get(pem_fix(key))
@@ -0,0 +1,232 @@
+import json
+import os
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import msgpack  # optional; compact JSON is used without it
+except ImportError:
+    msgpack = None
+
+# Header (64 bytes, little-endian), then `capacity` bytes of records.
+#   magic u32 | version u32 | capacity u64 | head u64 | tail u64 | written u64 | dropped u64 | pad
+# head/tail are running byte counts (offset = count % capacity): only the writer
+# stores head/written/dropped, only the reader stores tail, so no lock is needed.
+_MAGIC = 0x46454544  # "FEED"
+_VERSION = 1
+_HEADER = struct.Struct("<IIQQQQQ")
+_HEADER_SIZE = 64
+_HEAD, _TAIL, _WRITTEN, _DROPPED = 16, 24, 32, 40
+_U64 = struct.Struct("<Q")
+
+# Record: u32 length | 1 byte codec | body. A length of _WRAP means "continue at offset 0".
+_LEN = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF
+_CODEC_MSGPACK, _CODEC_JSON = b"m", b"j"
+
+POLICIES = ("drop_new", "block", "pipe")
+
+_untracked_lock = threading.Lock()  # attach() on Python < 3.13 briefly swaps resource_tracker.register
+
+
+def _encode(event) -> bytes:
+    if msgpack is not None:
+        return _CODEC_MSGPACK + msgpack.packb(event, use_bin_type=True, default=str)
+    return _CODEC_JSON + json.dumps(event, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _decode(record: bytes):
+    codec, body = record[:1], record[1:]
+    if codec == _CODEC_MSGPACK:
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+class FeedRing:
+    """
+    Single-producer / single-consumer ring buffer in shared memory.
+
+    Carries bulk, loss-tolerant swarm feed events from one session process
+    to the cockpit so floods never queue up behind control messages on the
+    session pipe. The cockpit creates the ring and passes its name in the
+    session's init message; the session attaches and push()es, the cockpit
+    drain()s on its own schedule.
+
+    Overflow policy (what push() does when the reader has fallen behind):
+        drop_new — drop the event and count it (default)
+        block    — wait up to `block_timeout` for space, then drop
+        pipe     — return False so the caller sends it over the pipe instead
+
+    Events are msgpack-encoded when msgpack is installed, compact JSON
+    otherwise; each record carries its codec so both ends always agree.
+    """
+    default_capacity = int(os.getenv("MATRIX_FEED_RING_BYTES", str(1 << 20)))
+    default_policy = os.getenv("MATRIX_FEED_RING_POLICY", "drop_new")
+
+    def __init__(self, shm, owner: bool, policy: str = None, block_timeout: float = 0.05):
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+        self.name = shm.name
+        self.policy = policy if policy in POLICIES else self.default_policy
+        self.block_timeout = block_timeout
+        self._write_lock = threading.Lock()  # one producer per process, whichever thread pushes
+
+        magic, version, capacity = struct.unpack_from("<IIQ", self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"shared memory '{shm.name}' is not a feed ring")
+        self.capacity = capacity
+
+    # -----------------------------
+    @classmethod
+    def create(cls, capacity: int = None, policy: str = None):
+        """Cockpit side: allocate a new ring."""
+        capacity = capacity or cls.default_capacity
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, capacity, 0, 0, 0, 0)
+        return cls(shm, owner=True, policy=policy)
+
+    @classmethod
+    def attach(cls, name: str, policy: str = None):
+        """Session side: open a ring the cockpit created."""
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 always registers the segment with this process's
+            # resource tracker. A session forked before the cockpit's first
+            # create() has a tracker of its own, which would unlink the ring
+            # (and warn about a leak) when the session exits; one that shares
+            # the cockpit's tracker would have the cockpit's registration
+            # undone by a later unregister(). So skip registering altogether,
+            # as track=False does.
+            with _untracked_lock:
+                register = resource_tracker.register
+                resource_tracker.register = lambda name, rtype: None
+                try:
+                    shm = shared_memory.SharedMemory(name=name)
+                finally:
+                    resource_tracker.register = register
+        return cls(shm, owner=False, policy=policy)
+
+    def describe(self) -> dict:
+        """What a session needs to attach (sent in its init message)."""
+        return {"name": self.name, "policy": self.policy}
+
+    # -----------------------------
+    def _get(self, offset) -> int:
+        return _U64.unpack_from(self._buf, offset)[0]
+
+    def _put(self, offset, value):
+        _U64.pack_into(self._buf, offset, value)
+
+    def stats(self) -> dict:
+        if self._buf is None:
+            return {"written": 0, "dropped": 0, "used": 0, "capacity": self.capacity}
+        head, tail = self._get(_HEAD), self._get(_TAIL)
+        return {
+            "written": self._get(_WRITTEN),
+            "dropped": self._get(_DROPPED),
+            "used": head - tail,
+            "capacity": self.capacity,
+        }
+
+    # -----------------------------
+    def push(self, event) -> bool:
+        """
+        Writer: append one event.
+
+        Returns:
+            bool: True if the ring took the event (written, or dropped and
+                  counted under drop_new/block). False if the caller should
+                  send it another way: the ring is full under the 'pipe'
+                  policy, or the event is larger than the whole ring.
+        """
+        record = _encode(event)
+        size = _LEN.size + len(record)
+        if size + _LEN.size > self.capacity:
+            return False
+
+        with self._write_lock:
+            return self._write(record, size)
+
+    def _write(self, record, size) -> bool:
+        if self._buf is None:
+            return False  # closed
+
+        head = self._get(_HEAD)
+        offset = head % self.capacity
+        to_end = self.capacity - offset
+        pad = to_end if to_end < size else 0  # records never straddle the end
+        needed = pad + size
+
+        deadline = None
+        while self.capacity - (head - self._get(_TAIL)) < needed:
+            if self.policy == "pipe":
+                return False
+            if self.policy == "block":
+                deadline = deadline or time.monotonic() + self.block_timeout
+                if time.monotonic() < deadline:
+                    time.sleep(0.001)
+                    continue
+            self._put(_DROPPED, self._get(_DROPPED) + 1)
+            return True
+
+        if pad:
+            if to_end >= _LEN.size:
+                _LEN.pack_into(self._buf, _HEADER_SIZE + offset, _WRAP)
+            offset = 0
+
+        start = _HEADER_SIZE + offset
+        _LEN.pack_into(self._buf, start, len(record))
+        self._buf[start + _LEN.size:start + size] = record
+
+        # publish last: the reader only looks at bytes below head
+        self._put(_WRITTEN, self._get(_WRITTEN) + 1)
+        self._put(_HEAD, head + needed)
+        return True
+
+    def drain(self, limit: int = None) -> list:
+        """
+        Reader: take every event written so far (or up to `limit`).
+
+        Returns:
+            list: Decoded events, oldest first.
+        """
+        events = []
+        if self._buf is None:
+            return events
+        head, tail = self._get(_HEAD), self._get(_TAIL)
+        while tail < head and (limit is None or len(events) < limit):
+            offset = tail % self.capacity
+            to_end = self.capacity - offset
+            if to_end < _LEN.size:
+                tail += to_end
+                continue
+            length = _LEN.unpack_from(self._buf, _HEADER_SIZE + offset)[0]
+            if length == _WRAP:
+                tail += to_end
+                continue
+
+            start = _HEADER_SIZE + offset + _LEN.size
+            record = bytes(self._buf[start:start + length])
+            tail += _LEN.size + length
+            try:
+                events.append(_decode(record))
+            except Exception as e:
+                print(f"[FEED-RING][WARN] Undecodable record skipped: {e}")
+
+        self._put(_TAIL, tail)
+        return events
+
+    # -----------------------------
+    def close(self):
+        """Detach; the owner also frees the segment."""
+        try:
+            self._buf = None
+            self._shm.close()
+            if self.owner:
+                self._shm.unlink()
+        except (FileNotFoundError, BufferError, OSError):
+            pass
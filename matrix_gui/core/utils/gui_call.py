@@ -0,0 +1,43 @@
+import threading
+from PyQt6.QtCore import QCoreApplication, QObject, Qt, pyqtSignal, pyqtSlot
+from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+
+
+class _GuiCall(QObject):
+    """Runs callables posted from any thread on the thread that owns it (the GUI thread)."""
+    posted = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.posted.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(object)
+    def _run(self, fn):
+        try:
+            fn()
+        except Exception as e:
+            emit_gui_exception_log("gui_call", e)
+
+
+_relay = None
+_relay_lock = threading.Lock()
+
+
+def post_to_gui(fn):
+    """
+    Run fn() on the GUI thread, later. Safe to call from worker threads and
+    asyncio loops; without a running QApplication fn() runs right away.
+
+    Args:
+        fn (callable): Zero-argument callable.
+    """
+    global _relay
+    app = QCoreApplication.instance()
+    if app is None:
+        fn()
+        return
+    with _relay_lock:
+        if _relay is None:
+            _relay = _GuiCall()
+            _relay.moveToThread(app.thread())  # queued delivery to the GUI thread from here on
+    _relay.posted.emit(fn)
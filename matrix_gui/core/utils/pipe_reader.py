@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import wait
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+CLOSED = object()  # queued in place of a message when a pipe hits EOF
+
+
+class PipeReader(QObject):
+    """
+    Drains session pipes on a dedicated thread and hands the GUI thread batches.
+
+    The reader blocks in multiprocessing.connection.wait() on every watched
+    connection, so a message is picked up the moment it lands instead of on
+    the next timer tick. Each wake reads *everything* pending on the ready
+    pipes into one queue; the GUI thread is signalled once per batch (not
+    once per message) and dispatches up to `max_batch` messages per event
+    loop turn, yielding between slices so a flood never freezes the UI.
+
+    on_message(msg, conn) and on_closed(conn) run on the GUI thread.
+    """
+    batch_ready = pyqtSignal()
+
+    def __init__(self, on_message, on_closed=None, max_batch=500, parent=None):
+        """
+        Args:
+            on_message (callable): on_message(msg, conn) for every message.
+            on_closed (callable, optional): on_closed(conn) when a pipe reaches EOF.
+            max_batch (int): Messages dispatched per GUI event loop turn.
+        """
+        super().__init__(parent)
+        self.on_message = on_message
+        self.on_closed = on_closed
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._conns = set()
+        self._queue = deque()
+        self._scheduled = False
+        self._stopped = False
+        self._wake_r, self._wake_w = Pipe(duplex=False)
+
+        self._rate_mark = (time.time(), 0)
+        self.stats = {
+            "received": 0,
+            "dispatched": 0,
+            "batches": 0,
+            "depth": 0,        # messages waiting for the GUI thread
+            "peak_depth": 0,
+            "last_batch": 0,
+            "rate": 0.0,       # messages/s dispatched since the previous metrics() call
+        }
+
+        # queued even when emitted on the GUI thread, so a backlog yields to paint/input
+        self.batch_ready.connect(self._dispatch, Qt.ConnectionType.QueuedConnection)
+        self._thread = threading.Thread(target=self._run, name="pipe_reader", daemon=True)
+        self._thread.start()
+
+    # -----------------------------
+    def watch(self, conn):
+        with self._lock:
+            self._conns.add(conn)
+        self._wake()
+
+    def unwatch(self, conn):
+        with self._lock:
+            self._conns.discard(conn)
+        self._wake()
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._conns.clear()
+        self._wake()
+        self._thread.join(timeout=1.0)
+
+    def metrics(self) -> dict:
+        """Counters plus current queue depth and the dispatch rate since the last call."""
+        now = time.time()
+        with self._lock:
+            since, count = self._rate_mark
+            if now > since:
+                self.stats["rate"] = round((self.stats["dispatched"] - count) / (now - since), 1)
+            self._rate_mark = (now, self.stats["dispatched"])
+            self.stats["depth"] = len(self._queue)
+            return dict(self.stats)
+
+    # -----------------------------
+    def _wake(self):
+        try:
+            self._wake_w.send_bytes(b"\0")
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+                conns = [c for c in self._conns if not c.closed]
+
+            try:
+                ready = wait(conns + [self._wake_r], timeout=1.0)
+            except (OSError, ValueError):
+                # a pipe was closed under us on the GUI thread; drop it and go again
+                with self._lock:
+                    self._conns = {c for c in self._conns if not c.closed}
+                continue
+
+            batch = []
+            for conn in ready:
+                if conn is self._wake_r:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                    continue
+                try:
+                    while conn.poll():
+                        batch.append((conn, conn.recv()))
+                except (EOFError, OSError, ValueError):
+                    batch.append((conn, CLOSED))
+                    with self._lock:
+                        self._conns.discard(conn)
+
+            if not batch:
+                continue
+
+            with self._lock:
+                self._queue.extend(batch)
+                self.stats["received"] += len(batch)
+                self.stats["peak_depth"] = max(self.stats["peak_depth"], len(self._queue))
+                signal, self._scheduled = not self._scheduled, True
+            if signal:
+                self.batch_ready.emit()
+
+    def _dispatch(self):
+        """GUI thread: run one slice of the queue, re-posting if more is waiting."""
+        with self._lock:
+            n = min(len(self._queue), self.max_batch)
+            batch = [self._queue.popleft() for _ in range(n)]
+            more = bool(self._queue)
+            self._scheduled = more
+            self.stats["depth"] = len(self._queue)
+
+        for conn, msg in batch:
+            try:
+                if msg is CLOSED:
+                    if self.on_closed:
+                        self.on_closed(conn)
+                else:
+                    self.on_message(msg, conn)
+            except Exception as e:
+                print(f"[PIPE-READER][ERROR] Dispatch failed: {e}")
+
+        with self._lock:
+            self.stats["dispatched"] += n
+            self.stats["batches"] += 1
+            self.stats["last_batch"] = n
+
+        if more:
+            self.batch_ready.emit()
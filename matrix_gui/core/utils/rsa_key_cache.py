@@ -0,0 +1,174 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from Crypto.PublicKey.ECC import EccKey
+from Crypto.Cipher import PKCS1_OAEP
+from Crypto.Signature import pkcs1_15, eddsa
+from Crypto.Hash import SHA256
+from matrix_gui.core.utils.signing_suites import RSA_SUITE, ED25519_SUITE, import_signing_key, encryption_block
+
+
+class CachedRSAKey:
+    """
+    A parsed RSA key plus the cipher/signature objects built on it.
+
+    pkcs1_15 and PKCS1_OAEP objects hold no per-call state, so one instance
+    is shared by every packet that uses this key.
+    """
+
+    suite = RSA_SUITE
+
+    def __init__(self, key, fingerprint: str):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.pkcs1 = pkcs1_15.new(key)
+        self._oaep = None
+
+    @property
+    def oaep(self):
+        """PKCS1_OAEP cipher (default SHA-1 MGF), built on first use."""
+        if self._oaep is None:
+            self._oaep = PKCS1_OAEP.new(self.key)
+        return self._oaep
+
+    def sign_bytes(self, data: bytes) -> bytes:
+        return self.pkcs1.sign(SHA256.new(data))
+
+    def verify_bytes(self, data: bytes, signature: bytes):
+        self.pkcs1.verify(SHA256.new(data), signature)
+
+
+class CachedEd25519Key:
+    """
+    A parsed Ed25519 key plus its RFC 8032 signer/verifier.
+
+    Same surface as CachedRSAKey for signing; Ed25519 cannot encrypt, so
+    oaep raises and callers take encryption keys from the signing block's
+    'encryption' pairs instead.
+    """
+    suite = ED25519_SUITE
+
+    def __init__(self, key, fingerprint: str):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.eddsa = eddsa.new(key, "rfc8032")
+
+    @property
+    def oaep(self):
+        raise ValueError("Ed25519 keys cannot encrypt; use the signing block's 'encryption' keys")
+
+    def sign_bytes(self, data: bytes) -> bytes:
+        return self.eddsa.sign(data)
+
+    def verify_bytes(self, data: bytes, signature: bytes):
+        self.eddsa.verify(data, signature)
+
+
+class RSAKeyCache:
+    """
+    Process-wide cache of parsed signing keys (RSA or Ed25519) for the
+    packet hot path.
+
+    Entries are keyed by (deployment id, universal_id, role, PEM hash), so a
+    rotated key is simply a new entry; invalidate() drops a deployment's (or
+    one agent's) keys when the vault rewrites its certs block. Keys without
+    a deployment scope are kept in a bounded LRU.
+    """
+    _entries = OrderedDict()  # (dep_id, uid, role, pem_hash) → CachedRSAKey | CachedEd25519Key
+    _lock = threading.Lock()
+
+    max_entries = 512
+
+    @classmethod
+    def get(cls, pem, dep_id=None, uid=None, role=None):
+        """
+        Return the parsed key for a PEM, importing it on first use.
+
+        Args:
+            pem (str | bytes): RSA or Ed25519 key in PEM form (literal '\\n' is tolerated).
+            dep_id (str, optional): Owning deployment id.
+            uid (str, optional): Owning agent universal_id.
+            role (str, optional): Cert field, e.g. 'remote_privkey' or 'pubkey'.
+
+        Returns:
+            CachedRSAKey | CachedEd25519Key: Shared key object.
+        """
+        if isinstance(pem, bytes):
+            pem = pem.decode()
+        pem = pem.replace("\\n", "\n")
+        fp = hashlib.sha256(pem.encode()).hexdigest()[:32]
+        key = (dep_id, uid, role, fp)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry:
+                cls._entries.move_to_end(key)
+                return entry
+
+        parsed = import_signing_key(pem)
+        entry = (CachedEd25519Key if isinstance(parsed, EccKey) else CachedRSAKey)(parsed, fp)
+
+        with cls._lock:
+            # a new PEM for the same (deployment, agent, role) supersedes the old one
+            if dep_id is not None:
+                for k in [k for k in cls._entries if k[:3] == key[:3]]:
+                    cls._entries.pop(k, None)
+            cls._entries[key] = entry
+            while len(cls._entries) > cls.max_entries:
+                cls._entries.popitem(last=False)
+        return entry
+
+    @classmethod
+    def for_signing(cls, deployment: dict, uid: str, role: str = "remote_privkey"):
+        """
+        Return the cached key stored at certs[uid]['signing'][role].
+
+        Args:
+            deployment (dict): Deployment holding the certs block and its 'id'.
+            uid (str): Agent universal_id.
+            role (str): 'remote_privkey' or 'pubkey'.
+
+        Returns:
+            CachedRSAKey | CachedEd25519Key | None: Shared key object, or None if the field is missing.
+        """
+        pem = (deployment or {}).get("certs", {}).get(uid, {}).get("signing", {}).get(role)
+        if not pem:
+            return None
+        return cls.get(pem, dep_id=deployment.get("id"), uid=uid, role=role)
+
+    @classmethod
+    def for_encryption(cls, deployment: dict, uid: str, role: str = "pubkey"):
+        """
+        Return the cached RSA key used for OAEP with an agent.
+
+        RSA-suite agents encrypt with their signing keys; ed25519-suite
+        agents keep a separate RSA pair under signing['encryption'].
+
+        Args:
+            deployment (dict): Deployment holding the certs block and its 'id'.
+            uid (str): Agent universal_id.
+            role (str): 'pubkey' (encrypt to the agent) or 'remote_privkey' (decrypt from it).
+
+        Returns:
+            CachedRSAKey | None: Shared key object, or None if the field is missing.
+        """
+        signing = (deployment or {}).get("certs", {}).get(uid, {}).get("signing", {})
+        block = encryption_block(signing)
+        pem = block.get(role)
+        if not pem:
+            return None
+        if block is not signing:
+            role = f"encryption.{role}"
+        return cls.get(pem, dep_id=deployment.get("id"), uid=uid, role=role)
+
+    @classmethod
+    def invalidate(cls, dep_id=None, uid=None):
+        """
+        Drop cached keys for a deployment (optionally one agent), or everything.
+        """
+        with cls._lock:
+            if dep_id is None and uid is None:
+                cls._entries.clear()
+                return
+            for k in [k for k in cls._entries if k[0] == dep_id and (uid is None or k[1] == uid)]:
+                cls._entries.pop(k, None)
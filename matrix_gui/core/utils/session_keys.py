@@ -0,0 +1,212 @@
+import base64
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from Crypto.Random import get_random_bytes
+from matrix_gui.core.utils.crypto_utils import sign_data, verify_signed_payload
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
+
+
+class SessionKey:
+    """
+    One AES-256-GCM session key and its sequence state.
+
+    Outbound keys hand out increasing sequence numbers; inbound keys keep a
+    replay window of the sequence numbers already accepted.
+    """
+
+    def __init__(self, key: bytes, kid: str, header: dict = None, replay_window: int = 1024, created: float = None):
+        self.key = key
+        self.kid = kid
+        self.header = header  # signed key announcement sent with every packet
+        self.created = time.time() if created is None else created  # inbound: the announcement's signed ts
+        self.replay_window = replay_window
+
+        self._seq = 0
+        self._max_seen = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def next_seq(self) -> int:
+        with self._lock:
+            self._seq += 1
+            return self._seq
+
+    def used(self) -> int:
+        return self._seq
+
+    def accept_seq(self, seq: int) -> bool:
+        """
+        Record an inbound sequence number.
+
+        Returns:
+            bool: False for a replay or a number older than the window.
+        """
+        with self._lock:
+            if seq in self._seen or seq <= self._max_seen - self.replay_window:
+                return False
+            self._seen.add(seq)
+            if seq > self._max_seen:
+                self._max_seen = seq
+                if len(self._seen) > 2 * self.replay_window:
+                    floor = seq - self.replay_window
+                    self._seen = {s for s in self._seen if s > floor}
+            return True
+
+
+class SessionKeyRing:
+    """
+    Negotiated session keys per (deployment, agent).
+
+    Opt-in per agent: certs[uid]['signing']['session_keys'] = True marks an
+    agent that understands 'session_aead' packets. Everyone else keeps the
+    per-packet RSA-OAEP + RSA signature format.
+
+    Outbound: a fresh 32-byte key is wrapped with the agent's RSA pubkey and
+    the announcement is signed with the remote_privkey (RSA or Ed25519, per
+    the agent's signing suite), once per key. The
+    announcement rides along with every packet (no extra RSA work) so lost
+    or reordered packets never strand the receiver. Keys rotate after
+    max_packets packets or max_age seconds.
+
+    Inbound: an agent's announcement is verified with its signing pubkey
+    and unwrapped with our remote_privkey the first time its kid is seen.
+    Announcements whose signed ts is more than max_age + clock_skew old
+    (or that far in the future) are refused, and cached inbound keys expire
+    on the same bound, so a captured announcement cannot be replayed after
+    a restart. A kid that was evicted from the cache before it expired is
+    remembered until it would have, so it cannot be re-announced with a
+    fresh replay window either.
+    """
+    _outbound = {}            # (dep_id, uid) → SessionKey
+    _inbound = OrderedDict()  # (dep_id, uid, kid) → SessionKey
+    _retired = {}             # (dep_id, uid, kid) → expiry, for kids evicted before they expired
+    _lock = threading.Lock()
+
+    max_packets = 10000
+    max_age = 900
+    max_inbound = 256
+    clock_skew = 60
+
+    @staticmethod
+    def enabled(deployment: dict, uid: str) -> bool:
+        """True if the agent's signing block opts into session keys."""
+        signing = (deployment or {}).get("certs", {}).get(uid, {}).get("signing", {})
+        return bool(signing.get("session_keys"))
+
+    @classmethod
+    def outbound(cls, deployment: dict, uid: str) -> SessionKey:
+        """
+        Return the current outbound key for an agent, negotiating or
+        rotating it when needed.
+
+        Args:
+            deployment (dict): Deployment holding certs and its 'id'.
+            uid (str): Target agent universal_id.
+
+        Returns:
+            SessionKey: Key whose header must accompany each packet.
+        """
+        slot = (deployment.get("id"), uid)
+        with cls._lock:
+            skey = cls._outbound.get(slot)
+            if skey and skey.used() < cls.max_packets and time.time() - skey.created < cls.max_age:
+                return skey
+
+            skey = cls._negotiate(deployment, uid)
+            cls._outbound[slot] = skey
+            print(f"[SESSION-KEY] New key {skey.kid[:8]} for {uid}")
+            return skey
+
+    @classmethod
+    def inbound(cls, deployment: dict, uid: str, verify_key, decrypt_key, sealed: dict) -> SessionKey:
+        """
+        Resolve the session key an agent used for an inbound packet.
+
+        Args:
+            deployment (dict): Deployment holding its 'id'.
+            uid (str): Sending agent universal_id.
+            verify_key (CachedRSAKey | CachedEd25519Key): Agent signing pubkey.
+            decrypt_key (CachedRSAKey): Our RSA-OAEP remote_privkey for that agent.
+            sealed (dict): 'session_aead' content including its 'skey' header.
+
+        Returns:
+            SessionKey: Key for sealed['kid'].
+
+        Raises:
+            ValueError: Unknown kid without a valid announcement.
+        """
+        kid = sealed.get("kid")
+        slot = (deployment.get("id"), uid, kid)
+        now = time.time()
+        with cls._lock:
+            skey = cls._inbound.get(slot)
+            if skey:
+                if now - skey.created > cls.max_age + cls.clock_skew:
+                    del cls._inbound[slot]
+                    raise ValueError(f"session key {kid} expired")
+                cls._inbound.move_to_end(slot)
+                return skey
+            if cls._retired.get(slot, 0) > now:
+                raise ValueError(f"session key {kid} was already retired")
+
+        header = sealed.get("skey") or {}
+        if header.get("kid") != kid or not verify_key or not decrypt_key:
+            raise ValueError(f"no session key announcement for kid {kid}")
+
+        verify_signed_payload(header, header["sig"], verify_key)
+        announced = header.get("ts")
+        if not isinstance(announced, (int, float)) or abs(now - announced) > cls.max_age + cls.clock_skew:
+            raise ValueError(f"stale session key announcement for kid {kid} (ts={announced})")
+
+        key = decrypt_key.oaep.decrypt(base64.b64decode(header["encrypted_key"]))
+        skey = SessionKey(key, kid, created=announced)
+
+        with cls._lock:
+            cls._inbound[slot] = skey
+            cls._expire(now)
+            while len(cls._inbound) > cls.max_inbound:
+                old_slot, old = cls._inbound.popitem(last=False)
+                cls._retired[old_slot] = old.created + cls.max_age + cls.clock_skew
+        return skey
+
+    @classmethod
+    def _expire(cls, now):
+        """Drop inbound keys past their age bound, and retired kids that have expired. Hold _lock."""
+        bound = cls.max_age + cls.clock_skew
+        for slot in [s for s, k in cls._inbound.items() if now - k.created > bound]:
+            del cls._inbound[slot]
+        for slot in [s for s, until in cls._retired.items() if until <= now]:
+            del cls._retired[slot]
+
+    @classmethod
+    def invalidate(cls, dep_id=None):
+        """Forget keys for one deployment (new certs), or everything. Retired kids stay refused until they expire."""
+        with cls._lock:
+            if dep_id is None:
+                cls._outbound.clear()
+                cls._inbound.clear()
+                return
+            for k in [k for k in cls._outbound if k[0] == dep_id]:
+                cls._outbound.pop(k, None)
+            for k in [k for k in cls._inbound if k[0] == dep_id]:
+                cls._inbound.pop(k, None)
+
+    @classmethod
+    def _negotiate(cls, deployment, uid) -> SessionKey:
+        pub = RSAKeyCache.for_encryption(deployment, uid, "pubkey")
+        priv = RSAKeyCache.for_signing(deployment, uid, "remote_privkey")
+        if not pub or not priv:
+            raise ValueError(f"missing signing keys for session key with {uid}")
+
+        key = get_random_bytes(32)
+        kid = uuid.uuid4().hex
+        header = {
+            "kid": kid,
+            "alg": "AES-256-GCM",
+            "encrypted_key": base64.b64encode(pub.oaep.encrypt(key)).decode(),
+            "ts": int(time.time()),
+        }
+        header["sig"] = sign_data(header, priv)
+        return SessionKey(key, kid, header=header)
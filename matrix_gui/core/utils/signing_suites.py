@@ -0,0 +1,91 @@
+from Crypto.PublicKey import RSA, ECC
+from Crypto.PublicKey.ECC import EccKey
+from Crypto.Signature import pkcs1_15, eddsa
+from Crypto.Hash import SHA256
+
+RSA_SUITE = "rsa-pkcs1v15-sha256"
+ED25519_SUITE = "ed25519"
+
+# RSA stays the default: agents minted before suites existed carry no 'suite' field
+DEFAULT_SUITE = RSA_SUITE
+SUITES = (RSA_SUITE, ED25519_SUITE)
+
+
+def suite_of(signing: dict) -> str:
+    """
+    Return the signing suite recorded in a certs[uid]['signing'] block.
+
+    Args:
+        signing (dict): The agent's signing block (may be empty).
+
+    Returns:
+        str: RSA_SUITE or ED25519_SUITE.
+
+    Raises:
+        ValueError: The block names a suite this build does not know.
+    """
+    suite = (signing or {}).get("suite") or DEFAULT_SUITE
+    if suite not in SUITES:
+        raise ValueError(f"unknown signing suite '{suite}'")
+    return suite
+
+
+def encryption_block(signing: dict) -> dict:
+    """
+    Return the block holding the RSA-OAEP keys for an agent.
+
+    Ed25519 keys can only sign, so an ed25519 signing block carries its
+    RSA key pairs under 'encryption'; RSA blocks use the same keys for both.
+    """
+    signing = signing or {}
+    return signing.get("encryption") or signing
+
+
+def import_signing_key(pem):
+    """
+    Parse a PEM into an RsaKey or an Ed25519 EccKey.
+
+    Args:
+        pem (str | bytes): Public or private key in PEM form.
+
+    Returns:
+        RsaKey | EccKey: Parsed key.
+    """
+    if isinstance(pem, str):
+        pem = pem.encode()
+    try:
+        return RSA.import_key(pem)
+    except (ValueError, IndexError, TypeError):
+        key = ECC.import_key(pem)
+        if key.curve != "Ed25519":
+            raise ValueError(f"unsupported signing curve '{key.curve}'")
+        return key
+
+
+def sign_bytes(key, data: bytes) -> bytes:
+    """
+    Sign raw bytes with whichever suite the key belongs to.
+
+    RSA signs SHA-256(data) with PKCS#1 v1.5; Ed25519 signs the message
+    itself (pure EdDSA, RFC 8032). Cached key objects reuse their signer.
+    """
+    if hasattr(key, "sign_bytes"):
+        return key.sign_bytes(data)
+    if isinstance(key, EccKey):
+        return eddsa.new(key, "rfc8032").sign(data)
+    return pkcs1_15.new(key).sign(SHA256.new(data))
+
+
+def verify_bytes(key, data: bytes, signature: bytes):
+    """
+    Verify a signature produced by sign_bytes().
+
+    Raises:
+        ValueError: The signature does not match.
+    """
+    if hasattr(key, "verify_bytes"):
+        return key.verify_bytes(data, signature)
+    if isinstance(key, EccKey):
+        return eddsa.new(key, "rfc8032").verify(data, signature)
+    return pkcs1_15.new(key).verify(SHA256.new(data), signature)
+
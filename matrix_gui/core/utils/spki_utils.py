@@ -1,8 +1,11 @@
 import base64, hashlib
+from functools import lru_cache
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization, hashes
 
+@lru_cache(maxsize=256)
 def extract_spki_pin_from_der(cert_der: bytes) -> str:
+    # peers present the same cert on every connect; parse each DER once
     cert = x509.load_der_x509_certificate(cert_der)
     spki = cert.public_key().public_bytes(
         serialization.Encoding.DER,
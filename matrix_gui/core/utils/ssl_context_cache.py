@@ -0,0 +1,138 @@
+import ssl
+import hashlib
+import threading
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from matrix_gui.core.utils.spki_utils import extract_spki_pin_from_der, verify_spki_pin
+from matrix_gui.core.utils.cert_loader import load_cert_chain_pem
+
+
+class TLSMaterial:
+    """
+    A ready-to-use client SSLContext plus the pins that go with it.
+
+    Built once per (deployment, agent, cert fingerprint) by SSLContextCache; connectors
+    reuse it for every socket instead of re-parsing PEM on each connect.
+    """
+
+    def __init__(self, context: ssl.SSLContext, fingerprint: str, client_spki_pin=None, server_spki_pin=None):
+        self.context = context
+        self.fingerprint = fingerprint
+        self.client_spki_pin = client_spki_pin
+        self.server_spki_pin = server_spki_pin
+
+    def verify_peer(self, cert_der: bytes):
+        """
+        Check a peer certificate against the expected server SPKI pin.
+
+        Returns:
+            (bool, str): Match flag and the peer's actual pin.
+        """
+        return verify_spki_pin(cert_der, self.server_spki_pin)
+
+
+class SSLContextCache:
+    """
+    Process-wide cache of client SSLContexts keyed by scope and cert fingerprint.
+
+    HTTPS, WSS, SMTP and connection_group transports all pull their context
+    from here. Agent material is scoped by (deployment id, universal_id), so
+    two deployments reusing an agent uid keep separate entries. A rotated
+    cert produces a new fingerprint and therefore a new entry; stale entries
+    for the same scope are dropped at that point.
+    """
+    _entries = {}  # (scope, fingerprint) → TLSMaterial
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, scope: str, cert_pem=None, key_pem=None, ca_pem=None,
+            server_spki_pin=None, verify=False) -> TLSMaterial:
+        """
+        Return the cached TLS material for this cert set, building it on first use.
+
+        Args:
+            scope (str | tuple): Owner of the material, e.g. (deployment id, agent universal_id).
+            cert_pem (str, optional): Client certificate PEM (mTLS).
+            key_pem (str, optional): Client private key PEM (mTLS).
+            ca_pem (str, optional): CA bundle PEM to trust.
+            server_spki_pin (str, optional): Expected server SPKI pin.
+            verify (bool): True → CERT_REQUIRED with hostname checks
+                (system trust store when no CA is given); False → pin-only.
+
+        Returns:
+            TLSMaterial: Shared context and pins.
+        """
+        fp = cls.fingerprint(cert_pem, key_pem, ca_pem, server_spki_pin, verify)
+        key = (scope, fp)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry:
+                return entry
+
+            entry = cls._build(fp, cert_pem, key_pem, ca_pem, server_spki_pin, verify)
+
+            # a rotated cert supersedes the previous entry for this scope
+            for k in [k for k in cls._entries if k[0] == scope]:
+                cls._entries.pop(k, None)
+            cls._entries[key] = entry
+            return entry
+
+    @classmethod
+    def for_agent(cls, agent: dict, deployment: dict) -> TLSMaterial:
+        """
+        Return the TLS material for an agent's connection_cert block.
+
+        Args:
+            agent (dict): Agent metadata including 'universal_id'.
+            deployment (dict): Deployment context holding the agent's certs.
+        """
+        from matrix_gui.modules.net.entity.adapter.agent_cert_wrapper import AgentCertWrapper
+        adapter = AgentCertWrapper(agent, deployment)
+        return cls.get(
+            ((deployment or {}).get("id"), adapter.uid),
+            cert_pem=adapter.cert,
+            key_pem=adapter.key,
+            ca_pem=adapter.ca_root_cert,
+            server_spki_pin=adapter.server_spki_pin,
+        )
+
+    @classmethod
+    def invalidate(cls, scope: str = None):
+        """
+        Drop cached entries for one scope, or everything when scope is None.
+        Agent entries are scoped (deployment id, universal_id).
+        """
+        with cls._lock:
+            if scope is None:
+                cls._entries.clear()
+                return
+            for k in [k for k in cls._entries if k[0] == scope]:
+                cls._entries.pop(k, None)
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(str(part or "").encode())
+            h.update(b"\0")
+        return h.hexdigest()[:32]
+
+    @classmethod
+    def _build(cls, fp, cert_pem, key_pem, ca_pem, server_spki_pin, verify) -> TLSMaterial:
+        if verify:
+            ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH, cadata=ca_pem or None)
+        else:
+            ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            if ca_pem:
+                ctx.load_verify_locations(cadata=ca_pem)
+
+        client_pin = None
+        if cert_pem and key_pem:
+            load_cert_chain_pem(ctx, cert_pem, key_pem)
+            cert = x509.load_pem_x509_certificate(cert_pem.encode())
+            client_pin = extract_spki_pin_from_der(cert.public_bytes(serialization.Encoding.DER))
+
+        print(f"[SSL-CACHE] Built context fp={fp[:16]}")
+        return TLSMaterial(ctx, fp, client_spki_pin=client_pin, server_spki_pin=server_spki_pin)
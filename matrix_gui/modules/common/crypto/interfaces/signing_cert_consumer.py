@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from matrix_gui.core.utils.signing_suites import DEFAULT_SUITE
 
 class SigningCertConsumer(ABC):
     @abstractmethod
@@ -10,3 +11,7 @@ class SigningCertConsumer(ABC):
     def set_signing_cert(self, cert_profile: dict):
         """Injects the signing cert profile (pubkey, privkey, remote_pubkey)."""
         pass
+
+    def get_signing_suite(self) -> str:
+        """Signing suite to mint ('rsa-pkcs1v15-sha256' or 'ed25519')."""
+        return DEFAULT_SUITE
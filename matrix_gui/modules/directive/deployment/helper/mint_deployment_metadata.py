@@ -60,11 +60,13 @@ def mint_deployment_metadata(
 
             if signing:
                 entry["signing"] = {
+                    **({"suite": signing.get("suite")} if signing.get("suite") else {}),
                     **({"remote_pubkey": signing.get("remote_pubkey")} if signing.get("remote_pubkey") else {}),
                     **({"remote_privkey": signing.get("remote_privkey")} if signing.get("remote_privkey") else {}),
                     **({"pubkey": signing.get("pubkey")} if signing.get("pubkey") else {}),
                     **({"privkey":       signing.get("privkey")}       if signing.get("privkey") else {}),
-                    **({"serial":        signing.get("serial")}        if signing.get("serial") else {})
+                    **({"serial":        signing.get("serial")}        if signing.get("serial") else {}),
+                    **({"encryption":    signing.get("encryption")}    if signing.get("encryption") else {})
                 }
 
             symmetric = wrapper.get_symmetric_encryption() or {}
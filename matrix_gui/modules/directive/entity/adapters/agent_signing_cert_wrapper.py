@@ -1,5 +1,6 @@
 from matrix_gui.modules.common.crypto.interfaces.signing_cert_consumer import SigningCertConsumer
 from matrix_gui.modules.directive.entity.agent import Agent
+from matrix_gui.core.utils.signing_suites import DEFAULT_SUITE
 class AgentSigningCertWrapper(SigningCertConsumer):
     def __init__(self, agent:Agent):
         self.agent = agent
@@ -13,6 +14,11 @@ class AgentSigningCertWrapper(SigningCertConsumer):
         packet_signing = agent_tags.get("packet_signing", {})
         return packet_signing.get("out", False)  # only mint if it signs anything
 
+    def get_signing_suite(self) -> str:
+        agent_tags = self.agent.get_item("agent").get("tags", {})
+        packet_signing = agent_tags.get("packet_signing", {})
+        return packet_signing.get("suite") or DEFAULT_SUITE
+
     def set_signing_cert(self, cert_profile: dict):
         """Injects the minted cert profile into the agent."""
         self.agent.add_item("signing_cert", cert_profile)
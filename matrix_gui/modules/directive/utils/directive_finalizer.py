@@ -94,6 +94,15 @@ def _apply_signing_block(agent_obj: dict, creds: dict | None, want_signing: bool
         "remote_pubkey": signing_creds.get("remote_pubkey"),
         "privkey": signing_creds.get("privkey"),
     }
+    # non-RSA suites: tell the agent which scheme to use, and hand it the RSA pair it decrypts with
+    if signing_creds.get("suite"):
+        sec["signing"]["suite"] = signing_creds["suite"]
+    encryption = signing_creds.get("encryption") or {}
+    if encryption:
+        sec["signing"]["encryption"] = {
+            "remote_pubkey": encryption.get("remote_pubkey"),
+            "privkey": encryption.get("privkey"),
+        }
     # serial at the same level as signing/connection (matches your example)
     serial = signing_creds.get("serial")
     if serial:
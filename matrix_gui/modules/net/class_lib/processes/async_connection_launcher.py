@@ -0,0 +1,281 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from .connection_launcher import ConnectionLauncher
+from .async_send_lane import AsyncSendLane
+
+
+class AsyncConnectionLauncher(ConnectionLauncher):
+    """
+    AsyncConnectionLauncher — Swarm Event-Loop Orchestrator
+    ------------------------------------------
+    • Same surface as ConnectionLauncher (load / launch / enqueue / destroy_all)
+    • Every connector of the session runs as a coroutine on ONE asyncio loop,
+      hosted by a single dedicated thread
+    • Persistent connectors are supervised by their own task: a coroutine that
+      returns, fails or asks for a reboot is relaunched immediately
+    • Heartbeats are checked by a loop timer, not a sleeping monitor thread
+    • Blocking egress (HTTPS/SMTP sends) runs on a small shared I/O executor
+    """
+
+    restart_delay = 1.0  # seconds between a connector exiting and its relaunch
+
+    def __init__(self, io_workers=4):
+        """
+        Start the session's event loop thread.
+
+        Args:
+            io_workers (int): Threads in the shared executor used for blocking
+                connector calls (TLS handshakes, HTTPS/SMTP sends).
+
+        Attributes:
+            _tasks (dict): Maps universal_id → supervisor task (concurrent Future).
+            _running (dict): Maps universal_id → current connector task on the loop.
+            _loop (asyncio.AbstractEventLoop): Loop hosting every connector.
+        """
+        super().__init__()
+        self._tasks = {}     # universal_id -> supervisor Future
+        self._running = {}   # universal_id -> asyncio.Task of connector.run_async()
+        self._watchdog = None
+
+        self._executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="connector_io")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        self._loop_thread = threading.Thread(target=self._run_loop, name="connector_loop", daemon=True)
+        self._loop_thread.start()
+
+        print("AsyncConnectionLauncher event loop started")
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    # --------------------------------------------------
+    def launch(self, universal_id, packet: dict = None, fire_catapult=False):
+        """
+        Schedule the connector as a supervised coroutine on the session loop.
+
+        Args:
+            universal_id (str): Identifier under which the class was loaded.
+            packet (dict, optional): Initial packet data to inject into context.
+            fire_catapult (bool, optional): Force immediate launch even if run_on_launch=False.
+                Ephemeral connectors hand the packet to the channel's send lane instead.
+
+        Returns:
+            concurrent.futures.Future | None: The supervisor future if launched, else None.
+        """
+        try:
+            with self._lock:
+                meta = self._registry.get(universal_id)
+                if not meta:
+                    print(f"[LAUNCH][ERROR] No such universal_id {universal_id}")
+                    return None
+                class_path = meta["class_path"]
+                context = meta["context"]
+
+            cls = self._load_class(class_path)
+            persist = getattr(cls, "persistent", False)
+            run_on_launch = getattr(cls, "run_on_launch", False)
+
+            if fire_catapult and packet is not None and not persist:
+                self.enqueue(universal_id, packet)
+                return None
+
+            if not (fire_catapult or run_on_launch):
+                return None
+
+            with self._lock:
+                running = self._tasks.get(universal_id)
+                if running and not running.done():
+                    return running  # one socket per agent; already supervised
+
+                task_id = uuid.uuid4().hex
+                meta["persist"] = persist
+                meta["thread_id"] = task_id
+
+                shared = self._shared_state[universal_id]
+                shared.update({
+                    "thread_id": task_id,
+                    "stop": False,
+                    "session_id": context.get("session_id"),
+                    "agent": context.get("agent"),
+                    "deployment": context.get("deployment"),
+                    "context": context,
+                    "packet": packet,
+                })
+
+                fut = asyncio.run_coroutine_threadsafe(self._supervise(universal_id, cls), self._loop)
+                self._tasks[universal_id] = fut
+
+            print(f"[AsyncConnectionLauncher][LAUNCH] Scheduled {universal_id} as task {task_id}")
+            return fut
+
+        except Exception as e:
+            emit_gui_exception_log("AsyncConnectionLauncher.launch()", e)
+
+    async def _supervise(self, universal_id, cls):
+        """
+        Run a connector until it is told to stop, relaunching it whenever
+        its coroutine ends on its own (socket death, reboot_now, watchdog).
+        """
+        while True:
+            with self._lock:
+                meta = self._registry.get(universal_id)
+                shared = self._shared_state.get(universal_id)
+            if not meta or shared is None:
+                return
+
+            shared["started_at"] = time.time()
+            shared["last_heartbeat"] = time.time()
+            shared["reboot_now"] = False
+
+            instance = cls(shared=shared)
+            task = asyncio.ensure_future(instance.run_async())
+            self._running[universal_id] = task
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise
+            finally:
+                self._running.pop(universal_id, None)
+
+            if not meta["persist"] or shared.get("stop"):
+                return
+
+            if shared.get("reboot_now"):
+                print(f"[MONITOR] Rebooting {universal_id}")
+            else:
+                print(f"[MONITOR] Restarting {universal_id}")
+                await asyncio.sleep(self.restart_delay)
+
+    # --------------------------------------------------
+    def _make_queue(self, universal_id, factory, meta):
+        return AsyncSendLane(
+            universal_id,
+            factory,
+            self._loop,
+            maxsize=meta.get("queue_size", 256),
+            max_batch=meta.get("max_batch", 16),
+        )
+
+    # --------------------------------------------------
+    def kill_thread(self, universal_id: str):
+        """
+        Cancel a connector's supervisor task; the connector closes on cancel.
+
+        Args:
+            universal_id (str): registry key to locate the task to cancel.
+        """
+        with self._lock:
+            fut = self._tasks.pop(universal_id, None)
+            shared = self._shared_state.get(universal_id)
+            if shared:
+                shared["stop"] = True
+
+        if not fut or fut.done():
+            print(f"[NUKER] No active task to nuke using {universal_id}.")
+            return
+
+        print(f"[NUKER] Cancelling task for {universal_id}")
+        fut.cancel()
+
+    # --------------------------------------------------
+    def start_auto_monitor(self, check_interval: int = 10):
+        """
+        Arm the heartbeat watchdog on the event loop.
+
+        Dead or rebooting connectors are already relaunched by their
+        supervisor; the watchdog only cancels a connector whose heartbeat
+        is older than twice its check_interval, which the supervisor then
+        relaunches.
+        """
+        if self._watchdog is not None:
+            return
+        self._watchdog = check_interval
+        self._loop.call_soon_threadsafe(self._check_heartbeats)
+        print("[AsyncConnectionLauncher][MONITOR] Heartbeat watchdog armed.")
+
+    def _check_heartbeats(self):
+        if self._watchdog is None:
+            return
+        try:
+            now = time.time()
+            with self._lock:
+                stale = []
+                for uid, task in self._running.items():
+                    meta = self._registry.get(uid) or {}
+                    shared = self._shared_state.get(uid) or {}
+                    if not meta.get("persist") or shared.get("stop"):
+                        continue
+                    if now - shared.get("last_heartbeat", now) > meta.get("check_interval", 30) * 2:
+                        stale.append((uid, task))
+
+            for uid, task in stale:
+                print(f"[MONITOR] heartbeat failure, restarting {uid}")
+                task.cancel()
+
+        except Exception as e:
+            emit_gui_exception_log("AsyncConnectionLauncher._check_heartbeats()", e)
+
+        self._loop.call_later(self._watchdog, self._check_heartbeats)
+
+    # --------------------------------------------------
+    def destroy_all(self, force=False):
+        """
+        Cancel every connector, stop the send lanes and shut the loop down.
+
+        Args:
+            force (bool, optional): If True, forcibly clears registries even if
+                the loop fails to shut down gracefully.
+        """
+        try:
+            print("[AsyncConnectionLauncher][DESTROY] Commencing full shutdown sequence...")
+            with self._lock:
+                for shared in self._shared_state.values():
+                    if shared:
+                        shared["stop"] = True
+                tasks = list(self._tasks.values())
+                lanes = list(self._queues.values())
+            self._watchdog = None
+
+            if self._loop.is_running():
+                fut = asyncio.run_coroutine_threadsafe(self._shutdown(tasks, lanes), self._loop)
+                fut.result(timeout=5)
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join(timeout=2)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+            with self._lock:
+                self._tasks.clear()
+                self._registry.clear()
+                self._shared_state.clear()
+                self._queues.clear()
+
+            print("[AsyncConnectionLauncher][DESTROY] ✅ All connections destroyed.")
+        except Exception as e:
+            if not force:
+                emit_gui_exception_log("AsyncConnectionLauncher.destroy_all()", e)
+            else:
+                self._tasks.clear()
+                self._registry.clear()
+                self._shared_state.clear()
+                self._queues.clear()
+                print("[AsyncConnectionLauncher][DESTROY][FORCE] ⚠️ Forced purge completed.")
+
+    async def _shutdown(self, tasks, lanes):
+        for lane in lanes:
+            lane.stop()
+        for fut in tasks:
+            fut.cancel()
+        running = list(self._running.values())
+        if running:
+            await asyncio.wait(running, timeout=2)
+        for lane in lanes:
+            await lane.join()
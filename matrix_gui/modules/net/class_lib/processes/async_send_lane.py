@@ -0,0 +1,182 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import asyncio
+import collections
+import threading
+
+from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+
+
+class AsyncSendLane:
+    """
+    AsyncSendLane — ordered outbound lane hosted on an asyncio loop
+    ------------------------------------------
+    • Drop-in for ChannelSendQueue under AsyncConnectionLauncher
+    • One worker coroutine per channel instead of one thread
+    • Bounded FIFO; submit() refuses instead of blocking when full
+    • Blocking connector sends run on the loop's shared I/O executor
+    • Coalesces queued packets into a single send_batch() when the
+      connector reports batch_capable()
+    • Undelivered packets are retried from the head of the lane, then
+      dropped and reported like ChannelSendQueue does
+    """
+
+    def __init__(self, universal_id, connector_factory, loop, maxsize=256, max_batch=16, max_attempts=3):
+        """
+        Args:
+            universal_id (str): Channel (agent) this lane feeds.
+            connector_factory (callable): Returns a connector instance; called
+                lazily by the worker and again after a connector failure.
+            loop (asyncio.AbstractEventLoop): Loop that hosts the worker.
+            maxsize (int): Lane capacity before submit() reports backpressure.
+            max_batch (int): Upper bound of packets coalesced into one send.
+            max_attempts (int): Sends tried per packet before it is given up.
+        """
+        self.universal_id = universal_id
+        self.capacity = maxsize
+        self.max_batch = max(1, max_batch)
+        self.max_attempts = max(1, max_attempts)
+
+        self._factory = connector_factory
+        self._connector = None
+        self._loop = loop
+        self._pending = collections.deque()  # [packet, on_undelivered, attempts], oldest first
+        self._lock = threading.Lock()
+        self._wake = None  # asyncio.Event, created on the loop
+        self._task = None
+        self._stopped = False
+
+        self.stats = {"submitted": 0, "sent": 0, "batches": 0, "rejected": 0, "errors": 0, "retried": 0, "dropped": 0}
+
+    # --------------------------------------------------
+    def submit(self, packet, on_undelivered=None) -> bool:
+        """
+        Queue a packet for ordered delivery. Safe to call from any thread.
+
+        Args:
+            packet (Packet): Secured packet ready for the connector.
+            on_undelivered (callable, optional): Called as
+                on_undelivered(packet, error) if the packet is given up.
+
+        Returns:
+            bool: False if the lane is full (backpressure), True otherwise.
+        """
+        with self._lock:
+            if self._stopped or len(self._pending) >= self.capacity:
+                self.stats["rejected"] += 1
+                return False
+            self._pending.append([packet, on_undelivered, 0])
+
+        self.stats["submitted"] += 1
+        self._loop.call_soon_threadsafe(self._kick)
+        return True
+
+    def depth(self) -> int:
+        """Number of packets waiting to be sent."""
+        return len(self._pending)
+
+    def stop(self):
+        """Signal the worker to exit once its current send completes."""
+        self._stopped = True
+        try:
+            self._loop.call_soon_threadsafe(self._kick)
+        except RuntimeError:
+            pass  # loop already closed
+
+    async def join(self, timeout=2):
+        """Wait briefly for the worker coroutine to finish (call on the loop)."""
+        if self._task and not self._task.done():
+            await asyncio.wait({self._task}, timeout=timeout)
+
+    # --------------------------------------------------
+    def _kick(self):
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        if not self._stopped and (self._task is None or self._task.done()):
+            self._task = self._loop.create_task(self._worker(), name=f"send_lane:{self.universal_id}")
+        self._wake.set()
+
+    def _next_batch(self):
+        """
+        Take the next packet, plus whatever else is already queued
+        (up to max_batch) if the connector can carry a batch envelope.
+        """
+        limit = self.max_batch if self._connector.batch_capable() else 1
+        with self._lock:
+            batch = []
+            while self._pending and len(batch) < limit:
+                batch.append(self._pending.popleft())
+        return batch
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while not self._stopped:
+            batch = []
+            try:
+                if self._connector is None:
+                    self._connector = self._factory()
+
+                batch = self._next_batch()
+                if not batch:
+                    self._wake.clear()
+                    await self._wake.wait()
+                    continue
+
+                packets = [entry[0] for entry in batch]
+                if len(packets) > 1:
+                    sent = await loop.run_in_executor(None, self._connector.send_batch, packets)
+                    self.stats["batches"] += 1
+                else:
+                    ok = await loop.run_in_executor(None, self._connector.send, packets[0])
+                    sent = 0 if ok is False else 1
+                sent = len(packets) if sent is None else sent  # connector can't tell: assume delivered
+                self.stats["sent"] += sent
+
+                if sent < len(batch):
+                    await self._requeue(batch[sent:], "send failed")
+                    continue
+
+                # flash the footer back to idle once the lane is empty
+                if not self._pending:
+                    self._connector.close()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                emit_gui_exception_log(f"AsyncSendLane._worker({self.universal_id})", e)
+                await self._requeue(batch, e)
+
+        with self._lock:
+            left, self._pending = list(self._pending), collections.deque()
+        for entry in left:
+            self._give_up(entry, "send lane stopped")
+        print(f"[SEND-LANE] {self.universal_id} worker exiting.")
+
+    async def _requeue(self, entries, error):
+        """
+        Put undelivered entries back at the head of the lane, in order, and
+        back off; entries out of attempts are dropped and reported instead.
+        """
+        self.stats["errors"] += 1
+        self._connector = None  # rebuild on next packet
+
+        keep = []
+        for entry in entries:
+            entry[2] += 1
+            if entry[2] >= self.max_attempts:
+                self._give_up(entry, error)
+            else:
+                keep.append(entry)
+        self.stats["retried"] += len(keep)
+        with self._lock:
+            self._pending.extendleft(reversed(keep))
+        await asyncio.sleep(1)
+
+    def _give_up(self, entry, error):
+        packet, on_undelivered, attempts = entry
+        self.stats["dropped"] += 1
+        print(f"[SEND-LANE] ❌ {self.universal_id} dropped a packet after {attempts} attempt(s): {error}")
+        if callable(on_undelivered):
+            try:
+                on_undelivered(packet, error)
+            except Exception as e:
+                emit_gui_exception_log(f"AsyncSendLane._give_up({self.universal_id})", e)
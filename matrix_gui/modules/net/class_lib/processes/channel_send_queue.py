@@ -0,0 +1,213 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import queue
+import threading
+import time
+from collections import deque
+
+from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+
+
+class ChannelSendQueue:
+    """
+    ChannelSendQueue — ordered outbound lane for one egress channel
+    ------------------------------------------
+    • One long-lived worker thread per channel (no thread per packet)
+    • Bounded FIFO; submit() refuses instead of blocking when full
+    • Packets leave in the order they were submitted
+    • Coalesces queued packets into a single send_batch() when the
+      connector reports batch_capable()
+    • Packets a send did not deliver go back to the head of the lane and
+      are retried (connector rebuilt, 1s apart); after max_attempts they
+      are dropped and handed to the packet's on_undelivered callback
+    """
+
+    def __init__(self, universal_id, connector_factory, maxsize=256, max_batch=16, max_attempts=3):
+        """
+        Args:
+            universal_id (str): Channel (agent) this queue feeds.
+            connector_factory (callable): Returns a connector instance; called
+                lazily by the worker and again after a connector failure.
+            maxsize (int): Queue capacity before submit() reports backpressure.
+            max_batch (int): Upper bound of packets coalesced into one send.
+            max_attempts (int): Sends tried per packet before it is given up.
+        """
+        self.universal_id = universal_id
+        self.capacity = maxsize
+        self.max_batch = max(1, max_batch)
+        self.max_attempts = max(1, max_attempts)
+
+        self._factory = connector_factory
+        self._connector = None
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._retry = deque()     # [packet, on_undelivered, attempts] awaiting resend, oldest first
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self.stats = {"submitted": 0, "sent": 0, "batches": 0, "rejected": 0, "errors": 0, "retried": 0, "dropped": 0}
+
+    # --------------------------------------------------
+    def submit(self, packet, on_undelivered=None) -> bool:
+        """
+        Queue a packet for ordered delivery.
+
+        Args:
+            packet (Packet): Secured packet ready for the connector.
+            on_undelivered (callable, optional): Called from the worker thread
+                as on_undelivered(packet, error) if the packet is given up.
+
+        Returns:
+            bool: False if the queue is full (backpressure) or stopped, True otherwise.
+        """
+        with self._lock:  # against _drain(): nothing lands after the final sweep
+            if self._stop.is_set() or self.depth() >= self.capacity:
+                self.stats["rejected"] += 1
+                return False
+            try:
+                self._queue.put_nowait([packet, on_undelivered, 0])
+            except queue.Full:
+                self.stats["rejected"] += 1
+                return False
+
+        self.stats["submitted"] += 1
+        self._ensure_worker()
+        return True
+
+    def depth(self) -> int:
+        """Number of packets waiting to be sent, retries included."""
+        return self._queue.qsize() + len(self._retry)
+
+    def stop(self, timeout=2):
+        """
+        Signal the worker to exit and wait briefly for it. Packets still
+        waiting are given up (on_undelivered fires for each).
+        """
+        self._stop.set()
+        try:
+            self._queue.put_nowait(None)  # wake the worker
+        except queue.Full:
+            pass
+        t = self._thread
+        if t and t.is_alive():
+            t.join(timeout=timeout)
+        else:
+            self._drain()  # no worker to do it
+
+    # --------------------------------------------------
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._worker,
+                name=f"send_queue:{self.universal_id}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _next_batch(self):
+        """
+        Take the oldest pending packet (retries first, else block on the
+        queue), then whatever else is already waiting (up to max_batch) if
+        the connector can carry a batch envelope.
+        """
+        if self._retry:
+            batch = [self._retry.popleft()]
+        else:
+            first = self._queue.get()
+            if first is None:
+                return []
+            batch = [first]
+
+        if self._connector is not None and self._connector.batch_capable():
+            while len(batch) < self.max_batch and self._retry:
+                batch.append(self._retry.popleft())
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._stop.set()
+                    break
+                batch.append(nxt)
+        return batch
+
+    def _worker(self):
+        while not self._stop.is_set():
+            batch = []
+            try:
+                if self._connector is None:
+                    self._connector = self._factory()
+
+                batch = self._next_batch()
+                if not batch:
+                    continue
+
+                packets = [entry[0] for entry in batch]
+                if len(packets) > 1:
+                    sent = self._connector.send_batch(packets)
+                    self.stats["batches"] += 1
+                else:
+                    sent = 0 if self._connector.send(packets[0]) is False else 1
+                sent = len(packets) if sent is None else sent  # connector can't tell: assume delivered
+                self.stats["sent"] += sent
+
+                if sent < len(batch):
+                    self._requeue(batch[sent:], "send failed")
+                    continue
+
+                # flash the footer back to idle once the lane is empty
+                if not self.depth():
+                    self._connector.close()
+
+            except Exception as e:
+                emit_gui_exception_log(f"ChannelSendQueue._worker({self.universal_id})", e)
+                self._requeue(batch, e)
+
+        self._drain()
+        print(f"[SEND-QUEUE] {self.universal_id} worker exiting.")
+
+    def _drain(self):
+        """Give up everything still waiting, retries first to keep the order."""
+        with self._lock:
+            left = list(self._retry)
+            self._retry.clear()
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is not None:
+                    left.append(entry)
+        for entry in left:
+            self._give_up(entry, "send queue stopped")
+
+    def _requeue(self, entries, error):
+        """
+        Put undelivered entries back at the head of the lane, in order, and
+        back off; entries out of attempts are dropped and reported instead.
+        """
+        self.stats["errors"] += 1
+        self._connector = None  # rebuild on next packet
+
+        keep = []
+        for entry in entries:
+            entry[2] += 1
+            if entry[2] >= self.max_attempts:
+                self._give_up(entry, error)
+            else:
+                keep.append(entry)
+        self.stats["retried"] += len(keep)
+        self._retry.extendleft(reversed(keep))
+        time.sleep(1)
+
+    def _give_up(self, entry, error):
+        packet, on_undelivered, attempts = entry
+        self.stats["dropped"] += 1
+        print(f"[SEND-QUEUE] ❌ {self.universal_id} dropped a packet after {attempts} attempt(s): {error}")
+        if callable(on_undelivered):
+            try:
+                on_undelivered(packet, error)
+            except Exception as e:
+                emit_gui_exception_log(f"ChannelSendQueue._give_up({self.universal_id})", e)
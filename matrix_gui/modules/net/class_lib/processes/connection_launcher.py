@@ -5,6 +5,7 @@ import threading
 import time
 import uuid
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from .channel_send_queue import ChannelSendQueue
 class ConnectionLauncher:
     """
     ConnectionLauncher — Swarm Thread Orchestrator
@@ -12,6 +13,7 @@ class ConnectionLauncher:
     • Dynamically loads classes
     • Executes them as managed threads
     • Supports ephemeral and persistent workers
+    • Ephemeral sends ride one ordered ChannelSendQueue per channel
     • Centralized logging via BootAgent.log
     """
 
@@ -23,17 +25,19 @@ class ConnectionLauncher:
             _threads (dict): Maps thread_id → threading.Thread instance.
             _registry (dict): Maps universal_id → metadata dict for each connector.
             _shared_state (dict): Maps universal_id → shared context dict.
+            _queues (dict): Maps universal_id → ChannelSendQueue for ephemeral sends.
             _lock (threading.Lock): Ensures thread-safe registry updates.
         """
         self._threads = {}        # thread_id -> Thread
         self._registry = {}       # thread_id -> metadata
         self._shared_state = {}   # thread_id -> shared dict
+        self._queues = {}         # universal_id -> ChannelSendQueue
         self._lock = threading.Lock()
 
         print("ConnectionLauncher initialized")
 
     # --------------------------------------------------
-    def load(self, universal_id, class_path, context=None, check_interval=30):
+    def load(self, universal_id, class_path, context=None, check_interval=30, queue_size=256, max_batch=16):
         """
         Register a connector class under a universal identifier.
 
@@ -42,6 +46,8 @@ class ConnectionLauncher:
             class_path (str): Dotted path to the connector class.
             context (dict, optional): Initial context passed into connector instances.
             check_interval (int, optional): Heartbeat check interval in seconds.
+            queue_size (int, optional): Capacity of the channel's send queue.
+            max_batch (int, optional): Packets coalesced per send when the target batches.
 
         Returns:
             ConnectionLauncher: Self for fluent chaining.
@@ -56,6 +62,8 @@ class ConnectionLauncher:
                 "persist": True,  # persistent by definition
                 "check_interval": check_interval,
                 "thread_id": None,
+                "queue_size": queue_size,
+                "max_batch": max_batch,
             }
 
             self._shared_state[universal_id] = {
@@ -80,11 +88,20 @@ class ConnectionLauncher:
             universal_id (str): Identifier under which the class was loaded.
             packet (dict, optional): Initial packet data to inject into context.
             fire_catapult (bool, optional): Force immediate launch even if run_on_launch=False.
+                Ephemeral connectors are not given a thread; the packet is
+                handed to the channel's send queue instead (see enqueue()).
 
         Returns:
             threading.Thread | None: The thread object if launched, else None.
         """
         try:
+            if fire_catapult and packet is not None:
+                meta = self._registry.get(universal_id)
+                cls = self._load_class(meta["class_path"]) if meta else None
+                if cls and not getattr(cls, "persistent", False):
+                    self.enqueue(universal_id, packet)
+                    return None
+
             with self._lock:
                 meta = self._registry.get(universal_id)
                 if not meta:
@@ -141,6 +158,78 @@ class ConnectionLauncher:
         except Exception as e:
             emit_gui_exception_log("ConnectionLauncher.launch()", e)
 
+    # --------------------------------------------------
+    def enqueue(self, universal_id, packet, on_undelivered=None) -> bool:
+        """
+        Hand a packet to the channel's long-lived send worker.
+
+        The queue is created on first use; its worker owns a single connector
+        instance and delivers packets in submission order.
+
+        Args:
+            universal_id (str): Identifier under which the class was loaded.
+            packet (Packet): Secured packet to deliver.
+            on_undelivered (callable, optional): on_undelivered(packet, error),
+                called from the send worker if the packet is given up.
+
+        Returns:
+            bool: False if the channel is unknown or its queue is full.
+        """
+        try:
+            q = self._get_queue(universal_id)
+            if not q:
+                print(f"[ENQUEUE][ERROR] No such universal_id {universal_id}")
+                return False
+            return q.submit(packet, on_undelivered)
+
+        except Exception as e:
+            emit_gui_exception_log("ConnectionLauncher.enqueue()", e)
+            return False
+
+    def queue_depth(self, universal_id):
+        """
+        Returns:
+            tuple[int, int]: (queued packets, capacity) for the channel, or (0, 0).
+        """
+        q = self._queues.get(universal_id)
+        return (q.depth(), q.capacity) if q else (0, 0)
+
+    def _get_queue(self, universal_id):
+        with self._lock:
+            q = self._queues.get(universal_id)
+            if q:
+                return q
+
+            meta = self._registry.get(universal_id)
+            if not meta:
+                return None
+
+            context = meta["context"]
+            class_path = meta["class_path"]
+
+            def factory():
+                cls = self._load_class(class_path)
+                return cls(shared={
+                    "universal_id": universal_id,
+                    "session_id": context.get("session_id"),
+                    "agent": context.get("agent"),
+                    "deployment": context.get("deployment"),
+                    "context": context,
+                })
+
+            q = self._make_queue(universal_id, factory, meta)
+            self._queues[universal_id] = q
+            return q
+
+    def _make_queue(self, universal_id, factory, meta):
+        """Build the send queue for a channel; runtimes override this."""
+        return ChannelSendQueue(
+            universal_id,
+            factory,
+            maxsize=meta.get("queue_size", 256),
+            max_batch=meta.get("max_batch", 16),
+        )
+
     # --------------------------------------------------
     def kill_thread(self, universal_id: str):
         """
@@ -296,6 +385,11 @@ class ConnectionLauncher:
                         shared["stop"] = True
 
                 threads = list(self._threads.items())
+                queues = list(self._queues.values())
+
+            # drain-stop the send workers
+            for q in queues:
+                q.stop()
 
             # attempt graceful join
             for tid, t in threads:
@@ -308,6 +402,7 @@ class ConnectionLauncher:
                 self._threads.clear()
                 self._registry.clear()
                 self._shared_state.clear()
+                self._queues.clear()
 
             # stop monitor loop if any
             if hasattr(self, "_monitor_thread") and self._monitor_thread.is_alive():
@@ -323,6 +418,7 @@ class ConnectionLauncher:
                 self._threads.clear()
                 self._registry.clear()
                 self._shared_state.clear()
+                self._queues.clear()
                 self._monitor_thread = None
                 print("[ConnectionLauncher][DESTROY][FORCE] ⚠️ Forced purge completed.")
 
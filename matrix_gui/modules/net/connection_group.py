@@ -21,7 +21,10 @@ from typing import Callable, Dict, Optional, Any, Tuple, List
 import re, json, ssl, socket, hashlib
 from urllib.parse import urlparse
 
+from requests.adapters import HTTPAdapter
+
 from matrix_gui.modules.net.routing_shim import RouteSpec, build_requests_proxies
+from matrix_gui.core.utils.ssl_context_cache import SSLContextCache
 
 # ---------------------------------------------------------------------------
 # [LEGACY] Kept as reference only; not used directly by connect() anymore.
@@ -76,6 +79,35 @@ class Transport:
 
 # ---------- HTTPS transport --------------------------------------------------
 
+class _SSLContextAdapter(HTTPAdapter):
+    """
+    requests adapter that hands urllib3 a prebuilt SSLContext.
+    Trust roots and client auth live in the context, so requests is kept
+    from loading CA/cert files into it (the context is shared via SSLContextCache).
+    """
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().proxy_manager_for(proxy, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        for k in ("ca_certs", "ca_cert_dir", "cert_file", "key_file"):
+            pool_kwargs.pop(k, None)
+        pool_kwargs["ssl_context"] = self._ssl_context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        return
+
+
 class HttpsTransport(Transport):
     """Bound HTTPS client using requests with strict verification and optional mTLS."""
     def __init__(self, proto: str, host: str, port: int, route: RouteSpec | None = None):
@@ -91,23 +123,40 @@ class HttpsTransport(Transport):
         if proxies:
             s.proxies = proxies
 
-        cp, temps = _mat_profile(cert_profile)
-        self._temps = temps
-
-        # Client auth (mTLS) if provided
-        if cp.get("https_client_cert") and cp.get("https_client_key"):
-            s.cert = (cp["https_client_cert"], cp["https_client_key"])  # type: ignore[arg-type]
-
-        # STRICT verification:
-        #  - If a CA is provided, pin to it.
-        #  - Otherwise use the system trust store (secure default).
-        s.verify = cp["https_ca"] if cp.get("https_ca") else True
+        pem = _normalize_profile(cert_profile)
+        crt, key, ca = pem.get("https_client_cert"), pem.get("https_client_key"), pem.get("https_ca")
+
+        if all(_is_pem(v) for v in (crt, key, ca) if v):
+            # In-memory material → shared cached context, no temp files.
+            # STRICT verification: pinned to the CA if given, else system trust store.
+            tls = SSLContextCache.get(
+                f"https:{self.host}:{self.port}",
+                cert_pem=crt if (crt and key) else None,
+                key_pem=key if (crt and key) else None,
+                ca_pem=ca or None,
+                verify=True,
+            )
+            s.mount(self.base("/"), _SSLContextAdapter(tls.context))
+            print(f"[HTTPS] verify → cached context {tls.fingerprint[:12]}")
+        else:
+            # Profile references files on disk; let requests load them.
+            cp, temps = _mat_profile(cert_profile)
+            self._temps = temps
+
+            # Client auth (mTLS) if provided
+            if cp.get("https_client_cert") and cp.get("https_client_key"):
+                s.cert = (cp["https_client_cert"], cp["https_client_key"])  # type: ignore[arg-type]
+
+            # STRICT verification:
+            #  - If a CA is provided, pin to it.
+            #  - Otherwise use the system trust store (secure default).
+            s.verify = cp["https_ca"] if cp.get("https_ca") else True
 
-        try:
-            where = s.verify if isinstance(s.verify, str) else "system trust store"
-            print(f"[HTTPS] verify → {where}")
-        except Exception:
-            pass
+            try:
+                where = s.verify if isinstance(s.verify, str) else "system trust store"
+                print(f"[HTTPS] verify → {where}")
+            except Exception:
+                pass
 
         self.session, self.bound = s, True
 
@@ -421,15 +470,46 @@ def _nuke(path: str) -> None:
         pass
 
 
+def _is_pem(val) -> bool:
+    return "BEGIN" in str(val or "")
+
+
 def _mat_profile(cp: dict) -> Tuple[dict, List[str]]:
     """
     Normalize a cert_profile into the exact keys the transports need and write
     any PEM strings to temp files so requests/ssl can load them.
 
-    Accepts both nested and flattened vault shapes (e.g. "<tag>/connection/*").
+    Only used when a profile mixes in file paths; pure-PEM profiles go through
+    _normalize_profile() and SSLContextCache instead.
     Returns (normalized_profile, temp_paths_to_cleanup).
     """
     temps: List[str] = []
+    out = _normalize_profile(cp)
+
+    def _write_if_pem(val, suf) -> str:
+        if not val:
+            return ""
+        s = str(val)
+        if "BEGIN" in s:  # PEM string → temp file
+            f = tempfile.NamedTemporaryFile(delete=False, suffix=suf)
+            f.write(s.encode("utf-8")); f.flush(); f.close()
+            temps.append(f.name)
+            return f.name
+        return s  # assume already a path
+
+    out["https_client_cert"] = _write_if_pem(out.get("https_client_cert") or out.get("cert"), ".crt")
+    out["https_client_key"]  = _write_if_pem(out.get("https_client_key")  or out.get("key"),  ".key")
+    out["https_ca"]          = _write_if_pem(out.get("https_ca")          or out.get("ca"),   ".pem")
+    return out, temps
+
+
+def _normalize_profile(cp: dict) -> dict:
+    """
+    Normalize a cert_profile into the exact keys the transports need
+    (https_client_cert / https_client_key / https_ca), values left as-is.
+
+    Accepts both nested and flattened vault shapes (e.g. "<tag>/connection/*").
+    """
     out: dict = dict(cp or {})
 
     # Fallback mapping if caller forgot to normalize
@@ -482,21 +562,10 @@ def _mat_profile(cp: dict) -> Tuple[dict, List[str]]:
     if bundle:
         out["https_ca"] = "\n".join(bundle)
 
-    def _write_if_pem(val, suf) -> str:
-        if not val:
-            return ""
-        s = str(val)
-        if "BEGIN" in s:  # PEM string → temp file
-            f = tempfile.NamedTemporaryFile(delete=False, suffix=suf)
-            f.write(s.encode("utf-8")); f.flush(); f.close()
-            temps.append(f.name)
-            return f.name
-        return s  # assume already a path
-
-    out["https_client_cert"] = _write_if_pem(out.get("https_client_cert") or out.get("cert"), ".crt")
-    out["https_client_key"]  = _write_if_pem(out.get("https_client_key")  or out.get("key"),  ".key")
-    out["https_ca"]          = _write_if_pem(out.get("https_ca")          or out.get("ca"),   ".pem")
-    return out, temps
+    out["https_client_cert"] = out.get("https_client_cert") or out.get("cert")
+    out["https_client_key"]  = out.get("https_client_key")  or out.get("key")
+    out["https_ca"]          = out.get("https_ca")          or out.get("ca")
+    return out
 
 
 # ---- top-level helpers ------------------------------------------------------
@@ -610,25 +679,17 @@ def build_ws_ssl_context(cert_profile: dict, server_hostname: str) -> ssl.SSLCon
     if not (ca_pem and crt_pem and key_pem):
         raise RuntimeError("Missing TLS material for WSS (https_ca/client_cert/client_key)")
 
-    # Use cadata for the CA; client chain still needs file paths (Python ssl limitation)
-    ctx = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH, cafile=None, capath=None, cadata=ca_pem)
-    ctx.verify_mode = ssl.CERT_REQUIRED
-    ctx.check_hostname = True  # SAN should include your IP/host
-
-    # Write client cert/key to temp files for load_cert_chain
-    crt_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pem")
-    key_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pem")
-    try:
-        crt_tmp.write(crt_pem.encode("utf-8")); crt_tmp.flush(); crt_tmp.close()
-        key_tmp.write(key_pem.encode("utf-8")); key_tmp.flush(); key_tmp.close()
-        ctx.load_cert_chain(certfile=crt_tmp.name, keyfile=key_tmp.name)
-    finally:
-        # stash paths on the context for cleanup by caller
-        ctx._tmp_paths = [crt_tmp.name, key_tmp.name]  # type: ignore[attr-defined]
-
-    # SNI: set by your WS lib via 'server_hostname' or from URL; keep host here for reference
-    ctx._server_hostname = server_hostname  # type: ignore[attr-defined]
-    return ctx
+    # CERT_REQUIRED + hostname check (SAN should include your IP/host); the
+    # context is shared through SSLContextCache, so nothing is written to disk
+    # and cleanup_ws_ssl_context() has no temp paths to remove.
+    tls = SSLContextCache.get(
+        f"wss:{server_hostname}",
+        cert_pem=crt_pem,
+        key_pem=key_pem,
+        ca_pem=ca_pem,
+        verify=True,
+    )
+    return tls.context
 
 def _probe_server_identity(host: str, port: int) -> Tuple[str, str]:
     ctx = ssl.create_default_context()
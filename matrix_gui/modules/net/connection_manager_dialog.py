@@ -15,6 +15,7 @@ from matrix_gui.modules.net.edit_connection_dialog import edit_connection_dialog
 from matrix_gui.core.event_bus import EventBus
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
 from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
+from matrix_gui.modules.vault.services.vault_snapshot import thaw
 
 
 class ConnectionManagerDialog(QtWidgets.QDialog):
@@ -90,8 +91,8 @@ class ConnectionManagerDialog(QtWidgets.QDialog):
         return VaultCoreSingleton.get().read()
 
     def _connection_manager(self):
-        v = self._vault()
-        return v.setdefault("connection_manager", {})
+        # editable copy of just this section; changes go back through patch()
+        return thaw(VaultCoreSingleton.get().snapshot("connection_manager"))
 
     def _current_proto(self):
         idx = self.tabs.currentIndex()
@@ -142,21 +143,8 @@ class ConnectionManagerDialog(QtWidgets.QDialog):
         """Find deployments where connection is referenced."""
 
         try:
-            used = []
-            deployments = self._vault().get("deployments", {})
-
-            for dep_id, dep in deployments.items():
-                if not isinstance(dep, dict):
-                    continue
-
-                for agent in dep.get("agents", []):
-                    for tag in agent.get("tags", []):
-                        ct = tag.get("connection-tag")
-                        if ct and ct.get("id") == conn_id:
-                            used.append(dep_id)
-
-            return used
-
+            dep_store = VaultCoreSingleton.get().get_store("deployments")
+            return sorted(dep_store.references("connection", conn_id))
 
         except Exception as e:
             emit_gui_exception_log("ConnectionManagerDialog._find_usage", e)
@@ -1,11 +1,9 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
-import os, ssl, socket, http.client, json, time, uuid
-from Crypto.PublicKey import RSA
-from matrix_gui.core.utils.spki_utils import verify_spki_pin
+import json, time
 from matrix_gui.core.utils.crypto_utils import sign_data
-from matrix_gui.modules.net.entity.adapter.agent_cert_wrapper import AgentCertWrapper
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
 from matrix_gui.config.boot.globals import get_sessions
-from matrix_gui.core.utils.cert_loader import load_cert_chain_from_memory
+from .https_pool import HTTPSConnectionPool
 from matrix_gui.core.connector_bus import ConnectorBus
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.modules.net.connector.interfaces.base_connector import BaseConnector
@@ -27,6 +25,7 @@ class HTTPSConnector(BaseConnector):
     """
     persistent = False
     run_on_launch = False   # launcher will start it automatically
+    supports_batch = True   # 'matrix_batch' envelopes, if the agent opts in
 
     def __init__(self, shared=None):
         """
@@ -96,16 +95,58 @@ class HTTPSConnector(BaseConnector):
           1. Emit start event on ConnectorBus.
           2. Wrap the packet with timestamp and session metadata.
           3. Sign payload with RSA private key from deployment certs.
-          4. Establish a TLS socket with custom CA and client cert.
-          5. Verify server SPKI pin.
-          6. POST JSON payload to '/matrix' endpoint.
-          7. Clean up sockets and temporary cert files.
-          8. Emit end event on ConnectorBus.
+          4. Borrow a keep-alive TLS connection from the agent's
+             HTTPSConnectionPool (SPKI pinned when the socket was opened).
+          5. POST JSON payload to '/matrix' endpoint.
+          6. Return the connection to the pool.
+          7. Emit end event on ConnectorBus.
+
+        Returns:
+            bool: True if the agent accepted the packet.
+        """
+        inner = {
+            "matrix_packet": packet.get_packet(),
+            "ts": int(time.time()),
+            "session_id": self.session_id,
+        }
+        return self._transmit(inner, timeout)
+
+    def send_batch(self, packets: list, timeout=10):
+        """
+        Sign and POST several Matrix packets as one batch envelope.
+
+        Only used when the target agent advertises connection.batch; the
+        packets travel in submission order under a single signature.
+
+        Args:
+            packets (list[Packet]): Packets to send, oldest first.
+            timeout (int): Seconds to wait for network operations.
+
+        Returns:
+            int: Packets delivered; all or none, since they share one envelope.
+        """
+        inner = {
+            "matrix_batch": [p.get_packet() for p in packets],
+            "ts": int(time.time()),
+            "session_id": self.session_id,
+        }
+        return len(packets) if self._transmit(inner, timeout) else 0
+
+    def _transmit(self, inner: dict, timeout=10):
+        """
+        Sign an inner envelope and POST it over the agent's connection pool.
+
+        Args:
+            inner (dict): Envelope body carrying 'matrix_packet' or 'matrix_batch'.
+            timeout (int): Seconds to wait for network operations.
+
+        Returns:
+            bool: True on a 2xx reply; False if the envelope was not delivered.
         """
         ctx = get_sessions().get(self.session_id)
         if not ctx:
             print(f"[HTTPSConnector] ❌ No session context for {self.session_id}")
-            return
+            return False
 
         # Emit start of transmission
         if hasattr(ctx, "bus"):
@@ -113,59 +154,23 @@ class HTTPSConnector(BaseConnector):
 
         uid = self.agent.get("universal_id")
         try:
-            inner = {
-                "matrix_packet": packet.get_packet(),
-                "ts": int(time.time()),
-                "session_id": self.session_id,
-            }
-
             #flash connecting on session_window footer
             self._emit_status("connected")
 
-            signing = self.deployment["certs"][uid]["signing"]
-            priv_key = RSA.import_key(signing["remote_privkey"].encode())
+            priv_key = RSAKeyCache.for_signing(self.deployment, uid, "remote_privkey")
             sig_b64 = sign_data(inner, priv_key)
             outer = {"sig": sig_b64, "content": inner}
             body = json.dumps(outer).encode()
 
-            # ---- Setup TLS context ----
-            cert_adapter = AgentCertWrapper(self.agent, self.deployment)
-            ctx_ssl = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-
-            ctx_ssl.check_hostname = False
-            ctx_ssl.verify_mode = ssl.CERT_NONE
-            ctx_ssl.load_verify_locations(cadata=cert_adapter.ca_root_cert)
-            pin, cert_path, key_path = load_cert_chain_from_memory(
-                ctx_ssl, cert_adapter.cert, cert_adapter.key
-            )
-
-            # ---- Build secure connection ----
-            raw_sock = socket.create_connection((self.host, self.port), timeout=timeout)
-            tls_sock = ctx_ssl.wrap_socket(raw_sock, server_hostname=self.host)
-
-            # Verify SPKI
-            peer_cert = tls_sock.getpeercert(binary_form=True)
-            ok, actual_pin = verify_spki_pin(peer_cert, cert_adapter.server_spki_pin)
-            if not ok:
-                raise ConnectionError(f"SPKI mismatch: {actual_pin}")
-
-            https_conn = http.client.HTTPSConnection(self.host, self.port, context=ctx_ssl)
-            https_conn.sock = tls_sock
-            https_conn.request(
-                "POST", "/matrix", body, headers={"Content-Type": "application/json"}
-            )
-            resp = https_conn.getresponse()
-            print(f"[HTTPSConnector] 🌐 Sent → HTTPS {resp.status}")
-
-            # ---- Cleanup ----
-            https_conn.close()
-            tls_sock.close()
-            raw_sock.close()
-            os.remove(cert_path)
-            os.remove(key_path)
+            # ---- Pooled keep-alive connection (pinned once per socket) ----
+            pool = HTTPSConnectionPool.get(self.session_id, self.agent, self.deployment)
+            status, _ = pool.post("/matrix", body, timeout=timeout)
+            print(f"[HTTPSConnector] 🌐 Sent → HTTPS {status}")
+            return 200 <= status < 300
 
         except Exception as e:
             print(f"[HTTPSConnector] ❌ Send error: {e}")
+            return False
 
         finally:
             if hasattr(ctx, "bus"):
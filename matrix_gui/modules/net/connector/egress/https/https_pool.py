@@ -0,0 +1,244 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import socket, http.client, threading, time
+from matrix_gui.core.utils.ssl_context_cache import SSLContextCache
+
+
+class HTTPSConnectionPool:
+    """
+    Per-agent pool of persistent, SPKI-pinned HTTPS connections.
+
+    One pool exists per (session_id, universal_id). The pool:
+      - reuses the agent's cached client SSLContext (SSLContextCache)
+      - pins the server SPKI once per new TLS connection
+      - offers the last TLS session back to the server for resumption
+      - keeps idle HTTP/1.1 keep-alive connections for reuse
+
+    A request on a reused connection that the server has since dropped is
+    retried once on a fresh connection.
+
+    Every get() hands the pool the connector's current agent/deployment; if
+    the endpoint or the TLS material (certs, SPKI pins) changed, idle
+    sockets and the cached TLS session are dropped so the next request
+    handshakes with the new material.
+
+    Attributes:
+        max_idle (int): Idle connections retained per agent.
+        idle_ttl (float): Seconds an idle connection may sit before it is discarded.
+    """
+    _pools = {}  # (session_id, universal_id) → HTTPSConnectionPool
+    _pools_lock = threading.Lock()
+
+    max_idle = 4
+    idle_ttl = 55
+
+    def __init__(self, agent: dict, deployment: dict):
+        """
+        Args:
+            agent (dict): Agent metadata including 'universal_id' and 'connection'.
+            deployment (dict): Deployment context holding the agent's certs.
+        """
+        conn = agent.get("connection", {}) or {}
+        self.host = conn.get("host")
+        self.port = conn.get("port")
+        self.uid = agent.get("universal_id")
+
+        self._agent = agent
+        self._deployment = deployment
+        self._tls_session = None
+        self._tls_fp = None  # fingerprint of the context that produced _tls_session
+        self._idle = []  # [(HTTPSConnection, released_at)]
+        self._lock = threading.Lock()
+
+        self.stats = {"connects": 0, "reused": 0, "resumed": 0, "retries": 0}
+
+    # ------------------------------------------------------------------
+    # Registry
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, session_id: str, agent: dict, deployment: dict):
+        """
+        Return the pool for this session's agent, creating it on first use
+        and refreshing its agent/deployment otherwise.
+
+        Args:
+            session_id (str): Owning session.
+            agent (dict): Agent metadata including 'universal_id'.
+            deployment (dict): Deployment context holding the agent's certs.
+
+        Returns:
+            HTTPSConnectionPool: Shared pool for the agent.
+        """
+        key = (session_id, agent.get("universal_id"))
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(agent, deployment)
+                cls._pools[key] = pool
+                return pool
+        pool.refresh(agent, deployment)
+        return pool
+
+    def refresh(self, agent: dict, deployment: dict):
+        """
+        Adopt the connector's current agent/deployment.
+
+        Args:
+            agent (dict): Agent metadata including 'connection'.
+            deployment (dict): Deployment context holding the agent's certs.
+        """
+        conn = agent.get("connection", {}) or {}
+        endpoint = (conn.get("host"), conn.get("port"))
+        with self._lock:
+            self._agent = agent
+            self._deployment = deployment
+            stale = endpoint != (self.host, self.port)
+            self.host, self.port = endpoint
+            fp = self._tls_fp
+
+        if not stale and fp is not None:
+            stale = SSLContextCache.for_agent(agent, deployment).fingerprint != fp
+        if stale:
+            self.close()
+
+    @classmethod
+    def close_session(cls, session_id: str):
+        """
+        Close and forget every pool that belongs to a session.
+
+        Args:
+            session_id (str): Session whose pools should be torn down.
+        """
+        with cls._pools_lock:
+            keys = [k for k in cls._pools if k[0] == session_id]
+            pools = [cls._pools.pop(k) for k in keys]
+        for pool in pools:
+            pool.close()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def post(self, path: str, body: bytes, headers: dict = None, timeout=10):
+        """
+        POST a body over a pooled connection.
+
+        Args:
+            path (str): Request path, e.g. '/matrix'.
+            body (bytes): Encoded request body.
+            headers (dict, optional): Extra request headers.
+            timeout (int): Socket timeout in seconds for this request.
+
+        Returns:
+            tuple[int, bytes]: HTTP status and fully-read response body.
+        """
+        hdrs = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        hdrs.update(headers or {})
+
+        conn, reused = self._acquire(timeout)
+        try:
+            status, data, will_close = self._roundtrip(conn, path, body, hdrs, timeout)
+        except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            conn.close()
+            if not reused:
+                raise
+            # server dropped an idle keep-alive socket; one fresh attempt
+            self.stats["retries"] += 1
+            conn, _ = self._acquire(timeout, fresh=True)
+            status, data, will_close = self._roundtrip(conn, path, body, hdrs, timeout)
+        except Exception:
+            conn.close()
+            raise
+
+        self._release(conn, will_close)
+        return status, data
+
+    def close(self):
+        """Close every idle connection and drop the cached TLS session."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._tls_session = None
+            self._tls_fp = None
+        for conn, _ in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _roundtrip(self, conn, path, body, headers, timeout):
+        conn.sock.settimeout(timeout)
+        conn.request("POST", path, body, headers=headers)
+        resp = conn.getresponse()
+        data = resp.read()  # drain fully so the socket can be reused
+        return resp.status, data, resp.will_close
+
+    def _acquire(self, timeout, fresh=False):
+        """
+        Take an idle connection or open a new one.
+
+        Returns:
+            tuple[http.client.HTTPSConnection, bool]: Connection and whether it was reused.
+        """
+        if not fresh:
+            now = time.time()
+            with self._lock:
+                while self._idle:
+                    conn, released_at = self._idle.pop()
+                    if (now - released_at < self.idle_ttl and conn.sock is not None
+                            and conn.tls_fingerprint == self._tls_fp):  # not from superseded material
+                        self.stats["reused"] += 1
+                        return conn, True
+                    conn.close()
+        return self._connect(timeout), False
+
+    def _release(self, conn, will_close):
+        # TLS 1.3 tickets arrive after the handshake; refresh once data has flowed
+        session = getattr(conn.sock, "session", None)
+        if session is not None:
+            self._tls_session = session
+
+        if will_close or conn.sock is None:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def _connect(self, timeout):
+        """
+        Open a TLS connection, resuming the last session when possible,
+        and pin the server SPKI before handing it out.
+        """
+        if not self.host or not self.port:
+            raise ConnectionError(f"[HTTPS-POOL] Missing host/port for {self.uid}")
+
+        tls = SSLContextCache.for_agent(self._agent, self._deployment)
+        session = self._tls_session if self._tls_fp == tls.fingerprint else None
+        raw_sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        try:
+            tls_sock = tls.context.wrap_socket(raw_sock, server_hostname=self.host, session=session)
+        except Exception:
+            raw_sock.close()
+            raise
+
+        peer_cert = tls_sock.getpeercert(binary_form=True)
+        ok, actual_pin = tls.verify_peer(peer_cert)
+        if not ok:
+            tls_sock.close()
+            raise ConnectionError(f"SPKI mismatch: {actual_pin}")
+
+        self.stats["connects"] += 1
+        if tls_sock.session_reused:
+            self.stats["resumed"] += 1
+        if tls_sock.session is not None:
+            self._tls_session = tls_sock.session
+        self._tls_fp = tls.fingerprint
+
+        https_conn = http.client.HTTPSConnection(self.host, self.port, context=tls.context, timeout=timeout)
+        https_conn.sock = tls_sock
+        https_conn.tls_fingerprint = tls.fingerprint
+        return https_conn
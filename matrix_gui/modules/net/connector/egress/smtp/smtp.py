@@ -1,10 +1,11 @@
-import smtplib, ssl, json, base64, time
+import smtplib, json, base64, time
 from email.message import EmailMessage
 from matrix_gui.core.class_lib.packet_delivery.utility.security.packet_security import wrap_packet_securely
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.modules.net.connector.interfaces.base_connector import BaseConnector
 from matrix_gui.config.boot.globals import get_sessions
 from matrix_gui.core.connector_bus import ConnectorBus
+from matrix_gui.core.utils.ssl_context_cache import SSLContextCache
 
 class SMTPConnector(BaseConnector):
     """
@@ -93,11 +94,14 @@ class SMTPConnector(BaseConnector):
           4. Base64-encode the JSON payload into email body.
           5. Connect to SMTP server over TLS, authenticate, and send.
           6. Emit end event on ConnectorBus.
+
+        Returns:
+            bool: True if the SMTP server accepted the message.
         """
         ctx = get_sessions().get(self.session_id)
         if not ctx:
             print(f"[SMTPConnector] ❌ No session context for {self.session_id}")
-            return
+            return False
 
         if hasattr(ctx, "bus"):
             ctx.bus.emit("channel.packet.sent", start_end=1)
@@ -128,10 +132,8 @@ class SMTPConnector(BaseConnector):
             msg["Subject"] = f"Phoenix → Swarm Packet ({self.agent.get('universal_id')})"
             msg.set_content(payload_b64)
 
-            # Secure connection
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            # Secure connection (context built once per agent, see SSLContextCache)
+            context = SSLContextCache.get(f"smtp:{self.agent.get('universal_id')}").context
 
             with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=timeout) as server:
                 server.starttls(context=context)
@@ -139,9 +141,11 @@ class SMTPConnector(BaseConnector):
                 server.send_message(msg)
 
             print(f"[SMTPConnector] 📧 Sent packet to {self.to_addr}")
+            return True
 
         except Exception as e:
             print(f"[SMTPConnector] ❌ SMTP send error: {e}")
+            return False
 
         finally:
             if hasattr(ctx, "bus"):
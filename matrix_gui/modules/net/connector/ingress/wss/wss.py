@@ -1,44 +1,27 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
-import os, ssl, json, time, socket, tempfile
+import ssl, json, time, socket, select, asyncio
 from websocket import create_connection
-from Crypto.PublicKey import RSA
+from websockets.asyncio.client import connect as ws_connect
 
 from websocket._exceptions import WebSocketTimeoutException
 from matrix_gui.config.boot.globals import get_sessions
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
-from matrix_gui.modules.net.entity.adapter.agent_cert_wrapper import AgentCertWrapper
-from matrix_gui.core.utils.spki_utils import verify_spki_pin
+from matrix_gui.core.utils.ssl_context_cache import SSLContextCache
 from matrix_gui.core.utils import crypto_utils
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
 from matrix_gui.core.connector_bus import ConnectorBus
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.modules.net.connector.interfaces.base_connector import BaseConnector
 
 
-def _write_temp_pem(data: str, suffix=".pem"):
-    """
-    Write certificate or key data to a secure temporary PEM file.
-
-    Args:
-        data (str): PEM-formatted certificate or key.
-        suffix (str): File suffix (default ".pem").
-
-    Returns:
-        str: Filesystem path to the created temporary PEM file.
-    """
-    fd, path = tempfile.mkstemp(suffix=suffix)
-    with os.fdopen(fd, "w") as f:
-        f.write(data)
-    return path
-
 def _establish_connection(host, port, agent, deployment, session_id, timeout=5):
     """
     Create and authenticate a secure WebSocket connection.
 
-    1. Writes client cert/key to temp PEM files.
+    1. Fetches the agent's cached client SSLContext (no PEM files).
     2. Opens WSS socket with disabled hostname/CERT checks.
     3. Verifies server SPKI pin.
     4. Sends a signed 'hello' handshake message.
-    5. Cleans up temp PEM files.
 
     Args:
         host (str): WebSocket server hostname.
@@ -51,19 +34,15 @@ def _establish_connection(host, port, agent, deployment, session_id, timeout=5):
     Returns:
         websocket.WebSocket | None: Active WebSocket on success, else None.
     """
-    cert_adapter = AgentCertWrapper(agent, deployment)
-    cert_path = key_path = None
     try:
-        cert_path = _write_temp_pem(cert_adapter.cert)
-        key_path = _write_temp_pem(cert_adapter.key)
+        tls = SSLContextCache.for_agent(agent, deployment)
         url = f"wss://{host}:{port}/ws"
 
         ws = create_connection(
             url,
             timeout=timeout,
             sslopt={
-                "certfile": cert_path,
-                "keyfile": key_path,
+                "context": tls.context,
                 "cert_reqs": ssl.CERT_NONE,
                 "check_hostname": False,
             },
@@ -71,33 +50,68 @@ def _establish_connection(host, port, agent, deployment, session_id, timeout=5):
 
         # SPKI verify
         peer_cert = ws.sock.getpeercert(binary_form=True)
-        ok, actual_pin = verify_spki_pin(peer_cert, cert_adapter.server_spki_pin)
+        ok, actual_pin = tls.verify_peer(peer_cert)
         if not ok:
             ws.close()
-            raise ConnectionError(f"SPKI mismatch: expected {cert_adapter.server_spki_pin}, got {actual_pin}")
+            raise ConnectionError(f"SPKI mismatch: expected {tls.server_spki_pin}, got {actual_pin}")
 
         # signed hello
-        hello = {
-            "type": "hello",
-            "session_id": session_id,
-            "agent": agent.get("universal_id"),
-            "ts": int(time.time()),
-        }
-        priv_pem = deployment.get("certs", {}).get(agent.get("universal_id"), {}).get("signing", {}).get("remote_privkey")
-        priv_key = RSA.import_key(priv_pem.encode())
-        hello["sig"] = crypto_utils.sign_data(hello, priv_key)
-        ws.send(json.dumps(hello))
+        ws.send(json.dumps(_signed_hello(agent, deployment, session_id)))
         ws.settimeout(60)
         return ws
 
     except Exception as e:
         emit_gui_exception_log(f"[wss._establish_connection][{agent.get('universal_id')}] connect error", e)
         return None
-    finally:
-        for p in (cert_path, key_path):
-            if p and os.path.exists(p):
-                os.remove(p)
-        print(f"[CERT_LOADER][WSS] 🧹 Cleaned up {cert_path}, {key_path}")
+
+
+async def _establish_connection_async(host, port, agent, deployment, session_id, timeout=5):
+    """
+    Coroutine twin of _establish_connection() for the asyncio runtime.
+
+    Same cached SSLContext, SPKI pin check and signed hello, but the socket
+    is an asyncio transport owned by the running event loop.
+
+    Returns:
+        websockets.asyncio.client.ClientConnection | None: Open connection on success, else None.
+    """
+    try:
+        tls = SSLContextCache.for_agent(agent, deployment)
+        url = f"wss://{host}:{port}/ws"
+
+        ws = await ws_connect(url, ssl=tls.context, open_timeout=timeout, max_size=None)
+
+        # SPKI verify
+        peer_cert = ws.transport.get_extra_info("ssl_object").getpeercert(binary_form=True)
+        ok, actual_pin = tls.verify_peer(peer_cert)
+        if not ok:
+            await ws.close()
+            raise ConnectionError(f"SPKI mismatch: expected {tls.server_spki_pin}, got {actual_pin}")
+
+        await ws.send(json.dumps(_signed_hello(agent, deployment, session_id)))
+        return ws
+
+    except Exception as e:
+        emit_gui_exception_log(f"[wss._establish_connection_async][{agent.get('universal_id')}] connect error", e)
+        return None
+
+
+def _signed_hello(agent, deployment, session_id):
+    """
+    Build the 'hello' handshake frame signed with the agent's remote key.
+
+    Returns:
+        dict: Hello message including its 'sig'.
+    """
+    hello = {
+        "type": "hello",
+        "session_id": session_id,
+        "agent": agent.get("universal_id"),
+        "ts": int(time.time()),
+    }
+    priv_key = RSAKeyCache.for_signing(deployment, agent.get("universal_id"), "remote_privkey")
+    hello["sig"] = crypto_utils.sign_data(hello, priv_key)
+    return hello
 # ----------------------------------------------------------------------
 class WSSConnector(BaseConnector):
     """
@@ -108,12 +122,30 @@ class WSSConnector(BaseConnector):
       - send(): publish outbound packets on the WebSocket
       - close(): tear down the socket and emit final status
 
+    In streaming mode (the default) each tick blocks on the socket for up to
+    recv_timeout seconds and then drains every frame that is already buffered,
+    so throughput is bound by the socket rather than by run_loop() pacing.
+    Set connection.streaming = False on the agent to fall back to one recv()
+    per tick.
+
+    Under AsyncConnectionLauncher the connector runs loop_async() instead:
+    the socket is an asyncio connection on the session's shared event loop,
+    so no thread is held per ingress agent.
+
     Attributes:
         _websocket (websocket.WebSocket): Active WebSocket instance or None.
         _last_pong (float): Timestamp of the last successful receive or ping.
+        recv_timeout (float): Seconds a tick waits for the first frame.
+        idle_timeout (float): Seconds of silence before the socket is declared dead.
+        max_drain (int): Upper bound of frames dispatched in a single tick.
     """
     persistent = True
     run_on_launch = True
+    streaming = True
+
+    recv_timeout = 1.0
+    idle_timeout = 60
+    max_drain = 512
 
     def __init__(self, shared=None):
         """
@@ -125,8 +157,13 @@ class WSSConnector(BaseConnector):
         """
         super().__init__(shared=shared)
         self._websocket = None
+        self._aws = None  # asyncio connection when hosted on the event loop
+        self._loop = None
         self._last_pong = 0
 
+        conn = (self.agent or {}).get("connection", {}) or {}
+        self.streaming = bool(conn.get("streaming", self.streaming))
+
 
     # ----------------------------- main loop ---------------------------
     def loop_tick(self):
@@ -134,9 +171,9 @@ class WSSConnector(BaseConnector):
         Perform one receive-and-dispatch cycle with heartbeat management.
 
         - Connect if socket is missing or stale.
-        - Receive a message, update pong timestamp, emit inbound event.
+        - Drain ready frames, update pong timestamp, emit inbound events.
+        - Record the per-tick drain count in shared state.
         - Handle socket errors, timeouts, and ghost sockets.
-        - Sleep briefly to pace the loop.
         """
         continue_loop = False
         try:
@@ -149,34 +186,171 @@ class WSSConnector(BaseConnector):
 
             else:
 
-                self._emit_status("connected")
-                msg = self._websocket.recv()
+                # streaming ticks run per frame; only tell the bus when the status changes
+                if self.get_status() != "connected":
+                    self._emit_status("connected")
+                drained = self._drain_frames()
+
+                # telemetry for the launcher / status footer
+                self._shared["frames_drained"] = drained
+                self._shared["frames_total"] = self._shared.get("frames_total", 0) + drained
+                continue_loop=True
 
-                # Handle Windows ghost sockets (recv() returns None or empty)
-                if not msg:
-                    print("[WSSConnector] ⚠️ Empty recv() — treating as dead socket.")
-                    raise ConnectionError("socket silent/dead")
+        except (socket.timeout, TimeoutError, WebSocketTimeoutException) as e:
+            emit_gui_exception_log(f"[WSSConnector] 💀 Socket timeout ({type(e).__name__})", e)
+        except (ConnectionResetError, ConnectionAbortedError, ConnectionError, OSError) as e:
+            emit_gui_exception_log(f"[WSSConnector] 💀 Socket failure detected ({type(e).__name__})", e)
 
-                ConnectorBus.get(self.session_id).emit(
+        return continue_loop
+
+    # ----------------------------- asyncio runtime ---------------------
+    async def loop_async(self):
+        """
+        Receive loop for the asyncio runtime.
+
+        Connects on the event loop, then awaits frames and emits each as
+        inbound.raw. Every recv_timeout without traffic stamps the heartbeat
+        and checks idle_timeout. Returns on stop, reboot request or socket
+        failure so the launcher's supervisor can reconnect.
+        """
+        self._loop = asyncio.get_running_loop()
+        bus = ConnectorBus.get(self.session_id)
+        uid = self.agent.get("universal_id")
+        try:
+            while not self.stopped() and not self._shared.get("reboot_now"):
+                if self._aws is None:
+                    if not await self._connect_async():
+                        await asyncio.sleep(5)
+                    continue
+
+                try:
+                    msg = await asyncio.wait_for(self._aws.recv(), self.recv_timeout)
+                except asyncio.TimeoutError:
+                    self.heartbeat()
+                    if self._last_pong and time.time() - self._last_pong > self.idle_timeout:
+                        raise WebSocketTimeoutException(f"no frames for {self.idle_timeout}s")
+                    continue
+
+                bus.emit(
                     "inbound.raw",
                     session_id=self.session_id,
-                    channel=self.agent.get("universal_id"),
-                    source=self.agent.get("universal_id"),
+                    channel=uid,
+                    source=uid,
                     payload=json.loads(msg),
                     ts=time.time(),
                 )
+                self._last_pong = time.time()
+                self._shared["frames_total"] = self._shared.get("frames_total", 0) + 1
+                self.heartbeat()
 
-                self._keep_alive()
-                continue_loop=True
-
-        except (socket.timeout, TimeoutError, WebSocketTimeoutException) as e:
+        except WebSocketTimeoutException as e:
             emit_gui_exception_log(f"[WSSConnector] 💀 Socket timeout ({type(e).__name__})", e)
-        except (ConnectionResetError, ConnectionAbortedError, ConnectionError, OSError) as e:
+        except (ConnectionError, OSError, ValueError) as e:
             emit_gui_exception_log(f"[WSSConnector] 💀 Socket failure detected ({type(e).__name__})", e)
+        except Exception as e:
+            # websockets.ConnectionClosed and friends
+            emit_gui_exception_log(f"[WSSConnector] 💀 Connection closed ({type(e).__name__})", e)
+        finally:
+            await self._close_async()
 
-        return continue_loop
+    async def _connect_async(self):
+        """
+        Open the asyncio WebSocket and update status.
+
+        Returns:
+            bool: True if connected.
+        """
+        conn = self.agent.get("connection", {})
+        host, port = conn.get("host"), conn.get("port")
+        if not host or not port:
+            print(f"[WSSConnector] Missing host/port for {self.session_id}")
+            return False
+
+        ws = await _establish_connection_async(host, port, self.agent, self.deployment, self.session_id)
+        if not ws:
+            self._emit_status("disconnected")
+            return False
+
+        self._aws = ws
+        self._last_pong = time.time()
+        self._emit_status("connected", host, port)
+        print(f"[WSSConnector] Connected to {host}:{port} (event loop)")
+        return True
+
+    async def _close_async(self):
+        ws, self._aws = self._aws, None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
 
     # ----------------------------- helpers -----------------------------
+    def _drain_frames(self):
+        """
+        Receive and dispatch every frame that is ready on the socket.
+
+        Streaming mode waits up to recv_timeout for the first frame; an idle
+        tick returns 0 unless the socket has been silent for idle_timeout.
+        Non-streaming mode performs a single blocking recv().
+
+        Returns:
+            int: Number of frames emitted as inbound.raw during this tick.
+        """
+        if self.streaming and not self._frame_ready(self.recv_timeout):
+            if self._last_pong and time.time() - self._last_pong > self.idle_timeout:
+                raise WebSocketTimeoutException(f"no frames for {self.idle_timeout}s")
+            return 0
+
+        bus = ConnectorBus.get(self.session_id)
+        uid = self.agent.get("universal_id")
+        drained = 0
+        while True:
+            msg = self._websocket.recv()
+
+            # Handle Windows ghost sockets (recv() returns None or empty)
+            if not msg:
+                print("[WSSConnector] ⚠️ Empty recv() — treating as dead socket.")
+                raise ConnectionError("socket silent/dead")
+
+            bus.emit(
+                "inbound.raw",
+                session_id=self.session_id,
+                channel=uid,
+                source=uid,
+                payload=json.loads(msg),
+                ts=time.time(),
+            )
+            drained += 1
+
+            if not self.streaming or drained >= self.max_drain or not self._frame_ready(0):
+                break
+
+        self._keep_alive()
+        return drained
+
+    def _frame_ready(self, timeout):
+        """
+        Check whether a frame can be read without blocking.
+
+        Bytes already decrypted by the TLS layer are invisible to select(),
+        so SSLSocket.pending() is consulted first.
+
+        Args:
+            timeout (float): Seconds to wait for readability (0 = poll).
+
+        Returns:
+            bool: True if recv() has data to consume.
+        """
+        sock = self._websocket.sock if self._websocket else None
+        if sock is None:
+            raise ConnectionError("socket closed")
+        pending = getattr(sock, "pending", None)
+        if pending and pending() > 0:
+            return True
+        ready, _, _ = select.select([sock], [], [], timeout)
+        return bool(ready)
+
     def _connect_socket(self):
         """
         Establish or re-establish the WebSocket connection.
@@ -198,6 +372,7 @@ class WSSConnector(BaseConnector):
         ws = _establish_connection(host, port, agent, dep, sid)
         if ws:
             self._websocket = ws
+            self._last_pong = time.time()
             self._emit_status("connected", host, port)
             print(f"[WSSConnector] Connected to {host}:{port}")
         else:
@@ -206,9 +381,6 @@ class WSSConnector(BaseConnector):
 
     def _keep_alive(self):
         try:
-            if self._last_pong:
-                lp = time.time() -self._last_pong
-                print(f"last ping {lp} seconds ago")
             self._last_pong = time.time()
 
         except Exception as e:
@@ -233,15 +405,46 @@ class WSSConnector(BaseConnector):
 
         Args:
             packet (Packet): The packet to serialize and send.
-            timeout (int): Unused; for signature consistency with BaseConnector.
+            timeout (int): Seconds to wait for the asyncio socket to take the frame.
+
+        Returns:
+            bool | None: True once the socket took the frame, False if it was
+                         not sent, None if it was only scheduled on the loop.
         """
+        if self._aws is not None:
+            return self._send_async(json.dumps(packet.get_packet()), timeout)
         if not self._websocket:
             print(f"[WSSConnector] no socket for {self.session_id}")
-            return
+            return False
         try:
             self._websocket.send(json.dumps(packet.get_packet()))
+            return True
+        except Exception as e:
+            print(f"[WSSConnector] send fail: {e}")
+            return False
+
+    def _send_async(self, data, timeout):
+        """
+        Hand a frame to the event loop that owns the asyncio socket.
+        Callers on the loop itself schedule the send instead of waiting on it.
+
+        Returns:
+            bool | None: As send(); None when the send was only scheduled.
+        """
+        try:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            if running is self._loop:
+                self._loop.create_task(self._aws.send(data))
+                return None  # can't wait on our own loop; outcome unknown here
+            asyncio.run_coroutine_threadsafe(self._aws.send(data), self._loop).result(timeout)
+            return True
         except Exception as e:
             print(f"[WSSConnector] send fail: {e}")
+            return False
 
     def close(self, session_id=None, channel_name=None):
         """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import asyncio
 import time
 from matrix_gui.core.class_lib.packet_delivery.packet.standard.command.packet import Packet
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
@@ -14,11 +15,14 @@ class BaseConnector(ABC):
     Subclasses should override:
       - run_once()   → for single-shot tasks
       - run_loop()   → for persistent sockets or repeating tasks
+      - loop_async() → optional, native coroutine for the asyncio runtime
       - send() / close()   → core communication methods
     """
 
     persistent = False  # default mode: single-shot
     run_on_launch = True  # compatible with ConnectionLauncher
+    streaming = False  # True → loop_tick() blocks on its own socket, run_loop() skips the pacing sleep
+    supports_batch = False  # True → send_batch() can carry several packets in one envelope
 
     def __init__(self, shared=None):
         """
@@ -58,9 +62,47 @@ class BaseConnector(ABC):
         Args:
             packet (Packet): The packet to transmit.
             timeout (int): Seconds to wait for send completion.
+
+        Returns:
+            bool | None: False if the packet was not delivered. Connectors
+                         that cannot tell return None (taken as sent).
         """
         pass
 
+    def send_batch(self, packets: list, timeout=10):
+        """
+        Send several packets, in order. Connectors that set supports_batch
+        override this to carry them in a single envelope; the default simply
+        sends them one after another, stopping at the first failure.
+
+        Args:
+            packets (list[Packet]): Packets to transmit, oldest first.
+            timeout (int): Seconds to wait for send completion.
+
+        Returns:
+            int: Number of leading packets delivered; the rest were not sent.
+        """
+        for i, packet in enumerate(packets):
+            try:
+                if self.send(packet, timeout=timeout) is False:
+                    return i
+            except Exception as e:
+                print(f"[{self.__class__.__name__}] ❌ batch send stopped at {i}/{len(packets)}: {e}")
+                return i
+        return len(packets)
+
+    def batch_capable(self) -> bool:
+        """
+        Returns True when both this connector and the remote agent accept
+        batch envelopes (agent connection flag 'batch').
+
+        Returns:
+            bool: Whether queued packets may be coalesced for this channel.
+        """
+        if not self.supports_batch or not self.agent:
+            return False
+        return bool((self.agent.get("connection", {}) or {}).get("batch"))
+
     @abstractmethod
     def close(self, session_id: str = None, channel_name: str = None):
         """
@@ -104,7 +146,8 @@ class BaseConnector(ABC):
 
     def reboot_now(self):
         """
-        Signals to connection_launcher's auto monitor to reboot the this thread now
+        Signals to connection_launcher's auto monitor to reboot the this thread now.
+        Under the asyncio runtime the running coroutine returns and is relaunched.
         """
         if self._shared:
             self._shared["reboot_now"] = True
@@ -137,6 +180,32 @@ class BaseConnector(ABC):
 
         print(f"{self.__class__.__name__}.run(): thread exiting cleanly.")
 
+    async def run_async(self):
+        """
+        Entry point executed by AsyncConnectionLauncher on its event loop.
+
+        Mirrors run(): persistent connectors await loop_async(), single-shot
+        connectors run run_once() on the loop's I/O executor so blocking
+        sockets never stall the loop. Cleanup happens on exit or cancel.
+        """
+        try:
+            if self.persistent:
+                await self.loop_async()
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, self.run_once)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            emit_gui_exception_log(f"{self.__class__.__name__}.run_async()", e)
+        finally:
+            try:
+                self.close(self.session_id, self._channel_name)
+            except Exception:
+                pass
+
+        print(f"{self.__class__.__name__}.run_async(): coroutine exiting cleanly.")
+
     # ------------------------------------------------------------------
     # Template methods for subclasses to override
     # ------------------------------------------------------------------
@@ -153,6 +222,10 @@ class BaseConnector(ABC):
         """
         Persistent socket or repeating task behavior. Override for WSS connectors.
         By default, loops calling loop_tick() until stopped.
+
+        Streaming connectors (streaming=True) pace themselves by blocking on
+        their socket with a timeout inside loop_tick(), so no sleep is added
+        between ticks; the heartbeat is still stamped after every tick.
         """
         continue_loop=True
         while not self.stopped() and continue_loop:
@@ -160,13 +233,37 @@ class BaseConnector(ABC):
                 continue_loop=self.loop_tick()
                 if(continue_loop):
                     self.heartbeat()
-                    time.sleep(1)
+                    if not self.streaming:
+                        time.sleep(1)
 
             except Exception as e:
                 continue_loop=False
                 emit_gui_exception_log(f"{self.__class__.__name__}.loop_tick()", e)
                 time.sleep(1)
 
+    async def loop_async(self):
+        """
+        Coroutine counterpart of run_loop() for the asyncio runtime.
+
+        The default offloads each blocking loop_tick() to the loop's I/O
+        executor; connectors with a native asyncio transport (WSS) override
+        this so their socket lives on the loop itself. Returns when stopped,
+        when a reboot is requested, or when a tick reports failure.
+        """
+        loop = asyncio.get_running_loop()
+        continue_loop = True
+        while not self.stopped() and not self._shared.get("reboot_now") and continue_loop:
+            try:
+                continue_loop = await loop.run_in_executor(None, self.loop_tick)
+                if continue_loop:
+                    self.heartbeat()
+                    if not self.streaming:
+                        await asyncio.sleep(1)
+
+            except Exception as e:
+                continue_loop = False
+                emit_gui_exception_log(f"{self.__class__.__name__}.loop_tick()", e)
+
     def loop_tick(self):
         """
         Optional sub-loop tick method for persistent connectors.
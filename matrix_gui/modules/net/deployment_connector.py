@@ -1,5 +1,6 @@
 # Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
 from .class_lib.processes.connection_launcher import ConnectionLauncher
+from .class_lib.processes.async_connection_launcher import AsyncConnectionLauncher
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
 from .entity.adapter.agent_connection_wrapper import AgentConnectionWrapper
 from matrix_gui.config.boot.globals import get_sessions
@@ -21,13 +22,22 @@ CONNECTOR_MAP = {
     # "sms": connect_sms,
 }
 
+# deployment["connector_runtime"] → launcher class
+#   threads: one thread per persistent connector (default)
+#   asyncio: every connector of the session on one event loop
+CONNECTOR_RUNTIMES = {
+    "threads": ConnectionLauncher,
+    "asyncio": AsyncConnectionLauncher,
+}
+
 def _connect_single(deployment, session_id, dep_id):
     """
     Initializes a full swarm connection group and its launch sequence.
 
     This function:
       - Creates a new session context in the global session manager
-      - Instantiates a ConnectionLauncher for the session
+      - Instantiates the session's launcher (ConnectionLauncher, or
+        AsyncConnectionLauncher when deployment["connector_runtime"] == "asyncio")
       - Binds ConnectorBus events into the session's SessionBus
       - Iterates over all agents in the deployment and launches
         their associated connectors (if supported)
@@ -44,7 +54,8 @@ def _connect_single(deployment, session_id, dep_id):
             print("[ERROR] No global sessions instance")
             return
 
-        connection_launcher = ConnectionLauncher()
+        runtime = deployment.get("connector_runtime", "threads")
+        connection_launcher = CONNECTOR_RUNTIMES.get(runtime, ConnectionLauncher)()
 
         group = {
             "id": session_id,
@@ -3,7 +3,7 @@ import ipaddress
 import base64, hashlib
 from cryptography.x509 import KeyUsage
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography import x509
 from cryptography.x509.oid import NameOID, ExtendedKeyUsageOID
 from datetime import datetime, timedelta
@@ -13,6 +13,9 @@ from matrix_gui.modules.common.crypto.interfaces.signing_cert_consumer import Si
 from matrix_gui.modules.common.crypto.interfaces.symmetric_encryption_consumer import SymmetricEncryptionConsumer
 from cryptography.x509 import SubjectAlternativeName, DNSName, IPAddress
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from matrix_gui.core.utils.signing_suites import RSA_SUITE, ED25519_SUITE, DEFAULT_SUITE
+from matrix_gui.modules.vault.crypto import key_pool
+from matrix_gui.modules.vault.crypto.key_pool import KeyPool
 
 def spki_pin_from_pem(cert_pem: str) -> str:
     cert = x509.load_pem_x509_certificate(cert_pem.encode("utf-8"))
@@ -23,10 +26,7 @@ def spki_pin_from_pem(cert_pem: str) -> str:
     return base64.b64encode(hashlib.sha256(spki).digest()).decode("ascii")
 
 def _generate_keypair():
-    key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048
-    )
+    key = KeyPool.take(2048)
     privkey_pem = key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.TraditionalOpenSSL,
@@ -38,6 +38,56 @@ def _generate_keypair():
     ).decode()
     return privkey_pem, pubkey_pem, key
 
+def _generate_ed25519_keypair():
+    key = ed25519.Ed25519PrivateKey.generate()
+    privkey_pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode()
+    pubkey_pem = key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return privkey_pem, pubkey_pem, key
+
+def _generate_signing_pairs(suite=DEFAULT_SUITE):
+    """
+    Mint the two key pairs of a signing block for the given suite.
+
+    Returns:
+        dict: pubkey/privkey (agent side) and remote_pubkey/remote_privkey (GUI side),
+              plus the 'suite' name. Ed25519 blocks also carry an RSA
+              'encryption' block, since Ed25519 keys cannot wrap AES keys.
+    """
+    if suite == RSA_SUITE:
+        generate = _generate_keypair
+    elif suite == ED25519_SUITE:
+        generate = _generate_ed25519_keypair
+    else:
+        raise ValueError(f"unknown signing suite '{suite}'")
+
+    key_priv, key_pub, _ = generate()
+    remote_privkey, remote_pubkey, _ = generate()
+    pairs = {
+        "suite": suite,
+        "pubkey": key_pub,
+        "privkey": key_priv,
+        "remote_pubkey": remote_pubkey,
+        "remote_privkey": remote_privkey,
+    }
+
+    if suite != RSA_SUITE:
+        enc_priv, enc_pub, _ = _generate_keypair()
+        enc_remote_priv, enc_remote_pub, _ = _generate_keypair()
+        pairs["encryption"] = {
+            "pubkey": enc_pub,
+            "privkey": enc_priv,
+            "remote_pubkey": enc_remote_pub,
+            "remote_privkey": enc_remote_priv,
+        }
+    return pairs
+
 def _generate_self_signed_cert(key, common_name, sans=None):
     subject = issuer = x509.Name([
         x509.NameAttribute(NameOID.COMMON_NAME, common_name)
@@ -62,10 +112,7 @@ def _generate_self_signed_cert(key, common_name, sans=None):
 
 
 def _generate_root_ca(common_name: str, key_size: int = 4096):
-    key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=key_size
-    )
+    key = KeyPool.take(key_size)
 
     subject = issuer = x509.Name([
         x509.NameAttribute(NameOID.COMMON_NAME, common_name)
@@ -104,10 +151,7 @@ def _generate_root_ca(common_name: str, key_size: int = 4096):
 
 
 def _generate_signed_cert(common_name: str, sans: list, issuer_cert, issuer_key, key_size: int = 2048):
-    key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=key_size
-    )
+    key = KeyPool.take(key_size)
 
     subject = x509.Name([
         x509.NameAttribute(NameOID.COMMON_NAME, common_name)
@@ -166,6 +210,11 @@ def connection_cert_factory(wrapped_agents):
     if not isinstance(wrapped_agents, list):
         return
 
+    # one 4096-bit CA key and two 2048-bit leaf keys per agent, minted in parallel up front
+    needed = sum(1 for w in wrapped_agents if isinstance(w, CertConsumer) and w.requires_cert())
+    if needed:
+        KeyPool.prefetch({4096: needed, 2048: 2 * needed}, label="connection certs")
+
     for wrapper in wrapped_agents:
         try:
             if not isinstance(wrapper, CertConsumer):
@@ -228,6 +277,11 @@ def signing_cert_factory(wrapped_agents):
     if not isinstance(wrapped_agents, list):
         return
 
+    # two 2048-bit keys per agent: the signing pairs, or the encryption pairs of ed25519 agents
+    needed = sum(1 for w in wrapped_agents if isinstance(w, SigningCertConsumer) and w.requires_signing())
+    if needed:
+        KeyPool.prefetch({2048: 2 * needed}, label="signing keys")
+
     for wrapper in wrapped_agents:
         try:
             if not isinstance(wrapper, SigningCertConsumer):
@@ -237,16 +291,19 @@ def signing_cert_factory(wrapped_agents):
             if not wrapper.requires_signing():
                 continue
 
-            key_priv, key_pub, _ = _generate_keypair()
-            remote_privkey, remote_pubkey, _ = _generate_keypair()
+            # RSA unless the agent asks for another suite (e.g. ed25519)
+            pairs = _generate_signing_pairs(wrapper.get_signing_suite())
             signing_profile = {
-                "pubkey": key_pub,
-                "privkey": key_priv, #gui will sign packets with this
-                "remote_pubkey": remote_pubkey,
-                "remote_privkey": remote_privkey, #remote server will sign packets with this
+                "suite": pairs["suite"],
+                "pubkey": pairs["pubkey"],
+                "privkey": pairs["privkey"], #gui will sign packets with this
+                "remote_pubkey": pairs["remote_pubkey"],
+                "remote_privkey": pairs["remote_privkey"], #remote server will sign packets with this
                 "created_at": datetime.utcnow().isoformat() + "Z",
                 #"serial": wrapper.get_serial()
             }
+            if "encryption" in pairs:
+                signing_profile["encryption"] = pairs["encryption"]
 
             wrapper.set_signing_cert(signing_profile)
 
@@ -286,6 +343,7 @@ def symmetric_encryption_factory(wrapped_agents):
 
 
 def initialize():
+    key_pool.initialize()
     # Register listener at import time
     EventBus.on("crypto.service.connection_cert.injector", connection_cert_factory)
     EventBus.on("crypto.service.signing_cert.injector", signing_cert_factory)
@@ -32,6 +32,7 @@ import base64
 import hashlib
 from Crypto.PublicKey import RSA
 from matrix_gui.modules.vault.crypto.cert_utils import set_hash_bang, embed_agent_sources
+from matrix_gui.modules.vault.crypto.key_pool import KeyPool
 from Crypto.Cipher import AES
 
 def get_random_aes_key(length=32):
@@ -48,18 +49,35 @@ def encrypt_data(data_bytes, key):
     }
 
 def embed_keypair_if_marker(obj, universal_id=None):
+    # mint every marker's key in parallel first, then fill them in
+    markers = _count_keypair_markers(obj)
+    if markers:
+        KeyPool.prefetch({2048: markers}, label="directive keypairs")
+    _fill_keypair_markers(obj, universal_id)
+
+def _count_keypair_markers(obj):
+    if isinstance(obj, dict):
+        return sum(
+            1 if (k == "privkey" and v == "##GENERATE_KEY##") else _count_keypair_markers(v)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, list):
+        return sum(_count_keypair_markers(item) for item in obj)
+    return 0
+
+def _fill_keypair_markers(obj, universal_id=None):
     if isinstance(obj, dict):
         this_id = obj.get("universal_id", universal_id)
         for k, v in list(obj.items()):
             if k == "privkey" and v == "##GENERATE_KEY##":
-                key = RSA.generate(2048)
+                key = RSA.import_key(KeyPool.take_pem(2048))
                 obj[k] = key.export_key().decode()
                 obj["pubkey"] = key.publickey().export_key().decode()
             else:
-                embed_keypair_if_marker(v, this_id)
+                _fill_keypair_markers(v, this_id)
     elif isinstance(obj, list):
         for item in obj:
-            embed_keypair_if_marker(item, universal_id)
+            _fill_keypair_markers(item, universal_id)
 
 def generate_swarm_encrypted_directive(directive, clown_car=True, hashbang=True, base_path = None):
 
@@ -0,0 +1,294 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import os
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from matrix_gui.core.event_bus import EventBus
+from matrix_gui.core.utils.gui_call import post_to_gui
+from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
+
+
+def _mint_rsa_pem(key_size: int) -> str:
+    """Worker entry point: one RSA private key as a TraditionalOpenSSL PEM."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode()
+
+
+class KeyPool:
+    """
+    RSA private keys minted ahead of time on a process pool.
+
+    Deployment minting asks for every key it is about to need with
+    prefetch(); the missing ones are generated in parallel while progress
+    goes out on 'crypto.keygen.progress' (label, done, total). The cert
+    factories then take() keys from stock, falling back to inline
+    generation if the stock runs dry.
+
+    Optionally the pool keeps a standing stock per key size (depth), topped
+    up in the background and kept in the unlocked vault under 'key_pool':
+
+        {"depth": {"2048": 8, "4096": 2}, "keys": {"2048": [pem, ...], ...}}
+
+    Depth is 0 (no standing stock) unless configured, either with
+    configure() or MATRIX_KEY_POOL_DEPTH (applied on unlock):
+
+        MATRIX_KEY_POOL_DEPTH=2048:8,4096:2 MATRIX_KEY_POOL_WORKERS=4 python phoenix.py
+
+    Only the standing stock (at most `depth` keys per size) is written to
+    the vault; keys prefetched for a deployment live in memory until the
+    factories take them. Vault writes happen only on the GUI thread: keys
+    minted in the background are held in memory and written by the next
+    prefetch()/take()/sync().
+    """
+    _stock = {}            # key_size → [pem, ...]; standing stock first, take() pops from the end
+    _depth = {}            # key_size → standing stock to maintain
+    _pending = {}          # key_size → background mints in flight
+    _executor = None
+    _lock = threading.RLock()
+    _dirty = False
+    _saved = None          # section last written to the vault
+
+    workers = int(os.getenv("MATRIX_KEY_POOL_WORKERS", "0")) or None  # None → os.cpu_count()
+    section_key = "key_pool"
+
+    # -----------------------------
+    @classmethod
+    def configure(cls, depth: dict = None, workers: int = None):
+        """
+        Set the standing stock per key size and (re)size the worker pool.
+
+        Args:
+            depth (dict, optional): {key_size: count}, e.g. {2048: 8, 4096: 2}.
+            workers (int, optional): Worker processes (default: CPU count).
+        """
+        with cls._lock:
+            if workers is not None and workers != cls.workers:
+                cls.workers = workers
+                cls._shutdown_executor()
+            if depth is not None:
+                cls._depth = {int(k): int(v) for k, v in depth.items()}
+                cls._dirty = True
+        cls.sync()
+        cls.refill()
+
+    @classmethod
+    def prefetch(cls, needs: dict, label: str = "keys"):
+        """
+        Ensure the stock holds at least the given number of keys, minting the
+        shortfall in parallel. Blocks until done, emitting progress.
+
+        Args:
+            needs (dict): {key_size: count}.
+            label (str): Progress label for the UI.
+        """
+        with cls._lock:
+            shortfall = {
+                size: max(0, int(count) - len(cls._stock.get(size, [])))
+                for size, count in needs.items()
+            }
+
+        total = sum(shortfall.values())
+        if total:
+            started = time.time()
+            executor = cls._get_executor()
+            futures = {
+                executor.submit(_mint_rsa_pem, size): size
+                for size, count in shortfall.items()
+                for _ in range(count)
+            }
+
+            done = 0
+            EventBus.emit("crypto.keygen.progress", label=label, done=done, total=total)
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    cls._put(futures[fut], fut.result())
+                    done += 1
+                # emit even on timeout so a listening dialog can pump its event loop
+                EventBus.emit("crypto.keygen.progress", label=label, done=done, total=total)
+
+            print(f"[KEY-POOL] Minted {total} keys for {label} in {time.time() - started:.1f}s")
+
+        cls.sync()
+        cls.refill()
+
+    @classmethod
+    def take(cls, key_size: int = 2048):
+        """
+        Return an RSA private key object, from stock when available.
+
+        Args:
+            key_size (int): Modulus size in bits.
+
+        Returns:
+            RSAPrivateKey: A key nobody else has been handed.
+        """
+        pem = cls._pop(key_size)
+        if pem is None:
+            return rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+
+        return serialization.load_pem_private_key(pem.encode(), password=None)
+
+    @classmethod
+    def take_pem(cls, key_size: int = 2048) -> str:
+        """Like take(), as a TraditionalOpenSSL PEM string."""
+        return cls._pop(key_size) or _mint_rsa_pem(key_size)
+
+    @classmethod
+    def stock(cls) -> dict:
+        """{key_size: keys on hand}."""
+        with cls._lock:
+            return {size: len(pems) for size, pems in cls._stock.items()}
+
+    # -----------------------------
+    @classmethod
+    def refill(cls):
+        """Top the standing stock back up to depth in the background."""
+        with cls._lock:
+            for size, depth in cls._depth.items():
+                missing = depth - len(cls._stock.get(size, [])) - cls._pending.get(size, 0)
+                if missing <= 0:
+                    continue
+                executor = cls._get_executor()
+                for _ in range(missing):
+                    cls._pending[size] = cls._pending.get(size, 0) + 1
+                    fut = executor.submit(_mint_rsa_pem, size)
+                    fut.add_done_callback(lambda f, s=size: cls._on_background_key(s, f))
+
+    @classmethod
+    def _on_background_key(cls, size, fut):
+        with cls._lock:
+            cls._pending[size] = max(0, cls._pending.get(size, 0) - 1)
+        if fut.cancelled() or fut.exception():
+            return
+        cls._put(size, fut.result())
+
+    @classmethod
+    def _pop(cls, size):
+        with cls._lock:
+            stock = cls._stock.get(size)
+            if not stock:
+                return None
+            pem = stock.pop()
+            cls._dirty = True
+
+        # a key handed out of the standing stock must leave the vault before any later save;
+        # vault writes belong to the GUI thread, so pops elsewhere queue the sync there
+        if threading.current_thread() is threading.main_thread():
+            cls.sync()
+        else:
+            post_to_gui(cls.sync)
+        return pem
+
+    @classmethod
+    def _put(cls, size, pem):
+        with cls._lock:
+            cls._stock.setdefault(size, []).append(pem)
+            cls._dirty = True
+
+    # -----------------------------
+    @classmethod
+    def load(cls, vcs=None):
+        """Adopt the depth and stock saved in the vault (on unlock); MATRIX_KEY_POOL_DEPTH wins."""
+        section = cls._section(vcs)
+        if section is None:
+            return
+        with cls._lock:
+            cls._depth = {int(k): int(v) for k, v in section.get("depth", {}).items()}
+            for size, pems in section.get("keys", {}).items():
+                mine = cls._stock.setdefault(int(size), [])
+                mine[:0] = [p for p in pems if p not in mine]  # saved keys are standing stock
+            cls._saved = section
+            cls._dirty = False
+
+            env_depth = cls._env_depth()
+            if env_depth is not None and env_depth != cls._depth:
+                cls._depth = env_depth
+                cls._dirty = True
+        cls.sync(vcs)
+        cls.refill()
+
+    @classmethod
+    def sync(cls, vcs=None):
+        """Write depth and standing stock back to the vault if they changed. GUI thread only."""
+        if not cls._dirty:
+            return
+        vcs = vcs or cls._vault()
+        if vcs is None:
+            return
+        with cls._lock:
+            section = {
+                "depth": {str(k): v for k, v in cls._depth.items()},
+                "keys": {
+                    str(size): list(cls._stock.get(size, [])[:depth])
+                    for size, depth in cls._depth.items() if depth > 0
+                },
+            }
+            cls._dirty = False
+            if section == cls._saved:
+                return  # only in-memory prefetch stock changed
+            cls._saved = section
+        vcs.patch(cls.section_key, section)
+
+    @staticmethod
+    def _env_depth():
+        """
+        Parse MATRIX_KEY_POOL_DEPTH ('2048:8,4096:2').
+
+        Returns:
+            dict | None: {key_size: count}, or None when unset or malformed.
+        """
+        raw = os.getenv("MATRIX_KEY_POOL_DEPTH", "").strip()
+        if not raw:
+            return None
+        try:
+            return {int(size): int(count) for size, count in (part.split(":") for part in raw.split(",") if part.strip())}
+        except ValueError:
+            print(f"[KEY-POOL][WARN] Ignoring malformed MATRIX_KEY_POOL_DEPTH={raw!r} (expected e.g. 2048:8,4096:2)")
+            return None
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            cls._shutdown_executor()
+
+    # -----------------------------
+    @classmethod
+    def _get_executor(cls):
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(max_workers=cls.workers or os.cpu_count() or 2)
+            return cls._executor
+
+    @classmethod
+    def _shutdown_executor(cls):
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+            cls._pending.clear()
+
+    @classmethod
+    def _vault(cls):
+        try:
+            return VaultCoreSingleton.get()
+        except RuntimeError:
+            return None  # vault still locked
+
+    @classmethod
+    def _section(cls, vcs=None):
+        vcs = vcs or cls._vault()
+        if vcs is None:
+            return None
+        return vcs.read(safe=False).get(cls.section_key, {})
+
+
+def initialize():
+    EventBus.on("vault.core.ready", lambda **_: KeyPool.load())
+    print("[KEY-POOL] Waiting for vault unlock to restore pre-minted keys...")
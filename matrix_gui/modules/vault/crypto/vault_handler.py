@@ -1,7 +1,9 @@
 import os, json, base64, rsa, tempfile, shutil, glob
+from functools import lru_cache
 from cryptography.fernet import Fernet
 
 from matrix_gui.modules.vault.crypto.password_encryption import derive_key_from_password
+from matrix_gui.modules.vault.crypto.vault_sections import VaultContainer, LazyVault, is_sectioned
 
 
 def prune_old_backups(data_path, keep=20):
@@ -21,36 +23,51 @@ def prune_old_backups(data_path, keep=20):
         except Exception as e:
             print(f"[VAULT] ⚠️ Could not remove {bak}: {e}")
 
-def save_vault_singlefile(data: dict, password: str, data_path: str):
+def save_vault_singlefile(data: dict, password: str, data_path: str, kek=None):
     """
     Safely save the vault:
       - Validate deployments (no None/junk).
+      - Encrypt every section into a fresh sectioned (v2) container.
       - Backup existing vault.
       - Atomic write using temp file + rename.
+
+    Args:
+        kek (tuple, optional): (salt, key) from derive_vault_kek(); skips the
+            PBKDF2 derivation when the caller already holds it.
+    """
+    data = dict(data.items())  # a LazyVault decrypts its remaining sections here
+    sanitize_vault(data)
+    container = VaultContainer(kek or derive_vault_kek(password))
+    for name, section in data.items():
+        container.seal(name, json.dumps(section, ensure_ascii=False).encode("utf-8"))
+    write_vault_bundle(container.to_bundle(), data_path)
+
+
+def sanitize_vault(data: dict):
+    """Drop deployments that are not dicts (None/junk) before a save."""
+    deployments = data.get("deployments", {})
+    for dep_id in list(deployments):
+        if not isinstance(deployments[dep_id], dict):
+            print(f"[VAULT] 🚮 Purged corrupt deployment {dep_id}")
+            deployments.pop(dep_id, None)
+
+
+def derive_vault_kek(password: str, salt: bytes = None):
+    """
+    Derive the key-encryption key that wraps the vault's Fernet data key.
+
+    Returns:
+        tuple: (salt, key) — reusable for every save of the unlocked session.
     """
-    # --- 1. Sanitize vault ---
+    salt = salt or os.urandom(16)
+    return salt, derive_key_from_password(password, salt)
+
+
+def write_vault_bundle(bundle: dict, data_path: str):
+    """Back up the current vault file, then atomically replace it with bundle."""
+    tmp_path = None
     try:
-        deployments = data.get("deployments", {})
-        for dep_id in list(deployments):
-            if not isinstance(deployments[dep_id], dict):
-                print(f"[VAULT] 🚮 Purged corrupt deployment {dep_id}")
-                deployments.pop(dep_id, None)
-
-        # --- 2. Encrypt as usual ---
-        salt = os.urandom(16)
-        fernet_key = Fernet.generate_key()
-        key = derive_key_from_password(password, salt)
-        fernet_for_key = Fernet(key)
-        encrypted_fernet_key = fernet_for_key.encrypt(fernet_key)
-        fernet = Fernet(fernet_key)
-        encrypted_vault = fernet.encrypt(json.dumps(data, ensure_ascii=False).encode("utf-8"))
-        bundle = {
-            "kdf_salt": base64.b64encode(salt).decode(),
-            "encrypted_fernet_key": base64.b64encode(encrypted_fernet_key).decode(),
-            "vault": base64.b64encode(encrypted_vault).decode()
-        }
-
-        # --- 3. Backup existing vault ---
+        # --- Backup existing vault ---
         if os.path.exists(data_path):
             backup_path = f"{data_path}.{int(os.path.getmtime(data_path))}.bak"
             try:
@@ -60,7 +77,7 @@ def save_vault_singlefile(data: dict, password: str, data_path: str):
             except Exception as e:
                 print(f"[VAULT] ⚠️ Backup failed: {e}")
 
-        # --- 4. Atomic write ---
+        # --- Atomic write ---
         dir_name = os.path.dirname(data_path) or "."
         fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".vault_", suffix=".json")
 
@@ -72,43 +89,91 @@ def save_vault_singlefile(data: dict, password: str, data_path: str):
         print(f"[VAULT] ✅ Saved safely to {normalize_path(data_path)}")
     except Exception as e:
         print(f"[VAULT_HANDLER_ERROR] Failed to save vault: {e}")
-        if os.path.exists(tmp_path):
+        if tmp_path and os.path.exists(tmp_path):
             os.remove(tmp_path)
         raise
 
 
-def load_vault_singlefile(password: str, data_path: str) -> dict:
+def open_vault(password: str, data_path: str):
+    """
+    Unlock a vault file without decrypting its sections.
+
+    Sectioned (v2) files decrypt only their manifest; each section is
+    decrypted when first touched. A legacy single-blob (v1) file is
+    decrypted whole into an empty container, so the first save rewrites it
+    as v2 — migration needs no separate step.
+
+    Returns:
+        LazyVault | bool: The vault, or False if it could not be opened.
+    """
     try:
         with open(data_path, "r") as f:
             bundle = json.load(f)
-        salt = base64.b64decode(bundle["kdf_salt"])
-        encrypted_fernet_key = base64.b64decode(bundle["encrypted_fernet_key"])
-        encrypted_vault = base64.b64decode(bundle["vault"])
-        # Decrypt Fernet key
-        key = derive_key_from_password(password, salt)
-        fernet_for_key = Fernet(key)
-        fernet_key = fernet_for_key.decrypt(encrypted_fernet_key)
-        # Decrypt vault
-        fernet = Fernet(fernet_key)
-        decrypted_data = fernet.decrypt(encrypted_vault)
-
-        return json.loads(decrypted_data.decode("utf-8"))
+        kek = derive_vault_kek(password, base64.b64decode(bundle["kdf_salt"]))
+
+        if is_sectioned(bundle):
+            return LazyVault(VaultContainer.from_bundle(bundle, kek))
+
+        # v1: one Fernet key wrapping the whole vault
+        fernet_key = Fernet(kek[1]).decrypt(base64.b64decode(bundle["encrypted_fernet_key"]))
+        decrypted_data = Fernet(fernet_key).decrypt(base64.b64decode(bundle["vault"]))
+        print("[VAULT] Legacy single-blob vault — it will be saved in the sectioned format.")
+        return LazyVault(VaultContainer(kek), json.loads(decrypted_data.decode("utf-8")))
     except Exception as e:
         print(f"[VAULT_HANDLER_ERROR] Failed to load vault: {e}")
         return False
 
 
+def load_vault_singlefile(password: str, data_path: str) -> dict:
+    """Decrypt a vault file (either format) into a plain dict."""
+    vault = open_vault(password, data_path)
+    return vault.copy() if vault is not False else False
+
+
 def retrieve_full_vault(password: str, data_path: str) -> dict:
     # Convenience method to unify use across app
     return load_vault_singlefile(password, data_path)
 
-def sign_payload(payload_dict: dict, password: str, data_path: str) -> str:
+def _vault_contents(vault=None, password: str = None, data_path: str = None) -> dict:
+    """
+    Resolve the vault dict for the sign/verify helpers.
+
+    Args:
+        vault: An unlocked handle (VaultCoreSingleton or anything with
+               read(safe=...)) or a plain vault dict. Preferred: no decrypt.
+        password (str): Vault password, used only when no handle is given.
+        data_path (str): Vault file, used only when no handle is given.
+
+    Returns:
+        dict: The vault contents (empty if the file could not be loaded).
+    """
+    if vault is None:
+        return load_vault_singlefile(password, data_path) or {}
+    if isinstance(vault, dict):
+        return vault
+    return vault.read(safe=False)
+
+@lru_cache(maxsize=64)
+def _load_private_key(pem: str):
+    # parsing a PKCS#1 key costs more than the signature itself; keep the object
+    return rsa.PrivateKey.load_pkcs1(pem.encode())
+
+@lru_cache(maxsize=256)
+def _load_public_key(pem: str):
+    return rsa.PublicKey.load_pkcs1(pem.encode())
+
+def sign_payload(payload_dict: dict, password: str = None, data_path: str = None, vault=None) -> str:
+    """
+    Sign a payload with the vault's local private key.
+
+    Pass an unlocked `vault` handle to skip the decrypt-from-disk on every
+    call; (password, data_path) still works for callers without one.
+    """
     try:
-        vault = load_vault_singlefile(password, data_path)
-        priv_pem = vault.get("local_private_key")
+        priv_pem = _vault_contents(vault, password, data_path).get("local_private_key")
         if not priv_pem:
             raise RuntimeError("Local private key not found in vault.")
-        priv = rsa.PrivateKey.load_pkcs1(priv_pem.encode())
+        priv = _load_private_key(priv_pem)
         data = json.dumps(payload_dict, sort_keys=True).encode()
         sig = rsa.sign(data, priv, "SHA-256")
         return base64.b64encode(sig).decode()
@@ -119,18 +184,25 @@ def normalize_path(path: str) -> str:
     """Return a uniform, portable path."""
     return os.path.normpath(path).replace("\\", "/")
 
-def verify_signature(payload_dict: dict, signature_b64: str, sender_name: str, password: str, data_path: str) -> bool:
+def verify_signature(payload_dict: dict, signature_b64: str, sender_name: str,
+                     password: str = None, data_path: str = None, vault=None) -> bool:
+    """
+    Verify a payload signed by a trusted server.
+
+    Pass an unlocked `vault` handle to skip the decrypt-from-disk on every
+    call; (password, data_path) still works for callers without one.
+    """
     try:
-        vault = load_vault_singlefile(password, data_path)
-        sender_info = vault.get("trusted_servers", {}).get(sender_name)
+        sender_info = _vault_contents(vault, password, data_path).get("trusted_servers", {}).get(sender_name)
         if not sender_info:
             print(f"[SECURITY] No pubkey for sender: {sender_name}")
             return False
-        pub = rsa.PublicKey.load_pkcs1(sender_info["pubkey"].encode())
+        pub = _load_public_key(sender_info["pubkey"])
         sig = base64.b64decode(signature_b64)
         data = json.dumps(payload_dict, sort_keys=True).encode()
         rsa.verify(data, sig, pub)
         return True
-    except rsa.VerificationError:
-        print(f"[VAULT_HANDLER_ERROR] failed to sign payload: {e}")
+    except Exception as e:
+        # bad signature, malformed base64 or an unparsable pubkey all mean "not verified"
+        print(f"[VAULT_HANDLER_ERROR] failed to verify payload from {sender_name}: {e}")
         return False
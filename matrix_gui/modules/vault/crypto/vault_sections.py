@@ -0,0 +1,294 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import json
+import base64
+import hashlib
+import secrets
+import threading
+from copy import deepcopy
+from cryptography.fernet import Fernet
+
+# On-disk container versions:
+#   1 — {kdf_salt, encrypted_fernet_key, vault}: the whole vault in one Fernet blob
+#   2 — {format, kdf_salt, encrypted_fernet_key, manifest, sections}: one Fernet
+#       token per top-level section under an encrypted manifest
+FORMAT_VERSION = 2
+
+
+def is_sectioned(bundle: dict) -> bool:
+    """True if a parsed vault file uses the sectioned (v2) container."""
+    return isinstance(bundle, dict) and bundle.get("format") == FORMAT_VERSION
+
+
+def _tag(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class VaultContainer:
+    """
+    The sectioned vault file held open for an unlocked session.
+
+    Every top-level section ('deployments', 'registry', 'workspaces', ...)
+    is its own Fernet token, so it carries its own HMAC. The manifest maps
+    section names to opaque ids and records, per section, the SHA-256 of its
+    token (binding each token to this file and this name, so sections cannot
+    be swapped or rolled back one at a time) and of its plaintext (so an
+    unchanged section is never re-encrypted). The manifest itself is
+    encrypted; the file shows only ids and ciphertext.
+
+    One data key encrypts every section and survives across saves; it is
+    wrapped by the password KEK exactly like the v1 per-save key was.
+
+    Thread-safe: the GUI thread unseals while the persister thread seals.
+    """
+
+    def __init__(self, kek, data_key: bytes = None, manifest: dict = None, tokens: dict = None):
+        """
+        Args:
+            kek (tuple): (salt, key) from derive_vault_kek().
+            data_key (bytes, optional): Existing Fernet data key (new one if omitted).
+            manifest (dict, optional): name → {id, tag, digest, size}.
+            tokens (dict, optional): id → Fernet token.
+        """
+        self.kek = kek
+        self.data_key = data_key or Fernet.generate_key()
+        self._fernet = Fernet(self.data_key)
+        self._manifest = manifest or {}
+        self._tokens = tokens or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_bundle(cls, bundle: dict, kek):
+        """
+        Open a parsed v2 vault file. Only the manifest is decrypted.
+
+        Raises:
+            cryptography.fernet.InvalidToken: Wrong password or tampered manifest.
+        """
+        _, key = kek
+        data_key = Fernet(key).decrypt(base64.b64decode(bundle["encrypted_fernet_key"]))
+        manifest = json.loads(Fernet(data_key).decrypt(bundle["manifest"].encode()))
+        return cls(kek, data_key, manifest["sections"], dict(bundle["sections"]))
+
+    # -----------------------------
+    def names(self) -> list:
+        with self._lock:
+            return list(self._manifest)
+
+    def size(self, name: str) -> int:
+        """Plaintext size in bytes of a stored section (0 if absent)."""
+        with self._lock:
+            return self._manifest.get(name, {}).get("size", 0)
+
+    def unseal(self, name: str) -> bytes:
+        """
+        Decrypt one section.
+
+        Returns:
+            bytes: The section's JSON.
+
+        Raises:
+            ValueError: The token is missing or does not match the manifest.
+            cryptography.fernet.InvalidToken: The token's HMAC does not verify.
+        """
+        with self._lock:
+            entry = self._manifest[name]
+            token = self._tokens.get(entry["id"])
+        if token is None or _tag(token) != entry["tag"]:
+            raise ValueError(f"vault section '{name}' failed its integrity check")
+        return self._fernet.decrypt(token.encode())
+
+    def seal(self, name: str, plaintext: bytes) -> bool:
+        """
+        Encrypt one section unless its plaintext is unchanged.
+
+        Returns:
+            bool: True if the section was (re)encrypted.
+        """
+        digest = hashlib.sha256(plaintext).hexdigest()
+        with self._lock:
+            entry = self._manifest.get(name)
+            if entry and entry["digest"] == digest:
+                return False
+
+        token = self._fernet.encrypt(plaintext).decode()
+
+        with self._lock:
+            entry = self._manifest.get(name)
+            sid = entry["id"] if entry else secrets.token_hex(8)
+            self._tokens[sid] = token
+            self._manifest[name] = {"id": sid, "tag": _tag(token), "digest": digest, "size": len(plaintext)}
+        return True
+
+    def drop(self, name: str) -> bool:
+        """Remove a section. Returns True if it existed."""
+        with self._lock:
+            entry = self._manifest.pop(name, None)
+            if entry:
+                self._tokens.pop(entry["id"], None)
+            return entry is not None
+
+    def to_bundle(self) -> dict:
+        """Serialize to the on-disk v2 bundle (unchanged sections keep their tokens)."""
+        salt, key = self.kek
+        with self._lock:
+            manifest = json.dumps({"sections": self._manifest}).encode("utf-8")
+            tokens = dict(self._tokens)
+        return {
+            "format": FORMAT_VERSION,
+            "kdf_salt": base64.b64encode(salt).decode(),
+            "encrypted_fernet_key": base64.b64encode(Fernet(key).encrypt(self.data_key)).decode(),
+            "manifest": self._fernet.encrypt(manifest).decode(),
+            "sections": tokens,
+        }
+
+
+class LazyVault(dict):
+    """
+    Vault contents whose sections are decrypted on first access.
+
+    Behaves as the plain vault dict the rest of the cockpit expects:
+    vault["deployments"], .get(), .setdefault() and `in` decrypt only the
+    section they touch. Whole-vault operations (iteration, keys/items/values,
+    copy, deepcopy, pickling) decrypt everything first.
+
+    json.dumps() sees only decrypted sections — call unseal_all() or
+    deepcopy() first when serializing the whole vault.
+    """
+
+    def __init__(self, container: VaultContainer = None, data: dict = None):
+        """
+        Args:
+            container (VaultContainer, optional): Open v2 file; None for a vault
+                that has never been written in the sectioned format.
+            data (dict, optional): Sections already in plaintext.
+        """
+        super().__init__(data or {})
+        self.container = container
+        self._sealed = set(container.names() if container else ()) - set(super().keys())
+        self._removed = set()
+        self.on_unseal = None  # on_unseal(name, value) after a section is decrypted
+
+    # -----------------------------
+    def _unseal(self, key):
+        value = json.loads(self.container.unseal(key))
+        self._sealed.discard(key)
+        super().__setitem__(key, value)
+        if self.on_unseal:
+            self.on_unseal(key, value)
+        return value
+
+    def unseal_all(self):
+        for key in list(self._sealed):
+            self._unseal(key)
+
+    def is_sealed(self, key) -> bool:
+        return key in self._sealed
+
+    def loaded(self) -> dict:
+        """The decrypted sections (live values, no decryption)."""
+        return dict(super().items())
+
+    def sealed_size(self) -> int:
+        """Plaintext bytes still encrypted."""
+        return sum(self.container.size(k) for k in self._sealed)
+
+    def take_removed(self) -> set:
+        """Section names deleted since the last call."""
+        removed, self._removed = self._removed, set()
+        return removed
+
+    # -----------------------------
+    def __missing__(self, key):
+        if key in self._sealed:
+            return self._unseal(key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._sealed
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def __setitem__(self, key, value):
+        self._sealed.discard(key)
+        self._removed.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if key in self._sealed:
+            self._sealed.discard(key)
+        else:
+            super().__delitem__(key)
+        self._removed.add(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        self.unseal_all()
+        key, value = super().popitem()
+        self._removed.add(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._removed |= self._sealed | set(super().keys())
+        self._sealed.clear()
+        super().clear()
+
+    def __len__(self):
+        return super().__len__() + len(self._sealed)
+
+    def __iter__(self):
+        self.unseal_all()
+        return super().__iter__()
+
+    def keys(self):
+        self.unseal_all()
+        return super().keys()
+
+    def items(self):
+        self.unseal_all()
+        return super().items()
+
+    def values(self):
+        self.unseal_all()
+        return super().values()
+
+    def copy(self):
+        self.unseal_all()
+        return dict(super().items())
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        self.unseal_all()
+        if isinstance(other, LazyVault):
+            other.unseal_all()
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"LazyVault(loaded={sorted(super().keys())}, sealed={sorted(self._sealed)})"
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self.copy(), memo)
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
@@ -1,5 +1,9 @@
 import threading, time, copy
+from collections import deque
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from matrix_gui.core.event_bus import EventBus
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
+from matrix_gui.core.utils.session_keys import SessionKeyRing
 
 class VaultConnectionSingleton:
     _instance = None
@@ -17,11 +21,17 @@ class VaultConnectionSingleton:
         self._dep_id = dep_id
         self._conn = conn
         self._deployment = {}
+        self._cache = {}        # target → data, for targets other than this deployment
+        self._versions = {}     # target → cockpit version of the cached copy
+        self._stale = set()     # targets the cockpit says changed since we cached them
+        self._deferred = deque()
+        self.stats = {"hits": 0}
         print(f"[VAULT-SINGLETON] Bound to deployment {dep_id}")
 
     def load(self, deployment: dict):
         with self._lock:
             self._deployment = deployment or {}
+            self._versions.pop("deployment", None)
 
     # --- Write-through ---
     def update_field(self, key: str, value):
@@ -34,6 +44,10 @@ class VaultConnectionSingleton:
             else:
                 merged = value
             self._deployment[key] = merged
+            if key == "certs":
+                RSAKeyCache.invalidate(self._dep_id)
+                SessionKeyRing.invalidate(self._dep_id)
+            EventBus.emit("vault.deployment.changed", dep_id=self._dep_id, keys=[key])
             try:
                 payload = {
                     "type": "vault.update.requested",
@@ -47,30 +61,118 @@ class VaultConnectionSingleton:
 
     # --- On-demand read ---
     def fetch_fresh(self, target="deployment", timeout=2.0):
-        """Request a fresh deployment snapshot from cockpit."""
+        """
+        Return the cockpit's current copy of a vault target.
+
+        Served from the local cache while the cockpit has not pushed a
+        vault.changed for it; otherwise the query carries the cached version,
+        so an unchanged target costs a tiny "unchanged" reply and a changed
+        deployment comes back as a delta of its changed keys.
+        """
         try:
+            self._drain()
+            with self._lock:
+                if target != "vault" and target in self._versions and target not in self._stale:
+                    self.stats["hits"] += 1
+                    return self._cached(target)
+                version = self._versions.get(target)
 
             req = {
                 "type": "vault.query",
                 "dep_id": self._dep_id,
-                "target": target
+                "target": target,
+                "version": version,
             }
-            print(f"[VAULT-SINGLETON] 📤 Querying cockpit for '{target}' data...")
+            print(f"[VAULT-SINGLETON] 📤 Querying cockpit for '{target}' data (have {version})...")
             self._conn.send(req)
             start = time.time()
             while time.time() - start < timeout:
                 if self._conn.poll(0.1):
                     msg = self._conn.recv()
-                    if msg.get("type") == "vault.response" and msg.get("dep_id") == self._dep_id:
-                        data = msg.get("data", {})
-                        with self._lock:
-                            self._deployment = data
-                        return data
+                    if (msg.get("type") == "vault.response" and msg.get("dep_id") == self._dep_id
+                            and msg.get("target", target) == target):
+                        return self._apply(target, msg)
+                    if not self.handle_message(msg):
+                        self._deferred.append(msg)  # not ours; the session's pipe poll gets it
             print(f"[VAULT-SINGLETON][WARN] No response within {timeout}s")
-            return self.read_deployment()
+            return self._cached(target)
         except Exception as e:
             emit_gui_exception_log("VaultConnectionSingleton.fetch_fresh", e)
-            return self.read_deployment()
+            return self._cached(target)
+
+    def handle_message(self, msg) -> bool:
+        """
+        Consume a vault.changed notification pushed by the cockpit.
+
+        Returns:
+            bool: True if the message was a vault notification.
+        """
+        if not isinstance(msg, dict) or msg.get("type") != "vault.changed":
+            return False
+        section = msg.get("section")
+        with self._lock:
+            if section == "deployments":
+                dep_ids = msg.get("dep_ids")
+                if dep_ids is None or self._dep_id in dep_ids:
+                    self._stale.add("deployment")
+            else:
+                self._stale.add(section)
+        return True
+
+    def take_deferred(self) -> list:
+        """Pipe messages read while waiting for a vault.response, oldest first."""
+        msgs = list(self._deferred)
+        self._deferred.clear()
+        return msgs
+
+    def _drain(self):
+        """Pick up notifications already sitting in the pipe before trusting the cache."""
+        while self._conn.poll():
+            msg = self._conn.recv()
+            if not self.handle_message(msg):
+                self._deferred.append(msg)
+
+    def _cached(self, target):
+        with self._lock:
+            if target == "deployment":
+                return copy.deepcopy(self._deployment)
+            return copy.deepcopy(self._cache.get(target, {}))
+
+    def _apply(self, target, msg):
+        status = msg.get("status", "full")
+        changed = None
+        with self._lock:
+            current = self._deployment if target == "deployment" else self._cache.get(target, {})
+
+            if status == "unchanged":
+                data = current
+                changed = []
+            elif status == "delta":
+                delta = msg.get("delta", {})
+                data = {**current, **delta}
+                for key in msg.get("removed", ()):
+                    data.pop(key, None)
+                changed = list(delta) + list(msg.get("removed", ()))
+            else:
+                data = msg.get("data", {})
+
+            if target == "deployment":
+                if data.get("certs") != self._deployment.get("certs"):
+                    RSAKeyCache.invalidate(self._dep_id)
+                self._deployment = data
+            elif target != "vault":
+                self._cache[target] = data
+
+            if msg.get("version") is not None and target != "vault":
+                self._versions[target] = msg["version"]
+            else:
+                self._versions.pop(target, None)
+            self._stale.discard(target)
+            self.stats[status] = self.stats.get(status, 0) + 1
+
+        if target == "deployment" and changed != []:
+            EventBus.emit("vault.deployment.changed", dep_id=self._dep_id, keys=changed)
+        return self._cached(target) if target != "vault" else data
 
     def read_deployment(self):
         with self._lock:
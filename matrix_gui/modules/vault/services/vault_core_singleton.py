@@ -5,7 +5,10 @@ from pathlib import Path
 from copy import deepcopy
 from matrix_gui.core.event_bus import EventBus
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from matrix_gui.core.utils.rsa_key_cache import RSAKeyCache
 from matrix_gui.modules.vault.vault_stores.phoenix_vault_core import PhoenixVaultCore as StoreCore
+from matrix_gui.modules.vault.crypto.vault_sections import LazyVault
+from matrix_gui.modules.vault.services.vault_snapshot import freeze, thaw, EMPTY
 
 class VaultCoreSingleton:
     _instance = None
@@ -30,8 +33,22 @@ class VaultCoreSingleton:
         try:
             self.password = password
             self.vault_path = Path(vault_path)
-            self.data = deepcopy(vault_data)
-            self.last_good = deepcopy(self.data)
+
+            # sections of an opened vault stay encrypted until first touched
+            if isinstance(vault_data, LazyVault):
+                self.data = vault_data
+            else:
+                self.data = LazyVault(data=deepcopy(vault_data))
+
+            # last committed value per section as a frozen snapshot, taken as each
+            # one is decrypted; reads share these instead of copying the vault
+            self.last_good = {k: freeze(v) for k, v in self.data.loaded().items()}
+            self.data.on_unseal = lambda key, value: self.last_good.setdefault(key, freeze(value))
+
+            self._views = {}      # section → frozen view of uncommitted store edits
+            self._dirty = set()   # sections edited through a store since their last freeze
+            self._generations = {}
+            self.generation = 0   # bumped on every successful patch()
 
             # DOMAIN STORE CORE
             self.store_core = StoreCore(self)
@@ -46,19 +63,68 @@ class VaultCoreSingleton:
         return self.store_core.get_store(name)
 
     def read(self, safe=True):
-        return deepcopy(self.data) if safe else self.data
+        """
+        Return the vault.
+
+        Args:
+            safe (bool): True → a new top-level dict of frozen section snapshots
+                (no copying; thaw() a section to edit it). False → the live vault.
+        """
+        if not safe:
+            return self.data
+        with self._lock:
+            return {key: self.snapshot(key) for key in self.data}
 
     def get_section(self, key):
         """
-        Always return the live vault section.
+        Always return the live vault section, decrypting it on first access.
         Any edits to the returned dict are edits to the vault itself:** the REAL DEAL**.
         """
         return self.data.setdefault(key, {})
 
     def snapshot(self, key):
-        """Return a deep copy of the vault section for read-only use."""
-        from copy import deepcopy
-        return deepcopy(self.data.get(key, {}))
+        """
+        Return a read-only snapshot of a vault section in O(1).
+
+        The snapshot is the section as of its last patch(), plus any edits made
+        through store mutators since (they call touch()). Unchanged subtrees are
+        shared between generations, so holding a snapshot costs nothing extra.
+        """
+        with self._lock:
+            if key not in self._dirty:
+                frozen = self._views.get(key, self.last_good.get(key))
+                if frozen is not None:
+                    return frozen
+            if key not in self.data:
+                return EMPTY
+
+            live = self.data[key]  # decrypts a sealed section, which seeds last_good
+            if key not in self._dirty and key in self.last_good:
+                return self.last_good[key]
+
+            frozen = freeze(live, self._views.get(key, self.last_good.get(key)))
+            self._views[key] = frozen
+            self._dirty.discard(key)
+            return frozen
+
+    def committed(self, key):
+        """
+        Frozen snapshot of a section as of its last patch(), ignoring any
+        uncommitted store edits (unlike snapshot()).
+        """
+        with self._lock:
+            if key not in self.last_good and key in self.data:
+                self.data[key]  # decrypts a sealed section, which seeds last_good
+            return self.last_good.get(key, EMPTY)
+
+    def touch(self, key):
+        """Mark a section as edited in place, so the next snapshot() refreezes it."""
+        with self._lock:
+            self._dirty.add(key)
+
+    def generation_of(self, key) -> int:
+        """Commit counter of one section (0 until its first patch())."""
+        return self._generations.get(key, 0)
 
     def listen(self, event_name: str):
         """Register a vault event to emit when data changes."""
@@ -78,15 +144,34 @@ class VaultCoreSingleton:
                 print(f"[VAULT][PROTECT] Refusing to remove section {key}.")
                 return False
 
-            self.data[key] = deepcopy(value)
+            if self.data.is_sealed(key):
+                self.data[key]  # decrypt first so rollback and key rotation see the old value
+            previous = self.last_good.get(key)
 
-            raw = json.dumps(self.data)
-            if len(raw) < 200:
+            # stores hand back the live section itself; anything else (a caller's
+            # dict, a snapshot) becomes our own mutable copy
+            if value is not self.data.get(key):
+                self.data[key] = thaw(value)
+
+            frozen = freeze(self.data[key], previous)
+
+            if self._looks_truncated():
                 print("[VAULT][PROTECT] Refusing to shrink vault unnaturally.")
-                self.data = deepcopy(self.last_good)
+                if previous is None:
+                    self.data.pop(key, None)
+                else:
+                    self.data[key] = thaw(previous)
+                self._views.pop(key, None)
                 return False
 
-            self.last_good = deepcopy(self.data)
+            if key == "deployments":
+                self._invalidate_rotated_keys(previous or {}, frozen)
+
+            self.last_good[key] = frozen
+            self._views.pop(key, None)
+            self._dirty.discard(key)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.generation += 1
 
             EventBus.emit("vault.update",
                           data=self.data,
@@ -97,12 +182,31 @@ class VaultCoreSingleton:
 
             return True
 
+    def _looks_truncated(self, floor=200) -> bool:
+        """True if the whole vault would serialize to fewer than `floor` bytes."""
+        size = self.data.sealed_size()
+        for section in self.data.loaded().values():
+            if size >= floor:
+                return False
+            size += len(json.dumps(section))
+        return size < floor
+
+    @staticmethod
+    def _invalidate_rotated_keys(old_deps, new_deps):
+        """Drop cached RSA keys of every deployment whose certs block changed."""
+        for dep_id in set(old_deps) | set(new_deps):
+            old_certs = (old_deps.get(dep_id) or {}).get("certs")
+            new_certs = (new_deps.get(dep_id) or {}).get("certs")
+            if old_certs is not new_certs and old_certs != new_certs:
+                RSAKeyCache.invalidate(dep_id)
+
     def batch(self, *stores):
         """
         Execute multiple store commits atomically.
         If ANY fail validation, NO changes are persisted.
         """
-        snapshots = {s.section_key: s.get_data() for s in stores}
+        # committed snapshots, not the live sections the stores are editing
+        snapshots = {s.section_key: self.last_good[s.section_key] for s in stores if s.section_key in self.last_good}
 
         # Validate everything first
         for store in stores:
@@ -0,0 +1,266 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import os
+import json
+import threading
+import time
+from matrix_gui.modules.vault.crypto.vault_handler import (
+    sanitize_vault,
+    derive_vault_kek,
+    write_vault_bundle,
+)
+from matrix_gui.modules.vault.crypto.vault_sections import VaultContainer, LazyVault
+
+
+class VaultPersister:
+    """
+    Write-behind persistence for the unlocked vault.
+
+    submit() is called on the GUI thread for every vault.update: it takes a
+    serialized snapshot of each decrypted section and returns. A worker
+    thread waits until patches stop arriving for `debounce` seconds (never
+    longer than `max_delay` after the first unsaved change), then writes
+    only the newest snapshot. A batch() of several store commits therefore
+    costs one write instead of one per commit.
+
+    Writes are sectioned: only sections whose JSON changed are re-encrypted;
+    sections that were never decrypted, or did not change, keep their
+    existing ciphertext. A LazyVault brings its own open container; plain
+    dicts get one per (password, path), so the PBKDF2 key-encryption key is
+    derived once for the rest of the session.
+
+    on_saved(path) / on_error(path, error) are called on the worker thread;
+    callers that touch Qt must marshal them to the GUI thread.
+    """
+    _instance = None
+
+    def __init__(self, debounce=0.25, max_delay=2.0, on_saved=None, on_error=None):
+        """
+        Args:
+            debounce (float): Quiet period that ends a burst of patches.
+            max_delay (float): Upper bound between the first unsaved change and its write.
+            on_saved (callable, optional): on_saved(vault_path) after each write.
+            on_error (callable, optional): on_error(vault_path, exc) after a failed write.
+        """
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.on_saved = on_saved
+        self.on_error = on_error
+
+        self._cond = threading.Condition()
+        self._pending = {}        # path → job; newest section snapshots win
+        self._first_dirty = None  # time of the oldest unsaved change
+        self._last_submit = 0.0
+        self._seq = 0             # snapshots submitted
+        self._written_seq = 0     # newest snapshot on disk (or failed)
+        self._writing = False
+        self._flush_requested = False
+        self._stopped = False
+        self._containers = {}     # (password, path) → VaultContainer for plain-dict submits
+        self._stale = set()       # paths whose last write failed
+
+        self.stats = {
+            "submitted": 0,
+            "writes": 0,
+            "coalesced": 0,
+            "sections_sealed": 0,
+            "unchanged": 0,
+            "failures": 0,
+            "last_write_ts": None,
+            "last_write_ms": None,
+            "kdf_ms": None,
+            "last_error": None,
+        }
+
+        self._thread = threading.Thread(target=self._run, name="vault_persister", daemon=True)
+        self._thread.start()
+
+    # -----------------------------
+    @classmethod
+    def start(cls, **kwargs):
+        """Create (or return) the process-wide persister."""
+        if cls._instance is None:
+            cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @classmethod
+    def get(cls):
+        return cls._instance
+
+    @classmethod
+    def flush_active(cls, timeout=10.0) -> bool:
+        """Flush the process-wide persister if one is running."""
+        return cls._instance.flush(timeout) if cls._instance else True
+
+    # -----------------------------
+    def submit(self, data: dict, password: str, vault_path: str):
+        """
+        Queue the current vault contents for a write-behind save.
+
+        Serializes on the caller's thread so the worker never reads a dict the
+        GUI is still mutating. A LazyVault contributes only its decrypted
+        sections (plus any it deleted); a plain dict is the whole vault.
+        """
+        if isinstance(data, LazyVault):
+            container, sections = data.container, data.loaded()
+            removed, complete = data.take_removed(), False
+        else:
+            container, sections = None, dict(data)
+            removed, complete = set(), True
+
+        sanitize_vault(sections)
+        blobs = {
+            name: json.dumps(value, ensure_ascii=False).encode("utf-8")
+            for name, value in sections.items()
+        }
+
+        with self._cond:
+            job = self._pending.get(vault_path)
+            if job is None:
+                job = self._pending[vault_path] = {"sections": {}, "removed": set(), "complete": False}
+            else:
+                self.stats["coalesced"] += 1
+            job["sections"].update(blobs)
+            job["removed"] = (job["removed"] - blobs.keys()) | removed
+            job["complete"] = job["complete"] or complete
+            job["container"] = container
+            job["password"] = password
+
+            now = time.time()
+            self._first_dirty = self._first_dirty or now
+            self._last_submit = now
+            self._seq += 1
+            self.stats["submitted"] += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout=10.0) -> bool:
+        """
+        Write any pending snapshot now and wait for it to reach disk.
+
+        Returns:
+            bool: False if the write did not finish within timeout.
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            target = self._seq
+            if self._written_seq < target:
+                self._flush_requested = True
+                self._cond.notify_all()
+            while self._written_seq < target:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=10.0) -> bool:
+        """Flush and stop the worker (application exit)."""
+        ok = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        if VaultPersister._instance is self:
+            VaultPersister._instance = None
+        return ok
+
+    def durability(self) -> dict:
+        """
+        Snapshot of persistence health for status displays.
+
+        Returns:
+            dict: stats plus 'dirty' (unsaved changes pending), 'lag' (age in
+                  seconds of the oldest unsaved change) and 'writing'.
+        """
+        with self._cond:
+            lag = time.time() - self._first_dirty if self._first_dirty else 0.0
+            return {
+                **self.stats,
+                "dirty": self._written_seq < self._seq,
+                "lag": round(lag, 3),
+                "writing": self._writing,
+            }
+
+    def forget_keys(self):
+        """Drop cached containers and their keys (password change, vault locked)."""
+        with self._cond:
+            self._containers.clear()
+
+    # -----------------------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if not self._pending and self._stopped:
+                    return
+
+                # debounce: wait for a quiet period, bounded by max_delay
+                while not self._flush_requested and not self._stopped:
+                    now = time.time()
+                    quiet_at = self._last_submit + self.debounce
+                    latest = self._first_dirty + self.max_delay
+                    wake = min(quiet_at, latest)
+                    if now >= wake:
+                        break
+                    self._cond.wait(wake - now)
+
+                jobs, self._pending = self._pending, {}
+                seq = self._seq
+                self._first_dirty = None
+                self._flush_requested = False
+                self._writing = True
+
+            for path, job in jobs.items():
+                self._write(path, job)
+
+            with self._cond:
+                self._writing = False
+                self._written_seq = seq
+                self._cond.notify_all()
+
+    def _container(self, password, path):
+        with self._cond:
+            container = self._containers.get((password, path))
+        if container is None:
+            started = time.time()
+            container = VaultContainer(derive_vault_kek(password))
+            self.stats["kdf_ms"] = round((time.time() - started) * 1000, 1)
+            with self._cond:
+                self._containers[(password, path)] = container
+        return container
+
+    def _write(self, path, job):
+        started = time.time()
+        try:
+            container = job["container"] or self._container(job["password"], path)
+            sections, removed = job["sections"], job["removed"]
+
+            dropped = 0
+            if job["complete"]:
+                removed = removed | (set(container.names()) - sections.keys())
+            for name in removed:
+                dropped += container.drop(name)
+
+            sealed = sum(container.seal(name, blob) for name, blob in sections.items() if name not in removed)
+            self.stats["sections_sealed"] += sealed
+
+            if sealed or dropped or path in self._stale or not os.path.exists(path):
+                write_vault_bundle(container.to_bundle(), path)
+                self._stale.discard(path)
+                self.stats["writes"] += 1
+                self.stats["last_write_ts"] = time.time()
+                self.stats["last_write_ms"] = round((time.time() - started) * 1000, 1)
+            else:
+                self.stats["unchanged"] += 1
+
+            if self.on_saved:
+                self.on_saved(path)
+
+        except Exception as e:
+            # the container may already hold the new ciphertext; force the next write out
+            self._stale.add(path)
+            self.stats["failures"] += 1
+            self.stats["last_error"] = str(e)
+            print(f"[VAULT][PERSIST] ❌ Write-behind save failed: {e}")
+            if self.on_error:
+                self.on_error(path, e)
@@ -0,0 +1,157 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+import secrets
+from collections import OrderedDict
+from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
+from matrix_gui.modules.vault.services.vault_snapshot import EMPTY
+
+_MISSING = object()
+
+
+class VaultQueryResponder:
+    """
+    Cockpit side of the versioned vault.query protocol.
+
+    Every section a session has asked for gets a version tag
+    ("<epoch>.<n>"), minted whenever its frozen snapshot changes identity.
+    Recent snapshots are kept per section so a query can be answered
+    against the version the session already holds:
+
+        request   {"type": "vault.query", "dep_id", "target", "version"?}
+        response  {"type": "vault.response", "dep_id", "target", "version",
+                   "status": "unchanged"}
+                  {..., "status": "delta", "base", "delta": {key: value}, "removed": [key]}
+                  {..., "status": "full", "data"}
+
+    Deltas are sent for target "deployment" only: the changed top-level keys
+    of deployments[dep_id], found by identity against the base snapshot
+    (freeze() shares unchanged subtrees, so this is O(keys)). A query
+    without a version always gets "full", so older session code keeps working.
+
+    After each commit, changes() reports which queried sections moved on, for
+    the cockpit to push to sessions as "vault.changed" notifications.
+    """
+    history_depth = 8
+
+    def __init__(self):
+        self._vcs = None
+        self._epoch = None
+        self._counter = 0
+        self._history = {}  # section → OrderedDict(version → snapshot), oldest first
+        self.stats = {"full": 0, "delta": 0, "unchanged": 0}
+
+    # -----------------------------
+    def _bind(self):
+        vcs = VaultCoreSingleton.get()
+        if vcs is not self._vcs:
+            # a reopened vault starts a new epoch; versions from the old one never match
+            self._vcs, self._epoch, self._history = vcs, secrets.token_hex(4), {}
+        return vcs
+
+    def version(self, section):
+        """
+        Current version of a section.
+
+        Returns:
+            tuple: (version, snapshot).
+        """
+        snap = self._bind().snapshot(section)
+        history = self._history.setdefault(section, OrderedDict())
+        if history:
+            latest = next(reversed(history))
+            if history[latest] is snap:
+                return latest, snap
+
+        self._counter += 1
+        version = f"{self._epoch}.{self._counter}"
+        history[version] = snap
+        while len(history) > self.history_depth:
+            history.popitem(last=False)
+        return version, snap
+
+    # -----------------------------
+    def answer(self, msg: dict) -> dict:
+        """
+        Build the vault.response for one vault.query.
+
+        Args:
+            msg (dict): The query from the session process.
+
+        Returns:
+            dict: The response to send back down the pipe.
+        """
+        dep_id = msg.get("dep_id")
+        target = msg.get("target", "deployment")
+        known = msg.get("version")
+        resp = {"type": "vault.response", "dep_id": dep_id, "target": target}
+
+        vcs = self._bind()
+        if target == "vault":
+            # whole-vault reads are rare and never cached by sessions
+            self.stats["full"] += 1
+            resp.update(status="full", data=vcs.read())
+            return resp
+
+        section = "deployments" if target == "deployment" else target
+        if section not in vcs.data:
+            print(f"[VAULT][WARN] Unknown target for vault.query: {target}")
+            self.stats["full"] += 1
+            resp.update(status="full", data={})
+            return resp
+
+        version, snap = self.version(section)
+        data = (snap.get(dep_id) or EMPTY) if target == "deployment" else snap
+        resp["version"] = version
+
+        if known == version:
+            self.stats["unchanged"] += 1
+            resp["status"] = "unchanged"
+            return resp
+
+        base = self._history.get(section, {}).get(known) if known else None
+        if base is not None and target == "deployment":
+            old = base.get(dep_id) or EMPTY
+            if old is data:
+                self.stats["unchanged"] += 1
+                resp["status"] = "unchanged"
+                return resp
+            if isinstance(old, dict) and isinstance(data, dict):
+                self.stats["delta"] += 1
+                resp.update(
+                    status="delta",
+                    base=known,
+                    delta={k: v for k, v in data.items() if dict.get(old, k, _MISSING) is not v},
+                    removed=[k for k in old if k not in data],
+                )
+                return resp
+
+        self.stats["full"] += 1
+        resp.update(status="full", data=data)
+        return resp
+
+    def changes(self) -> list:
+        """
+        Sections sessions have queried whose snapshot changed since they were versioned.
+
+        Returns:
+            list: "vault.changed" notifications, one per changed section. Those
+                  for 'deployments' carry the ids of the deployments that changed.
+        """
+        try:
+            vcs = self._bind()
+        except RuntimeError:
+            return []
+
+        notices = []
+        for section, history in list(self._history.items()):
+            latest = history[next(reversed(history))]
+            if vcs.snapshot(section) is latest:
+                continue
+            version, snap = self.version(section)
+            notice = {"type": "vault.changed", "section": section, "version": version}
+            if section == "deployments":
+                notice["dep_ids"] = [
+                    dep_id for dep_id in set(latest) | set(snap)
+                    if dict.get(latest, dep_id) is not dict.get(snap, dep_id)
+                ]
+            notices.append(notice)
+        return notices
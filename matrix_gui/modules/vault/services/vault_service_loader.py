@@ -1,7 +1,10 @@
 from matrix_gui.core.event_bus import EventBus
 from matrix_gui.modules.vault.crypto.vault_handler import save_vault_singlefile
+from matrix_gui.modules.vault.services.vault_persister import VaultPersister
 from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtCore import QObject, pyqtSignal
 import threading
+import atexit
 
 def run_with_timeout(func, timeout, *args, **kwargs):
     """
@@ -62,6 +65,33 @@ def handle_vault_update(event_data):
     except Exception as e:
         print(f"[VAULT ERROR] Failed to save vault: {e}")
 
+class _SaveNotifier(QObject):
+    """Carries persister results from the worker thread to the GUI thread."""
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+_notifier = None  # created on the GUI thread in initialize()
+
+
+def _on_vault_saved(path):
+    print(f"[VAULT] saved → {path}")
+    EventBus.emit("vault.saved", vault_path=path)
+
+def _on_vault_save_failed(path, error):
+    try:
+        QMessageBox.critical(
+            None,
+            "Vault Save Failed",
+            f"The vault could not be saved.\n\n"
+            f"Path:\n{path}\n\n"
+            f"Error:\n{error}\n\n"
+            f"Your previous vault backup is still safe."
+        )
+    except Exception as popup_err:
+        print(f"[VAULT][WARN] Could not show popup: {popup_err}")
+
+    EventBus.emit("vault.save_error", error=error)
+
 def _on_vault_update(**kw):
     try:
         path = kw.get("vault_path")
@@ -73,43 +103,35 @@ def _on_vault_update(**kw):
             EventBus.emit("vault.save_error", error="bad args")
             return
 
-        print(f"[VAULT] 💾 Attempting vault save → {path}")
-
-        # ---- TIMEOUT CALL HERE ----
-        _, error = run_with_timeout(
-            save_vault_singlefile,
-            timeout=5,
-            data=data,
-            password=password,
-            data_path=path
-        )
-
-        if error:
-            print(f"[VAULT][ERROR] SAVE TIMEOUT: {error}")
-
-            try:
-                QMessageBox.critical(
-                    None,
-                    "Vault Save Failed",
-                    f"The vault could not be saved due to timeout.\n\n"
-                    f"Path:\n{path}\n\n"
-                    f"Your previous vault backup is still safe."
-                )
-            except Exception as popup_err:
-                print(f"[VAULT][WARN] Could not show popup: {popup_err}")
-
-            EventBus.emit("vault.save_error", error=str(error))
-            return
-
-        print(f"[VAULT] saved → {path}")
-        EventBus.emit("vault.saved", vault_path=path)
+        # write-behind: snapshot now, encrypt + write on the persister thread
+        VaultPersister.get().submit(data, password, path)
 
     except Exception as e:
         print("[VAULT][ERROR] save failed:", e)
         EventBus.emit("vault.save_error", error=str(e))
 
+def _flush_vault(**_):
+    if not VaultPersister.flush_active():
+        print("[VAULT][WARN] Pending vault write did not finish in time.")
+
+def _close_persister():
+    persister = VaultPersister.get()
+    if persister:
+        persister.close()
+
 def initialize():
+    global _notifier
     EventBus.on("vault.unlocked", lambda **kwargs: setattr(EventBus, "_encryption_service", VaultEncryptionService(kwargs["vault_data"], kwargs["password"])))
     EventBus.on("service.request.encryption", provide_encryption_service)
+    _notifier = _SaveNotifier()
+    _notifier.saved.connect(_on_vault_saved)
+    _notifier.failed.connect(_on_vault_save_failed)
+    VaultPersister.start(
+        on_saved=_notifier.saved.emit,
+        on_error=lambda path, e: _notifier.failed.emit(path, str(e)),
+    )
+    atexit.register(_close_persister)
+
     EventBus.on("vault.update", _on_vault_update)
+    EventBus.on("vault.closed", _flush_vault)
     print("[VAULT] Service loader initialized.")
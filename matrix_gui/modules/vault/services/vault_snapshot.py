@@ -0,0 +1,107 @@
+# Authored by Daniel F MacDonald and ChatGPT-5 aka The Generals
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for committed vault snapshots.
+
+    Still a dict (isinstance checks, json.dumps, Qt item data all work), but
+    every mutator raises. Pickling and deepcopy() hand back plain, mutable
+    dicts, so a snapshot can be sent to a session process or thawed for editing.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *_, **__):
+        raise TypeError("vault snapshots are read-only — edit get_section() or a thaw()ed copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = update = _readonly
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self._readonly()
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only list counterpart of FrozenDict."""
+    __slots__ = ()
+
+    def _readonly(self, *_, **__):
+        raise TypeError("vault snapshots are read-only — edit get_section() or a thaw()ed copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+EMPTY = FrozenDict()
+
+
+def freeze(value, previous=None):
+    """
+    Build a read-only copy of JSON-like data, sharing structure with `previous`.
+
+    Every subtree that is equal to the matching subtree of `previous` (an
+    earlier snapshot of the same value) is reused as is, so committing a
+    change allocates only the containers on the changed path, and an
+    unchanged subtree keeps its identity across generations (`old is new`).
+
+    Args:
+        value: Live dict/list/scalar data.
+        previous: The last snapshot of the same value, if any.
+
+    Returns:
+        FrozenDict | FrozenList | scalar: The snapshot.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+
+    if isinstance(value, dict):
+        prev = previous if isinstance(previous, FrozenDict) else None
+        items = {
+            k: freeze(v, dict.get(prev, k) if prev is not None else None)
+            for k, v in value.items()
+        }
+        if prev is not None and len(prev) == len(items) and all(
+            k in prev and dict.__getitem__(prev, k) is v for k, v in items.items()
+        ):
+            return prev
+        return FrozenDict(items)
+
+    if isinstance(value, list):
+        prev = previous if isinstance(previous, FrozenList) and len(previous) == len(value) else None
+        items = [freeze(v, prev[i] if prev is not None else None) for i, v in enumerate(value)]
+        if prev is not None and all(a is b for a, b in zip(items, prev)):
+            return prev
+        return FrozenList(items)
+
+    if isinstance(value, tuple):
+        return tuple(freeze(v) for v in value)
+
+    # scalars: hand back the previous object when equal so parents can compare by identity
+    if previous is not None and type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+def thaw(value):
+    """Return a plain, mutable deep copy of snapshot (or live) JSON-like data."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(v) for v in value)
+    return value
@@ -1,6 +1,7 @@
 import os
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox
 from matrix_gui.modules.vault.crypto.vault_handler import load_vault_singlefile, save_vault_singlefile
+from matrix_gui.modules.vault.services.vault_persister import VaultPersister
 
 class VaultPasswordChangeDialog(QDialog):
     def __init__(self, vault_path, parent=None):
@@ -56,7 +57,8 @@ class VaultPasswordChangeDialog(QDialog):
             return
 
         try:
-            # 1. Decrypt with old password
+            # 1. Decrypt with old password (after any queued write-behind save lands)
+            VaultPersister.flush_active()
             vault_data = load_vault_singlefile(old_pw, self.vault_path)
 
             # 2. Re-encrypt with new password (atomic save)
@@ -4,7 +4,7 @@ from matrix_gui.util.resolve_matrixswarm_base import resolve_matrixswarm_base
 from matrix_gui.core.event_bus import EventBus
 from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
 from matrix_gui.modules.vault.ui.vault_password_change_dialog import VaultPasswordChangeDialog
-from matrix_gui.modules.vault.crypto.vault_handler import load_vault_singlefile
+from matrix_gui.modules.vault.crypto.vault_handler import open_vault
 
 
 class VaultPasswordDialog(QDialog):
@@ -96,7 +96,7 @@ class VaultPasswordDialog(QDialog):
         try:
 
             try:
-                vault_data = load_vault_singlefile(password, self.vault_file_path)
+                vault_data = open_vault(password, self.vault_file_path)
             except Exception as e:
                 QMessageBox.critical(self, "Incorrect Password","The password you entered is not correct.\nPlease try again.")
                 self.password_input.clear()
@@ -168,7 +168,7 @@ class VaultPasswordDialog(QDialog):
             # If you want: automatically unlock the new vault after creation
             try:
 
-                vault_data = load_vault_singlefile(self.vault_password, self.vault_file_path)
+                vault_data = open_vault(self.vault_password, self.vault_file_path)
 
                 VaultCoreSingleton.initialize(
                     vault_data=vault_data,
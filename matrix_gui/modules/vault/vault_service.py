@@ -1,6 +1,8 @@
 from matrix_gui.core.event_bus import EventBus
 from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
+from matrix_gui.modules.vault.services.vault_persister import VaultPersister
 from matrix_gui.modules.vault.crypto.vault_handler import (
+    open_vault,
     load_vault_singlefile,
     save_vault_singlefile,
 )
@@ -11,11 +13,12 @@ class VaultService:
 
     @staticmethod
     def load_vault(path: str, password: str):
-        """Return dict or raise Exception."""
-        return load_vault_singlefile(password, path)
+        """Return the vault (sections decrypted on first access), False or raise Exception."""
+        return open_vault(password, path)
 
     @staticmethod
     def save_vault(path: str, data: dict, password: str):
+        VaultPersister.flush_active()  # a queued write-behind save must not land on top of this one
         save_vault_singlefile(data, password, path)
 
     @staticmethod
@@ -37,6 +40,7 @@ class VaultService:
     @staticmethod
     def change_password(path: str, old_pw: str, new_pw: str):
         """Load vault with old password, re-save with new password."""
+        VaultPersister.flush_active()
         data = load_vault_singlefile(old_pw, path)
         save_vault_singlefile(data, new_pw, path)
         return data
@@ -7,11 +7,7 @@ class ConnectionStore(VaultStore):
 
     def allow_delete(self, conn_id):
         # Prevent deletion if any deployment still references this connection
-        deployments = self.root.get_section("deployments") or {}
-        for dep_id, meta in deployments.items():
-            if conn_id in str(meta):  # simplified reference check
-                return False
-        return True
+        return not self.other("deployments").references("connection", conn_id)
 
     def validate_key(self, conn_id, cfg):
         return (
@@ -22,11 +18,7 @@ class ConnectionStore(VaultStore):
         )
 
     def allow_delete_relations(self, conn_id):
-        deployments = self.other("deployments").get_data()
-        for dep_id, meta in deployments.items():
-            if conn_id in str(meta):
-                return False
-        return True
+        return not self.other("deployments").references("connection", conn_id)
 
     def validate_store(self):
         return True
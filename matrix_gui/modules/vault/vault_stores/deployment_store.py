@@ -1,10 +1,12 @@
 # Authored by Daniel F MacDonald and ChatGPT-5.1 aka The Generals
 from copy import deepcopy
 from .vault_store_base import VaultStore
+from .reference_index import ReferenceIndex, extract_refs
 
 class DeploymentStore(VaultStore):
     def __init__(self, root_vault):
         super().__init__(root_vault, "deployments")
+        self._refs = ReferenceIndex()
 
     def allow_delete(self, dep_id):
         # Never delete the core Matrix deployment
@@ -28,11 +30,36 @@ class DeploymentStore(VaultStore):
     def get_dep(self, dep_id, default=None):
         """
         Safe lookup for a deployment entry.
-        Returns a deep copy of deployments[dep_id] or a default ({} by default).
+        Returns a read-only snapshot of deployments[dep_id] or a default ({} by default).
         """
-        data = self.get_data() or {}
-        dep = data.get(dep_id, default if default is not None else {})
-        return deepcopy(dep)
+        return self.root.snapshot(self.section_key).get(dep_id, default if default is not None else {})
+
+    # -------------------------------------------------------------
+    # REFERENCE INDEX
+    # -------------------------------------------------------------
+    def ref_index(self):
+        """
+        The reference index, synced to the committed deployments (O(changes)).
+
+        Uses committed(), not snapshot(): after set_value()/delete() the
+        snapshot already carries the pending edits, and cross_validate()
+        has to see those as changes against the index.
+        """
+        self._refs.sync(self.root.committed(self.section_key))
+        return self._refs
+
+    def references(self, kind, ref_id) -> set:
+        """
+        Deployments that reference an id.
+
+        Args:
+            kind (str): 'connection', 'serial' or 'directive'.
+            ref_id (str): The connection id, registry serial or directive id.
+
+        Returns:
+            set: Deployment ids.
+        """
+        return self.ref_index().users(kind, ref_id)
 
     def validate_store(self):
         """
@@ -60,41 +87,56 @@ class DeploymentStore(VaultStore):
         if len(roots) != 1:
             return False
 
+        # parent → child names, built once instead of rescanning per node
+        children = {}
+        for a in agents:
+            if a.get("parent"):
+                children.setdefault(a["parent"], []).append(a["name"])
+
         # Prevent cycles
         visited = set()
-
-        def walk(node_name):
+        stack = [roots[0]["name"]]
+        while stack:
+            node_name = stack.pop()
             if node_name in visited:
                 return False  # cycle detected
             visited.add(node_name)
+            stack.extend(children.get(node_name, ()))
 
-            children = [a["name"] for a in agents if a.get("parent") == node_name]
-            return all(walk(child) for child in children)
-
-        root = roots[0]["name"]
-        return walk(root)
+        return True
     # -------------------------------------------------------------
     # CROSS-VALIDATION (reference checks)
     # -------------------------------------------------------------
     def cross_validate(self):
         """
-        Check that referenced SSH profiles, ports, or connections exist.
-        Light version — expand as needed.
+        Check that connections newly referenced by a deployment exist.
+
+        Only deployments changed since the last commit are looked at, and only
+        references they did not already hold, so a connection deleted out from
+        under an old deployment never blocks unrelated commits.
         """
         cm_store = self.other("connection_manager")
         if not cm_store:
             return True
 
-        cm = cm_store.get_data() or {}
-        data = self.get_data()
+        index = self.ref_index()
+        pending = self.get_data()
+        changed = [dep_id for dep_id in index.changed(pending) if dep_id in pending]
+        if not changed:
+            return True
 
-        for dep_id, cfg in data.items():
-            text = str(cfg)
-            for conn_id in cm:
-                # If deployment references a missing connection, fail
-                if conn_id in text and conn_id not in cm:
-                    print(f"[DEPLOYMENTS][XVAL] ❌ Deployment '{dep_id}' references missing connection '{conn_id}'")
-                    return False
+        # connection_manager is keyed {proto: {conn_id: cfg}}; older vaults keep ids at the top
+        cm = self.root.snapshot(cm_store.section_key)
+        known = set(cm)
+        for group in cm.values():
+            if isinstance(group, dict):
+                known.update(group)
+
+        for dep_id in changed:
+            added = extract_refs(pending[dep_id])["connection"] - index.refs_of(dep_id)["connection"]
+            for conn_id in added - known:
+                print(f"[DEPLOYMENTS][XVAL] ❌ Deployment '{dep_id}' references missing connection '{conn_id}'")
+                return False
 
         return True
 
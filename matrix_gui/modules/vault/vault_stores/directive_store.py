@@ -13,9 +13,12 @@ class DirectiveStore(VaultStore):
             and "json" in cfg
         )
 
+    def allow_delete_relations(self, uid):
+        # deployments minted from a directive keep pointing at it
+        return not self.other("deployments").references("directive", uid)
+
     def get_dir(self, directive_id, default=None):
-        data = self.get_data() or {}
-        return deepcopy(data.get(directive_id, default if default is not None else {}))
+        return self.root.snapshot(self.section_key).get(directive_id, default if default is not None else {})
 
     def validate_store(self):
         data = self.get_data()
@@ -0,0 +1,131 @@
+# Authored by Daniel F MacDonald and ChatGPT-5.1 aka The Generals
+
+# Reference kinds a deployment can point at:
+#   connection — connection_manager ids (agent connection-tag ids, agent connection serials)
+#   serial     — registry serials (agent serials, connection serials, signing serials)
+#   directive  — directives ids (source_directive)
+REF_KINDS = ("connection", "serial", "directive")
+
+
+def extract_refs(dep) -> dict:
+    """
+    Collect the ids one deployment references.
+
+    Returns:
+        dict: kind → frozenset of ids, for every kind in REF_KINDS.
+    """
+    refs = {kind: set() for kind in REF_KINDS}
+    if not isinstance(dep, dict):
+        return {kind: frozenset() for kind in REF_KINDS}
+
+    if dep.get("source_directive"):
+        refs["directive"].add(dep["source_directive"])
+
+    for agent in dep.get("agents") or []:
+        if not isinstance(agent, dict):
+            continue
+        if agent.get("serial"):
+            refs["serial"].add(agent["serial"])
+
+        conn = agent.get("connection") or {}
+        if isinstance(conn, dict) and conn.get("serial"):
+            refs["connection"].add(conn["serial"])
+            refs["serial"].add(conn["serial"])
+
+        for tag in agent.get("tags") or []:
+            ct = tag.get("connection-tag") if isinstance(tag, dict) else None
+            if isinstance(ct, dict) and ct.get("id"):
+                refs["connection"].add(ct["id"])
+
+    for entry in (dep.get("certs") or {}).values():
+        signing = entry.get("signing") if isinstance(entry, dict) else None
+        if isinstance(signing, dict) and signing.get("serial"):
+            refs["serial"].add(signing["serial"])
+
+    return {kind: frozenset(ids) for kind, ids in refs.items()}
+
+
+class ReferenceIndex:
+    """
+    Reverse index of what the deployments section references.
+
+    Maps (kind, id) → the deployments that reference it, so delete guards
+    and cross-validation are lookups instead of scans over every deployment.
+
+    The index follows the section's frozen snapshots: sync() compares each
+    deployment to the snapshot it was indexed from, by identity first
+    (freeze() keeps unchanged deployments identical across commits), and
+    re-extracts only the ones that changed.
+    """
+
+    def __init__(self):
+        self._source = None   # deployments snapshot the index reflects
+        self._deps = {}       # dep_id → (deployment snapshot, refs)
+        self._users = {}      # (kind, id) → {dep_id, ...}
+
+    # -----------------------------
+    def sync(self, deployments) -> set:
+        """
+        Bring the index up to date with a deployments snapshot.
+
+        Returns:
+            set: Ids of the deployments that were (re)indexed or dropped.
+        """
+        if deployments is self._source:
+            return set()
+
+        changed = self.changed(deployments)
+        for dep_id in changed:
+            self._unindex(dep_id)
+            if dep_id in deployments:
+                self._index(dep_id, deployments[dep_id])
+
+        self._source = deployments
+        return changed
+
+    def changed(self, deployments) -> set:
+        """
+        Ids of deployments that differ from what is indexed (read-only).
+
+        Works on snapshots and on the live section alike: identity settles
+        every untouched snapshot entry, and the rest fall back to a plain
+        dict comparison, which allocates nothing.
+        """
+        if deployments is self._source:
+            return set()
+        changed = set()
+        for dep_id, dep in deployments.items():
+            entry = self._deps.get(dep_id)
+            if entry is None or (entry[0] is not dep and entry[0] != dep):
+                changed.add(dep_id)
+        changed.update(dep_id for dep_id in self._deps if dep_id not in deployments)
+        return changed
+
+    def users(self, kind: str, ref_id) -> set:
+        """Deployments referencing ref_id as the given kind."""
+        return set(self._users.get((kind, ref_id), ()))
+
+    def refs_of(self, dep_id) -> dict:
+        """kind → frozenset of ids referenced by an indexed deployment."""
+        entry = self._deps.get(dep_id)
+        return entry[1] if entry else {kind: frozenset() for kind in REF_KINDS}
+
+    # -----------------------------
+    def _index(self, dep_id, dep):
+        refs = extract_refs(dep)
+        self._deps[dep_id] = (dep, refs)
+        for kind, ids in refs.items():
+            for ref_id in ids:
+                self._users.setdefault((kind, ref_id), set()).add(dep_id)
+
+    def _unindex(self, dep_id):
+        entry = self._deps.pop(dep_id, None)
+        if not entry:
+            return
+        for kind, ids in entry[1].items():
+            for ref_id in ids:
+                users = self._users.get((kind, ref_id))
+                if users is not None:
+                    users.discard(dep_id)
+                    if not users:
+                        del self._users[(kind, ref_id)]
@@ -1,7 +1,7 @@
 # Authored by Daniel F MacDonald and ChatGPT-5.1 aka The Generals
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from matrix_gui.modules.vault.services.vault_snapshot import FrozenDict, FrozenList, thaw
 
 class VaultStore(ABC):
     """
@@ -13,8 +13,12 @@ class VaultStore(ABC):
     def __init__(self, root_vault, section_key: str):
         self.root = root_vault
         self.section_key = section_key
-        # Live reference – no deepcopy
-        self._buffer = self.root.get_section(section_key)
+
+    @property
+    def _buffer(self):
+        # Live reference – no deepcopy. Resolved per use, so a sealed section is
+        # decrypted only when its store is first used and a patch() never strands it.
+        return self.root.get_section(self.section_key)
 
     # -------------------------
     # SAFE READ
@@ -23,13 +27,18 @@ class VaultStore(ABC):
         return self.root.get_section(self.section_key)
 
     def get_value(self, key, default=None):
-        return deepcopy(self._buffer.get(key, default))
+        """Read-only snapshot of one entry (thaw() it to edit)."""
+        return self.root.snapshot(self.section_key).get(key, default)
 
     # -------------------------
     # SAFE WRITE
     # -------------------------
     def set_value(self, key, value):
-        self._buffer[key] = deepcopy(value)
+        """Store value in the live section; the store takes ownership of it."""
+        if isinstance(value, (FrozenDict, FrozenList)):
+            value = thaw(value)
+        self._buffer[key] = value
+        self.root.touch(self.section_key)
 
     def delete(self, key):
         if key not in self._buffer:
@@ -44,6 +53,7 @@ class VaultStore(ABC):
             return False
 
         del self._buffer[key]
+        self.root.touch(self.section_key)
         return True
 
     def allow_delete_relations(self, key):
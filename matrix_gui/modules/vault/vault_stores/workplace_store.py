@@ -37,9 +37,8 @@ class WorkspaceStore(VaultStore):
     # CRUD — *** LIVE DICT ONLY ***
     # -------------------------------------------------------------
     def get_workspace(self, uuid, default=None):
-        """Return deep copy of a single workspace entry."""
-        data = self.root_vault.data.setdefault(self.section_key, {})
-        return deepcopy(data.get(uuid, default if default is not None else {}))
+        """Return a read-only snapshot of a single workspace entry."""
+        return self.root.snapshot(self.section_key).get(uuid, default if default is not None else {})
 
     def update_workspace(self, uuid, patch):
         """Apply patch to live workspace entry and commit."""
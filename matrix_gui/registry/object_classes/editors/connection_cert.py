@@ -7,6 +7,9 @@ from cryptography import x509
 
 class ConnectionCert(BaseEditor):
 
+    # RSA keys minted per instance; DeploymentSession prefetches these in parallel
+    AUTOGEN_KEYS = {4096: 1, 2048: 2}  # CA + server + client
+
     def __init__(self, parent=None, new_conn=False, default_channel_options=None):
         super().__init__(parent, new_conn)
 
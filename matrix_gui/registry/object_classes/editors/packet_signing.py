@@ -5,6 +5,9 @@ from matrix_gui.modules.vault.crypto.cert_factory import _generate_keypair
 class PacketSigning(BaseEditor):
     """Commander Edition – autogen signing editor"""
 
+    # RSA keys minted per instance; DeploymentSession prefetches these in parallel
+    AUTOGEN_KEYS = {2048: 2}  # local + remote pair
+
     def __init__(self, parent=None, new_conn=False, default_channel_options=None):
         super().__init__(parent, new_conn)
 
@@ -5,6 +5,7 @@ from .exceptions.manual_constraint_failure import ManualConstraintFailure
 from matrix_gui.swarm_workspace.cls_lib.constraint.constraint_validator import ConstraintValidator
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
 from matrix_gui.swarm_workspace.cls_lib.constraint.constraint_object import Constraint
+from matrix_gui.modules.vault.crypto.key_pool import KeyPool
 
 from .deploy import Deploy
 from .agent_ir import AgentIR
@@ -187,6 +188,9 @@ class DeploymentSession:
         validator = ConstraintValidator()
         resolved = {}
 
+        # mint every autogen key up front across the process pool; editors then draw from stock
+        self._prefetch_autogen_keys(raw_nodes)
+
         for gid, agent in raw_nodes.items():
             entries = {}
             valid_agent = True
@@ -282,6 +286,17 @@ class DeploymentSession:
 
         return resolved
 
+    def _prefetch_autogen_keys(self, raw_nodes):
+        """Sum the AUTOGEN_KEYS of every autogen editor in the tree and prefetch them."""
+        needs = {}
+        for agent in raw_nodes.values():
+            for c in agent.get("constraints", []):
+                editor_cls = self.resolver.get(c["class"])
+                for size, count in (getattr(editor_cls, "AUTOGEN_KEYS", None) or {}).items():
+                    needs[size] = needs.get(size, 0) + count
+        if needs:
+            KeyPool.prefetch(needs, label="deployment keys")
+
     def _flatten_agents(self, root):
         """Return a flat list of all agents in the deployment tree."""
         flat = []
@@ -6,10 +6,12 @@ import uuid
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QPushButton, QWidget,
-    QGraphicsScene, QGraphicsView, QMessageBox, QSplitter, QDialog
+    QGraphicsScene, QGraphicsView, QMessageBox, QSplitter, QDialog,
+    QProgressDialog, QApplication
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEventLoop
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
+from matrix_gui.core.event_bus import EventBus
 from .workspace_loader import load_workspace
 from .agent_palette import AgentPalette
 from .panels.agent_inspector.agent_inspector import AgentInspector
@@ -30,6 +32,7 @@ class SwarmWorkspaceDialog(QDialog):
             self.agents_root = agents_root
             self.default_parent = None
             self.workspace_id = None
+            self._deploying = False  # a deploy (and its key minting) is running
 
             if workspace_data:
                 self.workspace_id = workspace_data.get("uuid")
@@ -204,12 +207,35 @@ class SwarmWorkspaceDialog(QDialog):
         #QMessageBox.information(self, "Saved", f"Workspace saved under {ws_uuid[:8]}")
 
     def on_deploy_clicked(self):
+        if self._deploying:
+            return
         tree, root_uid = self.controller.export_agent_tree()
 
         resolver = ConstraintResolver()  # or ConstraintResolver if renamed
         session = DeploymentSession(self, tree, root_uid, resolver)
 
-        builder = session.run(self.workspace_id)
+        # key minting reports progress; the dialog keeps painting, but no clicks or
+        # keys are processed until it is done, so the deploy can't be started twice
+        progress = QProgressDialog("Minting deployment keys...", None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+        progress.setMinimumDuration(0)
+
+        def on_keygen_progress(label=None, done=0, total=0, **_):
+            progress.setLabelText(f"Minting {label}... {done}/{total}")
+            progress.setMaximum(total)
+            progress.setValue(done)
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+
+        self._deploying = True
+        self.setEnabled(False)
+        EventBus.on("crypto.keygen.progress", on_keygen_progress)
+        try:
+            builder = session.run(self.workspace_id)
+        finally:
+            EventBus.off("crypto.keygen.progress", on_keygen_progress)
+            progress.close()
+            self.setEnabled(True)
+            self._deploying = False
         if not builder:
             QMessageBox.critical(
                 self,
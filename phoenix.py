@@ -33,6 +33,7 @@ from PyQt6.QtWidgets import QVBoxLayout, QMainWindow,  QWidget, QHBoxLayout, QPu
 from PyQt6.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QColor, QIcon
 from matrix_gui.core.session_window import run_session
+from matrix_gui.core.session_pool import SessionPool
 
 import matrix_gui.config.boot.boot #don't take this out, looks like it's not doing anything but it setups event listeners
 from matrix_gui.core.emit_gui_exception_log import emit_gui_exception_log
@@ -53,7 +54,11 @@ from matrix_gui.util.resolve_matrixswarm_base import resolve_matrixswarm_base
 from matrix_gui.core.panel.home.phoenix_static_panel import PhoenixStaticPanel
 from matrix_gui.config.boot.globals import get_sessions
 from matrix_gui.core.utils.ui_toast import show_toast
+from matrix_gui.core.utils.pipe_reader import PipeReader
+from matrix_gui.core.utils.feed_ring import FeedRing
 from matrix_gui.modules.vault.services.vault_core_singleton import VaultCoreSingleton
+from matrix_gui.modules.vault.services.vault_persister import VaultPersister
+from matrix_gui.modules.vault.services.vault_query_responder import VaultQueryResponder
 
 # Define the debug function
 #Flip DEBUG_VISUAL to True only when you want it inside your GUI console.
@@ -117,11 +122,13 @@ class PhoenixCockpit(QMainWindow):
         self.status_vault = QLabel("Vault: 🔒")
         self.status_deployments = QLabel("Deployments: 0")
         self.status_sessions = QLabel("Sessions: 0")
+        self.status_ipc = QLabel("IPC: idle")
 
         self.status_bar = QStatusBar()
         self.status_bar.addPermanentWidget(self.status_vault)
         self.status_bar.addPermanentWidget(self.status_deployments)
         self.status_bar.addPermanentWidget(self.status_sessions)
+        self.status_bar.addPermanentWidget(self.status_ipc)
         self.setStatusBar(self.status_bar)
 
         # === Legacy Controls (optional override) ===
@@ -217,8 +224,12 @@ class PhoenixCockpit(QMainWindow):
         #self.status_bar.addPermanentWidget(QLabel("WS: Connected"))
 
         self.session_processes = []
+        self.feed_rings = {}  # session conn → FeedRing
+        self._feed_dropped_closed = 0  # drops counted by rings already released
+        self.vault_query = VaultQueryResponder()
 
         EventBus.on("vault.closed", self._destroy_all_sessions)
+        EventBus.on("vault.core.update", self._push_vault_changes)
         #EventBus.on("vault.update", self._on_vault_update)
         EventBus.on("session.open.requested", self.launch_session)
         EventBus.on("vault.unlocked", self._on_vault_unlocked_ui_flip)
@@ -231,16 +242,29 @@ class PhoenixCockpit(QMainWindow):
     def launch_session(self, session_id: str, deployment: dict, vault_data: dict = None):
         try:
             from multiprocessing import Process, Pipe
-            parent_conn, child_conn = Pipe()
-            p = Process(target=run_session, args=(session_id, child_conn))
-            p.start()
+            # a warm pool worker has its imports, QApplication and theme loaded already
+            warm = SessionPool.take()
+            if warm:
+                p, parent_conn = warm
+            else:
+                parent_conn, child_conn = Pipe()
+                p = Process(target=run_session, args=(session_id, child_conn))
+                p.start()
 
             # --- Immediately send the deployment to the child (no handshake waiting) ---
+            # bulk feed events come back through a shared-memory ring, not the pipe
+            try:
+                feed_ring = FeedRing.create()
+            except Exception as e:
+                print(f"[MIRV][WARN] Feed ring unavailable, feed stays on the pipe: {e}")
+                feed_ring = None
+
             parent_conn.send({
                 "type": "init",
                 "session_id": session_id,
                 "deployment": deployment,
-                "vault_data": vault_data
+                "vault_data": vault_data,
+                "feed_ring": feed_ring.describe() if feed_ring else None,
             })
 
             # Wait for child to report its native window id
@@ -254,8 +278,13 @@ class PhoenixCockpit(QMainWindow):
 
             if not win_id:
                 print(f"[MIRV] ❌ Session {session_id} did not report a window id.")
+                if feed_ring:
+                    feed_ring.close()
                 return
 
+            if feed_ring:
+                self.feed_rings[parent_conn] = feed_ring
+
             # Build the embedded container tab
             remote_window = QWindow.fromWinId(win_id)
             remote_window.setFlags(Qt.WindowType.FramelessWindowHint)
@@ -280,6 +309,7 @@ class PhoenixCockpit(QMainWindow):
                 "session_id": session_id,
                 "tab": tab,  # store the widget itself
             })
+            self.pipe_reader.watch(parent_conn)
 
             layout.addWidget(container)
 
@@ -303,42 +333,84 @@ class PhoenixCockpit(QMainWindow):
             emit_gui_exception_log("PhoenixCockpit.launch_session", e)
 
 
+    def _push_vault_changes(self, **_):
+        """Tell every session which vault sections it may hold a stale copy of."""
+        notices = self.vault_query.changes()
+        if not notices:
+            return
+        for sess in list(self.session_processes):
+            for notice in notices:
+                try:
+                    sess["conn"].send(notice)
+                except (BrokenPipeError, OSError):
+                    break  # the reaper cleans it up
+
     def _start_pipe_monitor(self):
-        self.pipe_timer = QTimer(self)
-        self.pipe_timer.timeout.connect(self._poll_pipes)
-        self.pipe_timer.start(200)
+        # session pipes are drained on a reader thread and handed over in batches
+        self.pipe_reader = PipeReader(self._handle_session_msg, self._on_session_pipe_closed, parent=self)
 
-        # periodic cleanup every 10 seconds
+        self.ipc_timer = QTimer(self)
+        self.ipc_timer.timeout.connect(self._update_ipc_status)
+        self.ipc_timer.start(1000)
+
+        # swarm feed rings are drained in batches on their own tick
+        self.feed_timer = QTimer(self)
+        self.feed_timer.timeout.connect(self._drain_feed_rings)
+        self.feed_timer.start(50)
+
+        # pre-start warm session workers (no-op unless MATRIX_SESSION_POOL is set)
+        SessionPool.fill()
+
+        # periodic cleanup every 10 seconds (also recycles idle warm workers)
         self.reaper_timer = QTimer(self)
         self.reaper_timer.timeout.connect(self._reap_dead_sessions)
         self.reaper_timer.start(10000)
 
-    def _poll_pipes(self):
-        try:
-            for sess in list(self.session_processes):
-                proc = sess.get("proc")
-                conn = sess["conn"]
-
-                # --- Check for dead subprocess ---
-                if proc and not proc.is_alive():
-                    print(f"[WATCHDOG] 🧨 Session process {proc.pid} is dead.")
-                    self._cleanup_session(sess, conn)
-                    continue
-
-                # --- Handle inbound messages ---
-                try:
-                    if conn.poll():
-                        msg = conn.recv()
-                        self._handle_session_msg(msg, conn)
-                except (BrokenPipeError, EOFError, OSError):
-                    print(f"[MIRV] 🛑 Session pipe closed for pid={proc.pid if proc else 'unknown'}")
-                    self._cleanup_session(sess, conn)
+    def _on_session_pipe_closed(self, conn):
+        sess = next((s for s in self.session_processes if s["conn"] is conn), None)
+        if not sess:
+            return
+        proc = sess.get("proc")
+        print(f"[MIRV] 🛑 Session pipe closed for pid={proc.pid if proc else 'unknown'}")
+        self._cleanup_session(sess, conn)
 
+    def _drain_feed_rings(self, budget=2000):
+        """Hand every session's queued feed events to the dashboard in one batch."""
+        try:
+            live = {s["conn"] for s in self.session_processes}
+            events = []
+            for conn, ring in list(self.feed_rings.items()):
+                events.extend(ring.drain(limit=max(1, budget - len(events))))
+                if conn not in live:
+                    self._feed_dropped_closed += ring.stats()["dropped"]
+                    ring.close()
+                    del self.feed_rings[conn]
+
+            if events and self.static_panel:
+                self.static_panel.handle_feed_batch(events)
         except Exception as e:
-            emit_gui_exception_log("PhoenixCockpit._poll_pipes", e)
+            emit_gui_exception_log("PhoenixCockpit._drain_feed_rings", e)
+
+    def _update_ipc_status(self):
+        m = self.pipe_reader.metrics()
+        rings = [r.stats() for r in self.feed_rings.values()]
+        dropped = self._feed_dropped_closed + sum(r["dropped"] for r in rings)
+        backlog = sum(r["used"] for r in rings)
+        self.status_ipc.setText(
+            f"IPC: {m['rate']:.0f}/s  q={m['depth']}  peak={m['peak_depth']}  feed drops={dropped}"
+        )
+        self.status_ipc.setToolTip(
+            f"Session pipe messages received: {m['received']}\n"
+            f"Dispatched: {m['dispatched']} in {m['batches']} batches (last {m['last_batch']})\n"
+            f"Queued for the GUI thread: {m['depth']} (peak {m['peak_depth']})\n"
+            f"Feed rings: {len(rings)}, {sum(r['written'] for r in rings)} events written, "
+            f"{backlog} bytes unread, {dropped} dropped ({FeedRing.default_policy})\n"
+            f"Warm session workers: {SessionPool.idle_count()}/{SessionPool.size}"
+        )
 
     def _reap_dead_sessions(self):
         """Periodically nuke orphaned or crashed session processes."""
+        SessionPool.recycle()
         try:
             dead = []
             for sess in list(self.session_processes):
@@ -371,6 +443,8 @@ class PhoenixCockpit(QMainWindow):
                 proc.terminate()
                 proc.join(timeout=1)
             self.session_processes = [s for s in self.session_processes if s["conn"] != conn]
+            if conn is not None:
+                self.pipe_reader.unwatch(conn)
             self._active_sessions.discard(sess.get("session_id"))
             self.status_sessions.setText(f"Sessions: {len(self._active_sessions)}")
             print(f"[MIRV] 🧹 Cleaned up dead session {sess.get('session_id')}")
@@ -408,58 +482,19 @@ class PhoenixCockpit(QMainWindow):
 
             elif mtype == "vault.query":
 
-                dep_id = msg.get("dep_id")
-
-                target = msg.get("target", "deployment")
-
-                if not dep_id:
+                if not msg.get("dep_id"):
                     print("[VAULT][WARN] vault.query missing dep_id")
-
                     return
 
                 try:
-
-                    vcs = VaultCoreSingleton.get()
-                    vault_snapshot = vcs.read()  # full top-level vault data snapshot
-                    # Default: backward-compatible deployment access
-                    if target == "deployment":
-                        dep_store = vcs.get_store("deployments")
-                        data = dep_store.get_dep(dep_id)
-                    # New: full registry map
-                    elif target == "registry":
-                        # some VaultCores expose .data, others use .read() or a namespace map helper
-                        reg_store = vcs.get_store("registry")
-                        if hasattr(reg_store, "get_namespace_map"):
-                            data = reg_store.get_namespace_map()
-                        elif hasattr(reg_store, "data"):
-                            data = reg_store.data
-                        else:
-                            data = vault_snapshot.get("registry", {})
-                    # Allow optional full vault read
-                    elif target == "vault":
-                        data = vault_snapshot
-
-                    # Any other top-level section (workspaces, connection_manager, etc.)
-                    elif target in vault_snapshot:
-                        data = vault_snapshot.get(target, {})
-                    else:
-                        print(f"[VAULT][WARN] Unknown target for vault.query: {target}")
-                        data = {}
-
-                    # Send back to the session process
-                    resp = {
-                        "type": "vault.response",
-                        "dep_id": dep_id,
-                        "target": target,
-                        "data": data,
-                    }
+                    # versioned: sessions that send the version they hold get "unchanged" or a delta
+                    resp = self.vault_query.answer(msg)
                     conn.send(resp)
-                    print(f"[VAULT] 📤 Sent vault.response target='{target}' for {dep_id}")
+                    print(f"[VAULT] 📤 Sent vault.response target='{resp['target']}' "
+                          f"status={resp['status']} for {resp['dep_id']}")
                 except Exception as e:
                     print(f"[VAULT][ERROR] vault.query failed: {e}")
 
-
-
             elif mtype == "vault.update.requested":
 
                 dep_id = msg.get("dep_id")
@@ -635,9 +670,17 @@ class PhoenixCockpit(QMainWindow):
 
             print("[MIRV] Cockpit closing, nuking all session processes...")
 
-            # Stop pipe polling first
-            if hasattr(self, "pipe_timer") and self.pipe_timer.isActive():
-                self.pipe_timer.stop()
+            # Stop pipe reading first
+            if hasattr(self, "pipe_reader"):
+                self.pipe_reader.stop()
+            SessionPool.shutdown()
+            for ring in self.feed_rings.values():
+                ring.close()
+            self.feed_rings.clear()
+
+            # Get every pending vault change on disk before we go
+            if not VaultPersister.flush_active():
+                print("[VAULT][WARN] Pending vault write did not finish before exit.")
 
             for sess in self.session_processes:
                 proc = sess["proc"]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+bench_vault_sign.py
+Per-signature cost of vault_handler.sign_payload() / verify_signature().
+
+Writes a throwaway vault holding a local private key and one trusted server
+pubkey, then times both helpers against a bare RSA baseline:
+
+  legacy  — (password, data_path): decrypt the vault from disk on every call
+  handle  — vault=<unlocked vault>: no decrypt, cached key objects
+  bare    — rsa.sign()/rsa.verify() alone, the floor for one RSA operation
+
+The unlocked handle here is the decrypted vault dict, which is exactly what
+VaultCoreSingleton.read(safe=False) hands the helpers in the cockpit.
+
+Usage examples:
+  python tools/bench_vault_sign.py
+  python tools/bench_vault_sign.py --iterations 200 --key-size 4096
+
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+import rsa as pyrsa
+
+from matrix_gui.modules.vault.crypto.vault_handler import (
+    save_vault_singlefile,
+    load_vault_singlefile,
+    sign_payload,
+    verify_signature,
+)
+
+PASSWORD = "bench-vault-password"
+SENDER = "bench-server"
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark vault_handler sign/verify per-call cost")
+    p.add_argument("--iterations", "-n", type=int, default=50, help="Signatures per mode")
+    p.add_argument("--key-size", "-k", type=int, default=2048, help="RSA modulus size in bits")
+    p.add_argument("--max-overhead", type=float, default=1.0,
+                   help="Max ms per signature the handle path may add over a bare RSA sign")
+    return p.parse_args()
+
+
+def _pkcs1_pair(bits):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=bits)
+    priv = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode()
+    pub = key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.PKCS1
+    ).decode()
+    return priv, pub
+
+
+def _time(n, fn):
+    started = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - started) / n * 1000
+
+
+def main():
+    args = parse_args()
+    priv, pub = _pkcs1_pair(args.key_size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.vault.json")
+        save_vault_singlefile({
+            "local_private_key": priv,
+            "trusted_servers": {SENDER: {"pubkey": pub}},
+        }, PASSWORD, path)
+
+        vault = load_vault_singlefile(PASSWORD, path)  # unlocked once, as at login
+        payload = lambda i: {"handler": "cmd_bench", "seq": i, "content": {"x": "y" * 64}}
+
+        # the sender's signature doubles as the one we verify
+        sigs = [sign_payload(payload(i), vault=vault) for i in range(args.iterations)]
+        if not all(verify_signature(payload(i), s, SENDER, vault=vault) for i, s in enumerate(sigs)):
+            print("[BENCH][VAULT-SIGN] ❌ handle-mode signatures failed to verify")
+            return 1
+
+        bare_priv = pyrsa.PrivateKey.load_pkcs1(priv.encode())
+        bare_pub = pyrsa.PublicKey.load_pkcs1(pub.encode())
+        data = lambda i: json.dumps(payload(i), sort_keys=True).encode()
+
+        results = {
+            "legacy": (
+                _time(args.iterations, lambda i: sign_payload(payload(i), PASSWORD, path)),
+                _time(args.iterations, lambda i: verify_signature(payload(i), sigs[i], SENDER, PASSWORD, path)),
+            ),
+            "handle": (
+                _time(args.iterations, lambda i: sign_payload(payload(i), vault=vault)),
+                _time(args.iterations, lambda i: verify_signature(payload(i), sigs[i], SENDER, vault=vault)),
+            ),
+            "bare": (
+                _time(args.iterations, lambda i: pyrsa.sign(data(i), bare_priv, "SHA-256")),
+                _time(args.iterations, lambda i: pyrsa.verify(data(i), base64.b64decode(sigs[i]), bare_pub)),
+            ),
+        }
+
+    for mode, (sign_ms, verify_ms) in results.items():
+        print(f"[BENCH][VAULT-SIGN] mode={mode} key={args.key_size} n={args.iterations} "
+              f"sign={sign_ms:.2f} ms/op verify={verify_ms:.2f} ms/op")
+
+    legacy, handle, bare = results["legacy"], results["handle"], results["bare"]
+    overhead = handle[0] - bare[0]
+    ok = overhead <= args.max_overhead
+    print(f"[BENCH][VAULT-SIGN] speedup sign={legacy[0] / handle[0]:.1f}x verify={legacy[1] / handle[1]:.1f}x; "
+          f"vault cost removed per call ≈ {legacy[0] - handle[0]:.2f} ms")
+    print(f"[BENCH][VAULT-SIGN] {'PASS' if ok else 'FAIL'} "
+          f"(handle adds {overhead:.2f} ms over one RSA sign, limit {args.max_overhead:.2f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+bench_wss_drain.py
+Throughput benchmark for WSSConnector streaming drain mode.
+
+Starts a local TLS echo server that answers the connector's signed hello with
+a burst of frames, runs a WSSConnector against it, and reports how fast the
+frames arrive as inbound.raw events on the ConnectorBus.
+
+Usage examples:
+  python tools/bench_wss_drain.py --frames 20000
+  python tools/bench_wss_drain.py --frames 2000 --no-streaming
+
+"""
+import argparse
+import asyncio
+import base64
+import contextlib
+import datetime
+import hashlib
+import io
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from websockets.asyncio.server import serve
+
+from matrix_gui.core.connector_bus import ConnectorBus
+from matrix_gui.modules.net.connector.ingress.wss.wss import WSSConnector
+
+UID = "bench-wss"
+SESSION_ID = "bench-session-0000"
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark WSSConnector inbound throughput")
+    p.add_argument("--frames", "-f", type=int, default=20000, help="Frames the echo server pushes after hello")
+    p.add_argument("--size", "-s", type=int, default=256, help="Approximate payload size per frame in bytes")
+    p.add_argument("--port", "-p", type=int, default=0, help="Listen port (0 = pick a free one)")
+    p.add_argument("--no-streaming", action="store_true", help="Benchmark the legacy one-recv-per-tick mode")
+    p.add_argument("--target", type=float, default=1000.0, help="Minimum msgs/s required to pass")
+    return p.parse_args()
+
+
+def _self_signed(cn):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, cn)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode()
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    ).decode()
+    spki = cert.public_key().public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    pin = base64.b64encode(hashlib.sha256(spki).digest()).decode()
+    return cert_pem, key_pem, pin
+
+
+def _build_deployment(port, streaming, server_pin, client_cert, client_key, signing_key):
+    agent = {
+        "universal_id": UID,
+        "connection": {"proto": "wss", "host": "127.0.0.1", "port": port, "streaming": streaming},
+    }
+    deployment = {
+        "agents": [agent],
+        "certs": {
+            UID: {
+                "connection_cert": {
+                    "client_cert": {"cert": client_cert, "key": client_key},
+                    "server_cert": {"spki_pin": server_pin},
+                },
+                "signing": {"remote_privkey": signing_key},
+            }
+        },
+    }
+    return agent, deployment
+
+
+def _start_server(port, frames, size, server_cert, server_key):
+    """Run the burst echo server on its own event loop; returns (thread, bound_port)."""
+    fd, cert_path = tempfile.mkstemp(suffix=".pem")
+    with os.fdopen(fd, "w") as f:
+        f.write(server_cert)
+    fd, key_path = tempfile.mkstemp(suffix=".pem")
+    with os.fdopen(fd, "w") as f:
+        f.write(server_key)
+
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(cert_path, key_path)
+    os.remove(cert_path)
+    os.remove(key_path)
+
+    frame = json.dumps({"handler": "bench", "content": {"pad": "x" * size}})
+    bound = {}
+    ready = threading.Event()
+
+    async def handler(websocket):
+        async for msg in websocket:
+            if json.loads(msg).get("type") == "hello":
+                for _ in range(frames):
+                    await websocket.send(frame)
+
+    async def main():
+        async with serve(handler, "127.0.0.1", port, ssl=ctx, max_size=None) as server:
+            bound["port"] = server.sockets[0].getsockname()[1]
+            ready.set()
+            await asyncio.Future()
+
+    t = threading.Thread(target=lambda: asyncio.run(main()), name="bench_wss_server", daemon=True)
+    t.start()
+    ready.wait(10)
+    return t, bound["port"]
+
+
+def main():
+    args = parse_args()
+    streaming = not args.no_streaming
+
+    server_cert, server_key, server_pin = _self_signed("127.0.0.1")
+    client_cert, client_key, _ = _self_signed(UID)
+    _, signing_key, _ = _self_signed("signing")
+
+    _, port = _start_server(args.port, args.frames, args.size, server_cert, server_key)
+    agent, deployment = _build_deployment(port, streaming, server_pin, client_cert, client_key, signing_key)
+
+    received = {"n": 0, "first": None, "last": None}
+    done = threading.Event()
+
+    def on_raw(**_):
+        now = time.perf_counter()
+        if received["first"] is None:
+            received["first"] = now
+        received["n"] += 1
+        received["last"] = now
+        if received["n"] >= args.frames:
+            done.set()
+
+    ConnectorBus.get(SESSION_ID).on("inbound.raw", on_raw)
+    shared = {"session_id": SESSION_ID, "agent": agent, "deployment": deployment}
+    connector = WSSConnector(shared=shared)
+    worker = threading.Thread(target=connector.run, name="bench_wss_connector", daemon=True)
+
+    # connector/bus logging is per frame; keep it out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        worker.start()
+        done.wait(timeout=max(30.0, args.frames / 100.0))
+        connector.stop()
+        worker.join(timeout=5)
+
+    n = received["n"]
+    elapsed = (received["last"] - received["first"]) if n > 1 else 0.0
+    rate = (n - 1) / elapsed if elapsed > 0 else 0.0
+    mode = "streaming" if streaming else "legacy"
+    print(f"[BENCH][WSS] mode={mode} frames={n}/{args.frames} elapsed={elapsed:.3f}s rate={rate:,.0f} msgs/s")
+    print(f"[BENCH][WSS] last tick drained={shared.get('frames_drained')} total={shared.get('frames_total')}")
+    ok = n >= args.frames and rate >= args.target
+    print(f"[BENCH][WSS] {'PASS' if ok else 'FAIL'} (target ≥ {args.target:,.0f} msgs/s)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())